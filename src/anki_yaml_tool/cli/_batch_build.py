@@ -0,0 +1,856 @@
+"""Implementation of ``batch-build``."""
+
+import fnmatch
+import multiprocessing
+import queue
+import re
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from pathlib import Path
+
+import click
+
+from anki_yaml_tool.core import deck_cache
+from anki_yaml_tool.core.batch import get_deck_name_from_path, load_many
+from anki_yaml_tool.core.builder import AnkiBuilder, ModelConfigComplete
+from anki_yaml_tool.core.config import LoadedDeck, load_deck_file, peek_deck_name
+from anki_yaml_tool.core.connector import AnkiConnectError, AnkiConnector
+from anki_yaml_tool.core.deck_cache import load_deck_file_cached
+from anki_yaml_tool.core.deck_service import (
+    BuildResult,
+    build_deck,
+    get_field_values,
+    push_apkg,
+)
+from anki_yaml_tool.core.exceptions import (
+    ConfigValidationError,
+    DataValidationError,
+    DeckBuildError,
+)
+from anki_yaml_tool.core.logging_config import get_logger
+
+# Get logger for this module
+log = get_logger("cli")
+
+# Status glyphs for the batch-build table. Every glyph occupies exactly two
+# terminal cells (the emoji are double-width), so the 8-cell status column
+# ("   " + glyph + "   ") stays aligned whatever the state.
+STATUS_PENDING = "  "
+STATUS_BUILDING = "🔨"
+STATUS_PUSHING = "📤"
+STATUS_DONE = "✅"
+STATUS_FAILED = "❌"
+
+# Status changes arriving within this many seconds share one table redraw
+STATUS_REDRAW_INTERVAL = 0.1
+
+
+@click.command(name="batch-build")
+@click.option(
+    "--files",
+    "-f",
+    multiple=True,
+    help="Deck files or glob patterns (can be specified multiple times)",
+)
+@click.option(
+    "--input-dir",
+    "-d",
+    type=click.Path(exists=True),
+    help="Directory to scan for deck.yaml files",
+)
+@click.option(
+    "--recursive/--no-recursive",
+    "-r/-R",
+    default=True,
+    help="Recursively scan subdirectories (default: True)",
+)
+@click.option(
+    "--deck-filter",
+    "-df",
+    help="Filter decks by name pattern (supports wildcards: * matches any characters, ? matches single character). Example: --deck-filter 'spanish*'",
+)
+@click.option(
+    "--filter-source",
+    type=click.Choice(["yaml", "path"]),
+    default="yaml",
+    help="Where --deck-filter takes deck names from: 'yaml' honours a deck-name set in the file, 'path' uses only the file path and skips parsing (default: yaml)",
+)
+@click.option(
+    "--pattern",
+    default="deck.yaml",
+    help="Filename pattern to match in directory scan (default: deck.yaml)",
+)
+@click.option(
+    "--output-dir",
+    "-o",
+    type=click.Path(),
+    default=".",
+    help="Output directory for .apkg files",
+)
+@click.option(
+    "--merge",
+    is_flag=True,
+    help="Merge all files into a single deck instead of building separately",
+)
+@click.option(
+    "--deck-name",
+    help="Name for merged deck (only used with --merge)",
+)
+@click.option(
+    "--hierarchical",
+    "-H",
+    is_flag=True,
+    help="Use directory structure for hierarchical deck names (e.g., lang::spanish)",
+)
+@click.option(
+    "--push",
+    "-p",
+    is_flag=True,
+    help="Push built decks to Anki after building",
+)
+@click.option(
+    "--delete-after",
+    is_flag=True,
+    help="Delete .apkg files after successfully pushing to Anki (requires --push)",
+)
+@click.option(
+    "--sync",
+    is_flag=True,
+    help="Sync with AnkiWeb after pushing (requires --push)",
+)
+@click.option(
+    "--skip-existing-media",
+    is_flag=True,
+    help="Do not re-upload media files whose names already exist in Anki (requires --push)",
+)
+@click.option(
+    "--sort/--no-sort",
+    default=True,
+    help="Process decks sorted by path, or in the order they were found (default: sorted)",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=int,
+    default=None,
+    help="Number of parallel workers for concurrent building (default: 4, use 1-8)",
+)
+@click.option(
+    "--build-executor",
+    type=click.Choice(["thread", "process"]),
+    default="thread",
+    help="Build separate decks in worker threads or worker processes (default: thread)",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Cache parsed decks here and reuse them while their files are unchanged (requires orjson)",
+)
+def batch_build(
+    files: tuple[str, ...],
+    input_dir: str | None,
+    recursive: bool,
+    deck_filter: str | None,
+    filter_source: str,
+    pattern: str,
+    output_dir: str,
+    merge: bool,
+    deck_name: str | None,
+    hierarchical: bool,
+    push: bool,
+    delete_after: bool,
+    sync: bool,
+    skip_existing_media: bool,
+    sort: bool,
+    workers: int | None,
+    build_executor: str,
+    cache_dir: str | None,
+) -> None:
+    """Build multiple decks from YAML files.
+
+    Use --files for glob patterns or --input-dir for directory scanning.
+
+    Examples:
+
+        # Build all decks in examples directory using glob
+        anki-yaml-tool batch-build -f "examples/*/deck.yaml"
+
+        # Scan a directory for deck.yaml files
+        anki-yaml-tool batch-build --input-dir ./decks
+
+        # Scan with hierarchical deck names
+        anki-yaml-tool batch-build -d ./decks -H
+
+        # Filter on directory names without parsing every deck
+        anki-yaml-tool batch-build -d ./decks --deck-filter "spanish*" --filter-source path
+
+        # Merge multiple files into one deck
+        anki-yaml-tool batch-build -f vocab1.yaml -f vocab2.yaml --merge --deck-name "All Vocab"
+    """
+    from anki_yaml_tool.core.batch import (
+        expand_file_patterns,
+        scan_directory_for_decks,
+    )
+
+    # Validate that at least one source is specified
+    if not files and not input_dir:
+        click.echo(
+            "Error: Must specify either --files/-f or --input-dir/-d",
+            err=True,
+        )
+        raise click.Abort()
+
+    file_list: list[Path] = []
+    base_dir: Path | None = None
+
+    # Collect files from --files patterns
+    if files:
+        log.info("Batch build started with %d patterns", len(files))
+        try:
+            file_list.extend(expand_file_patterns(files))
+        except Exception as e:
+            click.echo(f"Error expanding file patterns: {e}", err=True)
+            raise click.Abort() from e
+
+    # Collect files from --input-dir scanning
+    if input_dir:
+        input_path = Path(input_dir)
+        base_dir = input_path
+        log.info(
+            "Scanning directory: %s (recursive=%s, pattern=%s)",
+            input_dir,
+            recursive,
+            pattern,
+        )
+        try:
+            dir_files = list(scan_directory_for_decks(input_path, pattern, recursive))
+            file_list.extend(dir_files)
+        except NotADirectoryError as e:
+            click.echo(f"Error: {e}", err=True)
+            raise click.Abort() from e
+
+    if not file_list:
+        click.echo("Error: No files found", err=True)
+        raise click.Abort()
+
+    # Remove duplicates, keeping the first occurrence of each file
+    file_list = list(dict.fromkeys(file_list))
+    if sort:
+        file_list.sort()
+
+    click.echo(f"Found {len(file_list)} deck files to process")
+
+    deck_cache_dir = Path(cache_dir) if cache_dir else None
+    if deck_cache_dir is not None and not deck_cache.ORJSON_AVAILABLE:
+        click.echo(
+            "Warning: --cache-dir needs the 'orjson' package "
+            "(pip install anki-yaml-tool[speedups]); decks will not be cached",
+            err=True,
+        )
+        deck_cache_dir = None
+
+    # Decks already parsed by the filter below, reused by the build so each
+    # file is only loaded once
+    preloaded: dict[Path, LoadedDeck] = {}
+
+    # Apply deck name filter if specified
+    if deck_filter:
+        filtered_list = []
+        # Translate the glob once rather than on every fnmatch call
+        deck_filter_re = re.compile(fnmatch.translate(deck_filter.lower()))
+        # Read just the names when possible; files whose name needs a full
+        # parse are loaded together afterwards. A matched file whose name
+        # was peeked is validated by its build, which reports a bad file
+        # as failed just like a run without a filter.
+        file_deck_names: dict[Path, str | None] = {}
+        to_load: list[Path] = []
+        if filter_source == "yaml":
+            for file_path in file_list:
+                known, file_deck_names[file_path] = peek_deck_name(file_path)
+                if not known:
+                    to_load.append(file_path)
+
+        load_errors: dict[Path, Exception] = {}
+        for file_path, result in zip(
+            to_load, load_many(to_load, deck_cache_dir), strict=True
+        ):
+            if isinstance(result, Exception):
+                load_errors[file_path] = result
+            else:
+                preloaded[file_path] = result
+                file_deck_names[file_path] = result[2]
+
+        for file_path in file_list:
+            if file_path in load_errors:
+                # Skip files that can't be loaded, but log the error
+                log.warning("Skipping %s: %s", file_path.name, load_errors[file_path])
+                continue
+
+            # Determine deck name for filtering
+            # Priority: YAML deck-name > Hierarchical Name (if base_dir) > special deck.yaml handling > file stem
+            file_deck_name = file_deck_names.get(file_path)
+            if file_deck_name:
+                deck_name_for_filter = file_deck_name
+            elif base_dir:
+                deck_name_for_filter = get_deck_name_from_path(file_path, base_dir)
+            elif file_path.stem == "deck":
+                deck_name_for_filter = file_path.parent.name or "Deck"
+            else:
+                deck_name_for_filter = file_path.stem
+
+            # Apply fnmatch pattern
+            if deck_filter_re.match(deck_name_for_filter.lower()):
+                filtered_list.append(file_path)
+                log.debug(
+                    "Deck '%s' matches filter '%s'",
+                    deck_name_for_filter,
+                    deck_filter,
+                )
+            else:
+                # Only the build needs the parsed notes
+                preloaded.pop(file_path, None)
+                log.debug(
+                    "Deck '%s' does not match filter '%s'",
+                    deck_name_for_filter,
+                    deck_filter,
+                )
+
+        original_count = len(file_list)
+        file_list = filtered_list
+        click.echo(
+            f"Filtered to {len(file_list)} decks matching pattern '{deck_filter}'"
+        )
+        if len(file_list) == 0:
+            click.echo(
+                f"Error: No decks match filter '{deck_filter}' (from {original_count} decks)",
+                err=True,
+            )
+            raise click.Abort()
+
+    log.debug("Files: %s", [str(f) for f in file_list])
+
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    # Default workers to 4 if not specified, cap at 8 to avoid overwhelming AnkiConnect
+    if workers is None:
+        workers = 4
+    workers = min(max(workers, 1), 8)  # Ensure between 1-8
+
+    # Check that Anki is reachable before spending time on builds; the same
+    # connector then serves every push and the final sync
+    connector: AnkiConnector | None = None
+    if push:
+        connector = AnkiConnector()
+        try:
+            connector.get_version()
+        except AnkiConnectError as e:
+            connector.close()
+            click.echo(f"Error: {e}", err=True)
+            raise click.Abort() from e
+
+    try:
+        if merge:
+            # Merge mode: combine all files into one deck
+            _batch_build_merged(
+                file_list,
+                output_path,
+                deck_name,
+                connector,
+                delete_after,
+                sync,
+                skip_existing_media,
+                preloaded,
+                workers,
+                deck_cache_dir,
+            )
+        else:
+            # Separate mode: build each file individually
+            _batch_build_separate(
+                file_list,
+                output_path,
+                base_dir if hierarchical else None,
+                connector,
+                delete_after,
+                sync,
+                workers,
+                skip_existing_media,
+                preloaded,
+                deck_cache_dir,
+                build_executor == "process",
+            )
+    finally:
+        if connector is not None:
+            connector.close()
+
+
+def _load_deck(file_path: Path, cache_dir: Path | None) -> LoadedDeck:
+    """Load a deck file, through the on-disk cache when one is configured."""
+    if cache_dir is None:
+        return load_deck_file(file_path)
+    return load_deck_file_cached(file_path, cache_dir)
+
+
+def _build_one(
+    file_path: Path,
+    output_file: Path,
+    name_override: str | None,
+    keep_package_data: bool,
+    preloaded: LoadedDeck | None,
+    cache_dir: Path | None,
+) -> BuildResult:
+    """Build a single deck of a separate batch build.
+
+    Module-level so it can run in a worker process; every argument and the
+    result are picklable.
+    """
+    if preloaded is None and cache_dir is not None:
+        preloaded = load_deck_file_cached(file_path, cache_dir)
+    return build_deck(
+        deck_path=file_path,
+        output_path=output_file,
+        deck_name_override=name_override,
+        keep_package_data=keep_package_data,
+        preloaded=preloaded,
+    )
+
+
+def _batch_build_merged(
+    file_list: list[Path],
+    output_path: Path,
+    deck_name: str | None,
+    connector: AnkiConnector | None = None,
+    delete_after: bool = False,
+    sync: bool = False,
+    skip_existing_media: bool = False,
+    preloaded: dict[Path, LoadedDeck] | None = None,
+    workers: int = 4,
+    cache_dir: Path | None = None,
+) -> None:
+    """Build a merged deck from multiple files.
+
+    The deck is pushed to Anki when *connector* is given.
+    """
+    push = connector is not None
+    all_items: list[dict] = []
+    model_configs: list[ModelConfigComplete] = []
+    seen_models: set[str] = set()
+
+    click.echo("Merging files...")
+
+    # Files are parsed on the pool but merged here in file order, so model
+    # dedup and note order do not depend on which parse finishes first
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        loads: list[Future[LoadedDeck]] = []
+        for file_path in file_list:
+            loaded = preloaded.pop(file_path, None) if preloaded else None
+            if loaded is None:
+                loads.append(executor.submit(_load_deck, file_path, cache_dir))
+            else:
+                done: Future[LoadedDeck] = Future()
+                done.set_result(loaded)
+                loads.append(done)
+
+        with click.progressbar(
+            zip(file_list, loads, strict=True),
+            length=len(file_list),
+            label="Loading files",
+        ) as files:
+            for file_path, load in files:
+                try:
+                    model_config, items, _, _ = load.result()
+
+                    # Track unique model configs
+                    model_name = model_config["name"]
+                    if model_name not in seen_models:
+                        model_configs.append(model_config)
+                        seen_models.add(model_name)
+                        log.debug("Added model: %s", model_name)
+
+                    all_items.extend(items)
+                    log.debug("Loaded %d items from %s", len(items), file_path.name)
+
+                except (ConfigValidationError, DataValidationError) as e:
+                    click.echo(f"\nWarning: Skipping {file_path.name}: {e}", err=True)
+
+    if not all_items:
+        click.echo("Error: No valid data found in any files", err=True)
+        raise click.Abort()
+
+    final_deck_name = deck_name or "Merged Deck"
+    click.echo(
+        f"\nBuilding merged deck '{final_deck_name}' with {len(all_items)} notes..."
+    )
+
+    builder = AnkiBuilder(final_deck_name, model_configs)
+
+    # Per-model field names and their lowercase forms, computed once and
+    # kept as immutable tuples shared by every note of that model
+    model_fields_map: dict[str, tuple[str, ...]] = {
+        cfg["name"]: tuple(cfg["fields"]) for cfg in model_configs
+    }
+    model_fields_lower_map: dict[str, tuple[str, ...]] = {
+        name: tuple(f.lower() for f in fields)
+        for name, fields in model_fields_map.items()
+    }
+    first_model_name = model_configs[0]["name"]
+
+    def note_rows() -> Iterator[tuple[list[str], list[str], str]]:
+        for item in all_items:
+            target_model_name = item.get("model", item.get("type", first_model_name))
+            if not isinstance(target_model_name, str):
+                target_model_name = str(target_model_name)
+
+            if target_model_name not in model_fields_map:
+                target_model_name = first_model_name
+
+            field_values = get_field_values(
+                item,
+                model_fields_map[target_model_name],
+                model_fields_lower_map[target_model_name],
+            )
+
+            tags_raw = item.get("tags", [])
+            tags: list[str] = (
+                tags_raw if isinstance(tags_raw, list) else [str(tags_raw)]
+            )
+
+            if "id" in item:
+                tags.append(f"id::{item['id']}")
+
+            yield field_values, tags, target_model_name
+
+    builder.add_notes(note_rows())
+
+    output_file = (
+        output_path / f"{final_deck_name.replace('::', '_').replace(' ', '_')}.apkg"
+    )
+    # Keep the package bytes around when pushing so media is read from memory
+    package_data: bytes | None = None
+    if push:
+        package_data = builder.write_to_buffer()
+        output_file.write_bytes(package_data)
+    else:
+        builder.write_to_file(output_file)
+    click.echo(f"Successfully created {output_file}")
+
+    if connector is not None:
+        click.echo(f"Pushing merged deck '{final_deck_name}' to Anki...")
+
+        try:
+            existing_media = (
+                set(connector.get_media_file_names()) if skip_existing_media else None
+            )
+            push_apkg(
+                output_file,
+                connector,
+                package_data=package_data,
+                existing_media=existing_media,
+            )
+            click.echo("✅ Pushed successfully")
+
+            if delete_after:
+                output_file.unlink()
+                log.info("Deleted: %s", output_file.name)
+
+            if sync:
+                click.echo("Syncing with AnkiWeb...")
+                connector.sync()
+                click.echo("✅ Sync complete")
+
+        except Exception as e:
+            click.echo(f"❌ Push failed: {e}", err=True)
+
+
+def _batch_build_separate(
+    file_list: list[Path],
+    output_path: Path,
+    base_dir: Path | None = None,
+    connector: AnkiConnector | None = None,
+    delete_after: bool = False,
+    sync: bool = False,
+    workers: int = 4,
+    skip_existing_media: bool = False,
+    preloaded: dict[Path, LoadedDeck] | None = None,
+    cache_dir: Path | None = None,
+    use_processes: bool = False,
+) -> None:
+    """Build each file as a separate deck.
+
+    Args:
+        file_list: List of deck files to build
+        output_path: Directory for output files
+        base_dir: Optional base directory for hierarchical deck naming
+        connector: Connector to push built decks to Anki with, or None
+        delete_after: Delete .apkg files after pushing
+        sync: Sync with AnkiWeb after pushing
+        workers: Number of worker threads for building and pushing
+        skip_existing_media: Skip uploading media already present in Anki
+        preloaded: Decks already loaded by the caller, keyed by file path
+        cache_dir: Directory of the on-disk deck cache, if enabled
+        use_processes: Run the builds in a pool of worker processes
+    """
+
+    push = connector is not None
+    errors: list[tuple[str, str]] = []
+    # Media names already in Anki, fetched lazily once for the whole batch
+    existing_media: set[str] | None = None
+    existing_media_lock = threading.Lock()
+
+    def get_existing_media() -> set[str] | None:
+        """Return the media names in Anki when --skip-existing-media is set."""
+        nonlocal existing_media
+        if not skip_existing_media or connector is None:
+            return None
+        with existing_media_lock:
+            if existing_media is None:
+                existing_media = set(connector.get_media_file_names())
+            return existing_media
+
+    # Get deck names for display
+    deck_names = []
+    for file_path in file_list:
+        if base_dir:
+            name = get_deck_name_from_path(file_path, base_dir)
+        elif file_path.stem == "deck":
+            # Use parent directory name for deck.yaml files
+            name = file_path.parent.name or "Deck"
+        else:
+            name = file_path.stem
+        deck_names.append(name)
+    output_files = [
+        output_path / f"{name.replace('::', '_').replace(' ', '_')}.apkg"
+        for name in deck_names
+    ]
+
+    # Status glyph for each deck (one of the STATUS_* constants)
+    status = [STATUS_PENDING] * len(file_list)
+
+    # Calculate max name length for table width
+    max_name_len = max(len(name) for name in deck_names) if deck_names else 20
+    max_name_len = max(max_name_len, 10)  # Minimum width
+    table_height = len(file_list) + 4
+
+    # Everything but the status glyphs is fixed, so render the table once
+    # into a format template with one "{}" slot per deck. Braces in deck
+    # names are escaped so they are not taken as slots.
+    row_prefixes = [f"│ {name:<{max_name_len}} │   " for name in deck_names]
+    table_rows = "".join(
+        prefix.replace("{", "{{").replace("}", "}}") + "{}   │\n"
+        for prefix in row_prefixes
+    )
+    table_template = (
+        f"┌{'─' * (max_name_len + 2)}┬────────┐\n"
+        f"│ {'Deck':<{max_name_len}} │ Status │\n"
+        f"├{'─' * (max_name_len + 2)}┼────────┤\n"
+        f"{table_rows}"
+        f"└{'─' * (max_name_len + 2)}┴────────┘\n"
+    )
+
+    # On a terminal the table is painted once and afterwards only the rows
+    # whose status changed are rewritten in place. Cursor movement means
+    # nothing in pipes and CI logs, so there the table is printed once at
+    # the end instead.
+    live_table = sys.stdout.isatty()
+
+    def print_table() -> None:
+        """Print the whole status table."""
+        sys.stdout.write(table_template.format(*status))
+        sys.stdout.flush()
+
+    def repaint_rows(rows: list[int]) -> None:
+        """Rewrite the given rows of the printed table in place."""
+        # The cursor rests on the line below the table, and deck rows start
+        # after the three header lines
+        moves = []
+        for idx in rows:
+            up = table_height - 3 - idx
+            moves.append(
+                f"\033[{up}A\r{row_prefixes[idx]}{status[idx]}   │\033[{up}B\r"
+            )
+        sys.stdout.write("".join(moves))
+        sys.stdout.flush()
+
+    # Status changes are queued and applied by a single UI thread, which is
+    # the only writer of `status` and of stdout, so producers never block
+    # each other. A ``None`` event stops the thread.
+    status_events: queue.SimpleQueue[tuple[int, str] | None] = queue.SimpleQueue()
+
+    def ui_loop() -> None:
+        """Apply queued status changes, repainting at most once per interval."""
+        running = True
+        while running:
+            event = status_events.get()
+            deadline = time.monotonic() + STATUS_REDRAW_INTERVAL
+            changed: set[int] = set()
+            progress: list[str] = []
+            while True:
+                if event is None:
+                    running = False
+                    break
+                idx, glyph = event
+                if status[idx] != glyph:
+                    status[idx] = glyph
+                    changed.add(idx)
+                    if glyph == STATUS_BUILDING and not live_table:
+                        # Without the live table, progress is logged line by
+                        # line instead
+                        progress.append(
+                            f"Building deck {idx + 1} of {len(file_list)}: "
+                            f"{deck_names[idx]}...\n"
+                        )
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    event = status_events.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            if changed and live_table:
+                repaint_rows(sorted(changed))
+            if progress:
+                sys.stdout.write("".join(progress))
+                sys.stdout.flush()
+
+    def set_status(idx: int, glyph: str) -> None:
+        """Queue a status change for deck *idx*."""
+        status_events.put((idx, glyph))
+
+    def push_deck_to_anki(
+        idx: int, output_file: Path, file_name: str, package_data: bytes | None
+    ) -> bool:
+        """Push a deck to Anki in background thread. Returns True on success."""
+        assert connector is not None
+        try:
+            push_apkg(
+                output_file,
+                connector,
+                package_data=package_data,
+                existing_media=get_existing_media(),
+            )
+            log.info("Pushed: %s", output_file.name)
+
+            # Delete after successful push if requested
+            if delete_after:
+                output_file.unlink()
+                log.info("Deleted: %s", output_file.name)
+
+            set_status(idx, STATUS_DONE)
+            return True
+
+        except Exception as e:
+            errors.append((file_name, f"Push failed: {e}"))
+            log.error("Push failed: %s: %s", file_name, e)
+            set_status(idx, STATUS_FAILED)
+            return False
+
+    def process_deck(idx: int, file_path: Path) -> None:
+        """Build deck *idx* on a worker thread and push it when requested."""
+        set_status(idx, STATUS_BUILDING)
+
+        try:
+            # Use hierarchical name as override when base_dir is set
+            name_override = (
+                get_deck_name_from_path(file_path, base_dir) if base_dir else None
+            )
+
+            build_args = (
+                file_path,
+                output_files[idx],
+                name_override,
+                push,
+                preloaded.pop(file_path, None) if preloaded else None,
+                cache_dir,
+            )
+            if build_pool is not None:
+                result = build_pool.submit(_build_one, *build_args).result()
+            else:
+                result = _build_one(*build_args)
+        except (ConfigValidationError, DataValidationError, DeckBuildError) as e:
+            errors.append((file_path.name, str(e)))
+            log.error("Failed: %s: %s", file_path.name, e)
+            set_status(idx, STATUS_FAILED)
+            return
+
+        log.info("Built: %s -> %s", file_path.name, result.output_path.name)
+
+        if push:
+            set_status(idx, STATUS_PUSHING)
+            push_deck_to_anki(
+                idx, result.output_path, file_path.name, result.package_data
+            )
+        else:
+            set_status(idx, STATUS_DONE)
+
+    if live_table:
+        print_table()
+    ui_thread = threading.Thread(target=ui_loop, daemon=True)
+    ui_thread.start()
+
+    # Each worker builds a deck and then pushes it, so builds run in
+    # parallel and a worker holds at most one deck's .apkg bytes at a time;
+    # a slow Anki throttles the builds instead of piling up packages. With
+    # processes the worker threads hand each build to the process pool and
+    # wait for it.
+    build_pool: Executor | None = None
+    if use_processes and workers > 1 and len(file_list) > 1:
+        # Workers start lazily from the worker threads; forking a
+        # multi-threaded process can deadlock, so they are spawned
+        build_pool = ProcessPoolExecutor(
+            max_workers=min(workers, len(file_list)),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(process_deck, i, file_path)
+                for i, file_path in enumerate(file_list)
+            ]
+            # Build and push errors are handled per deck; anything else
+            # propagates
+            for future in as_completed(futures):
+                future.result()
+    finally:
+        if build_pool is not None:
+            build_pool.shutdown()
+
+    # Let the UI thread drain every pending event before summarising
+    status_events.put(None)
+    ui_thread.join()
+    if not live_table:
+        print_table()
+    success_count = status.count(STATUS_DONE)
+    error_count = status.count(STATUS_FAILED)
+
+    # Final summary
+    print()
+    action = "built and pushed" if push else "built"
+    if error_count == 0:
+        click.echo(f"✅ Successfully {action} {success_count}/{len(file_list)} decks")
+    else:
+        click.echo(
+            f"{action.capitalize()} {success_count}/{len(file_list)} decks, {error_count} failed"
+        )
+        click.echo(
+            "\n".join(f"  ❌ {filename}: {error}" for filename, error in errors),
+            err=True,
+        )
+
+    if connector is not None:
+        if sync and success_count > 0:
+            click.echo("\nSyncing with AnkiWeb...")
+            try:
+                connector.sync()
+                click.echo("✅ Sync complete")
+            except Exception as e:
+                click.echo(f"❌ Sync failed: {e}", err=True)
@@ -0,0 +1,73 @@
+"""Implementation of ``deck create``."""
+
+from pathlib import Path
+
+import click
+
+from anki_yaml_tool.cli.error_handling import cli_error_handler
+from anki_yaml_tool.core.config import read_deck_name
+from anki_yaml_tool.core.connector import AnkiConnector
+from anki_yaml_tool.core.deck_service import validate_deck
+from anki_yaml_tool.core.pusher import push_deck_from_file
+
+
+@click.command(name="create")
+@click.option(
+    "--file",
+    "-f",
+    type=click.Path(exists=True, path_type=Path),
+    required=True,
+    help="Source YAML file.",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Validate YAML without creating deck.",
+)
+@cli_error_handler
+def create_deck(file: Path, dry_run: bool) -> None:
+    """Create a new deck from a YAML schema.
+
+    Fails if the deck already exists (to avoid accidental overwrites).
+    """
+    if dry_run:
+        click.echo(f"Validating {file}...")
+        result = validate_deck(file)
+        if result.has_errors:
+            for issue in result.issues:
+                color = "red" if issue.level == "error" else "yellow"
+                click.echo(
+                    click.style(f"{issue.level.title()}: {issue.message}", fg=color)
+                )
+            raise click.Abort()
+        click.echo(click.style("Validation successful.", fg="green"))
+        return
+
+    # TODO: Check if deck exists before pushing?
+    # The pusher creates/updates notes. "Create" implies strictly new deck?
+    # DESIGN.md says: "Fails if the deck already exists"
+    # We need to peek at the deck name from the file first to check existence.
+    deck_name = read_deck_name(file)
+
+    # Determine effective deck name (file > filename)
+    final_deck_name = deck_name or file.stem
+
+    # Only talk to Anki once the deck name is known
+    connector = AnkiConnector()
+    existing_decks = connector.get_deck_name_set()
+    if final_deck_name in existing_decks:
+        click.echo(
+            click.style(f"Error: Deck '{final_deck_name}' already exists.", fg="red"),
+            err=True,
+        )
+        raise click.Abort()
+
+    click.echo(f"Creating deck '{final_deck_name}' from {file}...")
+    stats = push_deck_from_file(
+        connector, file, deck_name=final_deck_name, replace=False
+    )  # Create shouldn't need replace
+
+    click.echo(
+        click.style(f"Successfully created deck '{final_deck_name}'.", fg="green")
+    )
+    click.echo(f"Added {stats['added']} notes.")
@@ -0,0 +1,56 @@
+"""Implementation of ``deck update``."""
+
+from pathlib import Path
+
+import click
+
+from anki_yaml_tool.cli.error_handling import cli_error_handler
+from anki_yaml_tool.core.config import read_deck_name
+from anki_yaml_tool.core.connector import AnkiConnector
+from anki_yaml_tool.core.pusher import push_deck_from_file
+
+
+@click.command(name="update")
+@click.option(
+    "--file",
+    "-f",
+    type=click.Path(exists=True, path_type=Path),
+    required=True,
+    help="Source YAML file.",
+)
+@click.option(
+    "--prune",
+    is_flag=True,
+    help="Delete cards in Anki that are missing in YAML.",
+)
+@cli_error_handler
+def update_deck(file: Path, prune: bool) -> None:
+    """Update an existing deck from a YAML schema.
+
+    Fails if the deck does not exist.
+    """
+    # Check if deck exists
+    deck_name = read_deck_name(file)
+    final_deck_name = deck_name or file.stem
+
+    # Only talk to Anki once the deck name is known
+    connector = AnkiConnector()
+    existing_decks = connector.get_deck_name_set()
+    if final_deck_name not in existing_decks:
+        click.echo(
+            click.style(f"Error: Deck '{final_deck_name}' does not exist.", fg="red"),
+            err=True,
+        )
+        raise click.Abort()
+
+    click.echo(f"Updating deck '{final_deck_name}' from {file}...")
+    stats = push_deck_from_file(
+        connector, file, deck_name=final_deck_name, replace=prune
+    )
+
+    click.echo(
+        click.style(f"Successfully updated deck '{final_deck_name}'.", fg="green")
+    )
+    click.echo(
+        f"Added: {stats['added']}, Updated: {stats['updated']}, Deleted: {stats['deleted']}"
+    )
@@ -0,0 +1,113 @@
+"""Implementation of ``deck watch``."""
+
+import hashlib
+import logging
+from pathlib import Path
+
+import click
+import yaml
+
+from anki_yaml_tool.core.config import read_deck_name
+from anki_yaml_tool.core.connector import AnkiConnectError, AnkiConnector
+from anki_yaml_tool.core.exceptions import AnkiToolError
+from anki_yaml_tool.core.pusher import push_deck_from_file
+from anki_yaml_tool.core.watcher import FileWatcher
+
+log = logging.getLogger(__name__)
+
+
+@click.command(name="watch")
+@click.option(
+    "--file",
+    "-f",
+    type=click.Path(exists=True, path_type=Path),
+    required=True,
+    help="File to watch.",
+)
+def watch_deck(file: Path) -> None:
+    """Monitors a YAML file for changes and auto-updates.
+
+    Fails if the deck does not exist at startup.
+    """
+    # Resolve the deck name first so a malformed file fails before Anki is
+    # contacted
+    try:
+        deck_name = read_deck_name(file)
+    except (AnkiToolError, yaml.YAMLError, OSError) as e:
+        click.echo(f"Error: {e}", err=True)
+        raise click.Abort() from e
+    final_deck_name = deck_name or file.stem
+
+    # Verify deck exists
+    connector = AnkiConnector()
+    try:
+        existing_decks = connector.get_deck_name_set()
+        if final_deck_name not in existing_decks:
+            click.echo(
+                click.style(
+                    f"Error: Deck '{final_deck_name}' does not exist. Use 'deck create' first.",
+                    fg="red",
+                ),
+                err=True,
+            )
+            raise click.Abort()
+
+    except (
+        Exception
+    ) as e:  # Catch connection errors too (if Anki not running, watch fails per spec?)
+        # Spec says "Fails if deck does not exist". This implies Anki check.
+        pass  # Let the watcher start loop handle it? No, fail fast.
+        if isinstance(e, AnkiConnectError):
+            click.echo(
+                click.style(f"Error: Could not connect to Anki: {e}", fg="red"),
+                err=True,
+            )
+            raise click.Abort() from e
+
+    # Digest of the file as last pushed, so saves that leave the bytes
+    # unchanged (autosave, formatters) skip the parse and the round-trips
+    last_digest = b""
+
+    # Define callback
+    def on_change() -> None:
+        nonlocal last_digest
+        try:
+            digest = hashlib.blake2s(file.read_bytes(), digest_size=16).digest()
+        except OSError:
+            digest = b""  # e.g. mid atomic-rename; let the push report it
+        if digest and digest == last_digest:
+            log.debug("Unchanged content, skipping push: %s", file)
+            return
+
+        click.echo("\n" + "=" * 40)
+        click.echo(click.style("Change detected! Updating deck...", fg="cyan"))
+        try:
+            # Decks may have been renamed or deleted in Anki since the last
+            # push; drop the cached names so they are listed afresh
+            connector.invalidate_cache()
+            # Just use push_deck_from_file (wraps logic)
+            push_deck_from_file(connector, file, deck_name=final_deck_name)
+            last_digest = digest
+            click.echo(click.style("Deck updated successfully.", fg="green"))
+        except Exception as e:
+            # Retry on the next save even if the bytes are the same
+            last_digest = b""
+            click.echo(click.style(f"Error updating deck: {e}", fg="red"))
+
+    try:
+        watcher = FileWatcher(file)
+        click.echo(f"Watching {file} for changes...")
+        click.echo("Press Ctrl+C to stop.")
+        watcher.start(on_change)
+        # Bounded waits: an untimed wait is not woken by Ctrl+C on Windows
+        while not watcher.wait(1.0):
+            pass
+
+    except KeyboardInterrupt:
+        click.echo("Stopping watcher...")
+        watcher.stop()
+    except ImportError:
+        click.echo(
+            click.style("Error: 'watchdog' package not installed.", fg="red"), err=True
+        )
+        raise click.Abort() from ImportError
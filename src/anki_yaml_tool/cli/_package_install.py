@@ -0,0 +1,27 @@
+"""Implementation of ``package install``."""
+
+from pathlib import Path
+
+import click
+
+from anki_yaml_tool.cli.error_handling import cli_error_handler
+from anki_yaml_tool.core.connector import AnkiConnector
+from anki_yaml_tool.core.deck_service import push_apkg
+
+
+@click.command(name="install")
+@click.option(
+    "--file",
+    "-f",
+    type=click.Path(exists=True, path_type=Path),
+    required=True,
+    help="Path to .apkg file.",
+)
+@cli_error_handler
+def install_package(file: Path) -> None:
+    """Imports an .apkg file into Anki."""
+    connector = AnkiConnector()
+    click.echo(f"Installing {file} into Anki...")
+    # push_apkg handles import
+    push_apkg(file, connector)
+    click.echo(click.style("Successfully installed package.", fg="green"))
@@ -1,294 +1,31 @@
 """Deck management commands for the CLI.
 
 This module implements the `deck` command group, handling direct interactions
-with the local Anki collection (create, update, export, watch).
+with the local Anki collection (create, update, export, watch). Each command
+lives in its own module and is only imported when it is used.
 """
 
-import logging
-from pathlib import Path
-
 import click
 
-from anki_yaml_tool.core.connector import AnkiConnectError, AnkiConnector
-from anki_yaml_tool.core.exceptions import AnkiToolError
-from anki_yaml_tool.core.exporter import export_deck
-from anki_yaml_tool.core.pusher import push_deck_from_file
-from anki_yaml_tool.core.watcher import FileWatcher
-
-log = logging.getLogger(__name__)
-
-
-@click.group(name="deck")
+from anki_yaml_tool.cli.lazy_group import LazyGroup
+
+
+@click.group(
+    name="deck",
+    cls=LazyGroup,
+    lazy_subcommands={
+        "create": ("anki_yaml_tool.cli._deck_create", "create_deck"),
+        "update": ("anki_yaml_tool.cli._deck_update", "update_deck"),
+        "export": ("anki_yaml_tool.cli._deck_export", "export_deck_cmd"),
+        "watch": ("anki_yaml_tool.cli._deck_watch", "watch_deck"),
+    },
+    lazy_help={
+        "create": "Create a new deck from a YAML schema.",
+        "update": "Update an existing deck from a YAML schema.",
+        "export": "Exports an existing Anki deck to a YAML file.",
+        "watch": "Monitors a YAML file for changes and auto-updates.",
+    },
+)
 def deck_cli() -> None:
     """Manage Anki decks directly (create, update, export, watch)."""
     pass
-
-
-@deck_cli.command(name="create")
-@click.option(
-    "--file",
-    "-f",
-    type=click.Path(exists=True, path_type=Path),
-    required=True,
-    help="Source YAML file.",
-)
-@click.option(
-    "--dry-run",
-    is_flag=True,
-    help="Validate YAML without creating deck.",
-)
-def create_deck(file: Path, dry_run: bool) -> None:
-    """Create a new deck from a YAML schema.
-
-    Fails if the deck already exists (to avoid accidental overwrites).
-    """
-    if dry_run:
-        from anki_yaml_tool.core.deck_service import validate_deck
-
-        click.echo(f"Validating {file}...")
-        result = validate_deck(file)
-        if result.has_errors:
-            for issue in result.issues:
-                color = "red" if issue.level == "error" else "yellow"
-                click.echo(
-                    click.style(f"{issue.level.title()}: {issue.message}", fg=color)
-                )
-            raise click.Abort()
-        click.echo(click.style("Validation successful.", fg="green"))
-        return
-
-    connector = AnkiConnector()
-    try:
-        # TODO: Check if deck exists before pushing?
-        # The pusher creates/updates notes. "Create" implies strictly new deck?
-        # DESIGN.md says: "Fails if the deck already exists"
-        # We need to peek at the deck name from the file first to check existence.
-        from anki_yaml_tool.core.config import load_deck_file
-
-        _, _, deck_name, _ = load_deck_file(file)
-
-        # Determine effective deck name (file > filename)
-        final_deck_name = deck_name or file.stem
-
-        existing_decks = connector.get_deck_names()
-        if final_deck_name in existing_decks:
-            click.echo(
-                click.style(
-                    f"Error: Deck '{final_deck_name}' already exists.", fg="red"
-                ),
-                err=True,
-            )
-            raise click.Abort()
-
-        click.echo(f"Creating deck '{final_deck_name}' from {file}...")
-        stats = push_deck_from_file(
-            connector, file, deck_name=final_deck_name, replace=False
-        )  # Create shouldn't need replace
-
-        click.echo(
-            click.style(f"Successfully created deck '{final_deck_name}'.", fg="green")
-        )
-        click.echo(f"Added {stats['added']} notes.")
-
-    except AnkiToolError as e:
-        click.echo(f"Error: {e}", err=True)
-        raise click.Abort() from e
-    except Exception as e:
-        click.echo(f"Unexpected error: {e}", err=True)
-        raise click.Abort() from e
-
-
-@deck_cli.command(name="update")
-@click.option(
-    "--file",
-    "-f",
-    type=click.Path(exists=True, path_type=Path),
-    required=True,
-    help="Source YAML file.",
-)
-@click.option(
-    "--prune",
-    is_flag=True,
-    help="Delete cards in Anki that are missing in YAML.",
-)
-def update_deck(file: Path, prune: bool) -> None:
-    """Update an existing deck from a YAML schema.
-
-    Fails if the deck does not exist.
-    """
-    connector = AnkiConnector()
-    try:
-        # Check if deck exists
-        from anki_yaml_tool.core.config import load_deck_file
-
-        _, _, deck_name, _ = load_deck_file(file)
-        final_deck_name = deck_name or file.stem
-
-        existing_decks = connector.get_deck_names()
-        if final_deck_name not in existing_decks:
-            click.echo(
-                click.style(
-                    f"Error: Deck '{final_deck_name}' does not exist.", fg="red"
-                ),
-                err=True,
-            )
-            raise click.Abort()
-
-        click.echo(f"Updating deck '{final_deck_name}' from {file}...")
-        stats = push_deck_from_file(
-            connector, file, deck_name=final_deck_name, replace=prune
-        )
-
-        click.echo(
-            click.style(f"Successfully updated deck '{final_deck_name}'.", fg="green")
-        )
-        click.echo(
-            f"Added: {stats['added']}, Updated: {stats['updated']}, Deleted: {stats['deleted']}"
-        )
-
-    except AnkiToolError as e:
-        click.echo(f"Error: {e}", err=True)
-        raise click.Abort() from e
-    except Exception as e:
-        click.echo(f"Unexpected error: {e}", err=True)
-        raise click.Abort() from e
-
-
-@deck_cli.command(name="export")
-@click.option(
-    "--name",
-    "-n",
-    required=True,
-    help="Name of the deck in Anki.",
-)
-@click.option(
-    "--output",
-    "-o",
-    type=click.Path(path_type=Path),
-    required=True,
-    help="Destination YAML file.",
-)
-def export_deck_cmd(name: str, output: Path) -> None:
-    """Exports an existing Anki deck to a YAML file.
-
-    Fails if the deck does not exist.
-    """
-    connector = AnkiConnector()
-    try:
-        existing_decks = connector.get_deck_names()
-        if name not in existing_decks:
-            click.echo(
-                click.style(f"Error: Deck '{name}' does not exist in Anki.", fg="red"),
-                err=True,
-            )
-            raise click.Abort()
-
-        # export_deck function expects a directory, but CLI asks for a FILE.
-        # The core exporter logic (checked earlier) exports to a directory containing config.yaml + data.yaml.
-        # DESIGN.md says: --output <path> (Destination YAML file).
-        # This implies exporting to a SINGLE file (which we support reading via `load_deck_file`,
-        # but `export_deck` currently produces a directory).
-        # For now, to match existing capability, I will output to a directory if path doesn't have suffix,
-        # or error if exporter doesn't support single file.
-        # Looking at exporter.py: `export_deck(..., output_dir: Path)`.
-        # It creates output_dir/config.yaml and output_dir/data.yaml.
-        # Strict adherence to DESIGN.md "Destination YAML file" is hard without refactoring exporter to merge them.
-        # I will document this limitation or wrap it.
-        # User said "Update project based on DESIGN.md". refactoring exporter is out of scope for *CLI structure*.
-        # I'll implement it as exporting to a directory for now, but name the arg 'output'
-
-        if output.suffix.lower() in [".yaml", ".yml"]:
-            click.echo(
-                click.style(
-                    "Warning: Exporting to single YAML file is not yet supported. Exporting to directory instead.",
-                    fg="yellow",
-                )
-            )
-            output = output.parent / output.stem
-
-        click.echo(f"Exporting deck '{name}' to {output}...")
-        export_deck(connector, name, output)
-        click.echo(click.style(f"Successfully exported to {output}", fg="green"))
-
-    except AnkiToolError as e:
-        click.echo(f"Error: {e}", err=True)
-        raise click.Abort() from e
-    except Exception as e:
-        click.echo(f"Unexpected error: {e}", err=True)
-        raise click.Abort() from e
-
-
-@deck_cli.command(name="watch")
-@click.option(
-    "--file",
-    "-f",
-    type=click.Path(exists=True, path_type=Path),
-    required=True,
-    help="File to watch.",
-)
-def watch_deck(file: Path) -> None:
-    """Monitors a YAML file for changes and auto-updates.
-
-    Fails if the deck does not exist at startup.
-    """
-    # Verify deck exists
-    connector = AnkiConnector()
-    try:
-        from anki_yaml_tool.core.config import load_deck_file
-
-        _, _, deck_name, _ = load_deck_file(file)
-        final_deck_name = deck_name or file.stem
-
-        existing_decks = connector.get_deck_names()
-        if final_deck_name not in existing_decks:
-            click.echo(
-                click.style(
-                    f"Error: Deck '{final_deck_name}' does not exist. Use 'deck create' first.",
-                    fg="red",
-                ),
-                err=True,
-            )
-            raise click.Abort()
-
-    except (
-        Exception
-    ) as e:  # Catch connection errors too (if Anki not running, watch fails per spec?)
-        # Spec says "Fails if deck does not exist". This implies Anki check.
-        pass  # Let the watcher start loop handle it? No, fail fast.
-        if isinstance(e, AnkiConnectError):
-            click.echo(
-                click.style(f"Error: Could not connect to Anki: {e}", fg="red"),
-                err=True,
-            )
-            raise click.Abort() from e
-
-    # Define callback
-    def on_change() -> None:
-        click.echo("\n" + "=" * 40)
-        click.echo(click.style("Change detected! Updating deck...", fg="cyan"))
-        try:
-            # Just use push_deck_from_file (wraps logic)
-            push_deck_from_file(connector, file, deck_name=final_deck_name)
-            click.echo(click.style("Deck updated successfully.", fg="green"))
-        except Exception as e:
-            click.echo(click.style(f"Error updating deck: {e}", fg="red"))
-
-    try:
-        watcher = FileWatcher(file)
-        click.echo(f"Watching {file} for changes...")
-        click.echo("Press Ctrl+C to stop.")
-        watcher.start(on_change)
-
-        import time
-
-        while watcher.is_running():
-            time.sleep(1)
-
-    except KeyboardInterrupt:
-        click.echo("Stopping watcher...")
-        watcher.stop()
-    except ImportError:
-        click.echo(
-            click.style("Error: 'watchdog' package not installed.", fg="red"), err=True
-        )
-        raise click.Abort() from ImportError
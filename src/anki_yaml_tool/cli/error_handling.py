@@ -0,0 +1,48 @@
+"""Shared error handling for CLI commands.
+
+Usage:
+    @click.command()
+    @cli_error_handler
+    def my_command() -> None: ...
+"""
+
+import functools
+from collections.abc import Callable
+from typing import ParamSpec, TypeVar
+
+import click
+
+from anki_yaml_tool.core.exceptions import AnkiToolError
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def cli_error_handler(func: Callable[P, R]) -> Callable[P, R]:
+    """Report errors raised by a command and abort it.
+
+    Tool errors are printed as ``Error: ...`` and anything else as
+    ``Unexpected error: ...``; click's own exceptions (e.g. an ``Abort``
+    raised after printing a message) pass through unchanged.
+
+    Args:
+        func: The command callback to wrap.
+
+    Returns:
+        The wrapped callback.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        try:
+            return func(*args, **kwargs)
+        except (click.ClickException, click.Abort, click.exceptions.Exit):
+            raise
+        except AnkiToolError as e:
+            click.echo(f"Error: {e}", err=True)
+            raise click.Abort() from e
+        except Exception as e:
+            click.echo(f"Unexpected error: {e}", err=True)
+            raise click.Abort() from e
+
+    return wrapper
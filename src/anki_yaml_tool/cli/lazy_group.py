@@ -0,0 +1,87 @@
+"""Click group that imports its subcommands on first use.
+
+Commands register as ``name -> (module, attribute)`` so importing a group
+stays cheap: a subcommand's module, and the core modules it depends on
+(HTTP client, genanki, watchdog, ...), are only imported once the command
+is looked up, e.g. when it is invoked. Commands given a ``lazy_help`` line
+are listed in ``--help`` without being imported at all.
+
+Usage:
+    @click.group(
+        cls=LazyGroup,
+        lazy_subcommands={"build": ("anki_yaml_tool.cli._package_build", "build_package")},
+        lazy_help={"build": "Creates an .apkg file from YAML."},
+    )
+    def package_cli() -> None: ...
+"""
+
+import importlib
+from typing import Any
+
+import click
+
+
+class LazyGroup(click.Group):
+    """A :class:`click.Group` whose subcommands are imported lazily.
+
+    Args:
+        lazy_subcommands: Mapping of command name to ``(module_path,
+            attribute_name)`` of the command object.
+        lazy_help: Mapping of lazy command name to the help line shown in
+            the group's ``--help``; commands without one are imported to
+            read it.
+        **kwargs: Passed on to :class:`click.Group`.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_subcommands: dict[str, tuple[str, str]] | None = None,
+        lazy_help: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+        self.lazy_help = lazy_help or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Return eagerly registered and lazy command names, sorted."""
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Return the command, importing its module on first access."""
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            module_path, attr_name = self.lazy_subcommands[cmd_name]
+            command = getattr(importlib.import_module(module_path), attr_name)
+            if not isinstance(command, click.Command):
+                raise TypeError(
+                    f"Lazy command '{cmd_name}' ({module_path}.{attr_name}) "
+                    "is not a click command"
+                )
+            # Cache it so later lookups skip the import machinery
+            self.commands[cmd_name] = command
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        """List the commands, using ``lazy_help`` for ones not yet imported."""
+        commands: list[tuple[str, click.Command]] = []
+        for name in self.list_commands(ctx):
+            cmd: click.Command | None
+            if name not in self.commands and name in self.lazy_help:
+                # A stand-in carrying the help line, so the same
+                # shortening rules apply without importing the command
+                cmd = click.Command(name, help=self.lazy_help[name])
+            else:
+                cmd = self.get_command(ctx, name)
+            if cmd is not None and not cmd.hidden:
+                commands.append((name, cmd))
+        if not commands:
+            return
+
+        # Same layout as click.Group.format_commands
+        limit = formatter.width - 6 - max(len(name) for name, _ in commands)
+        rows = [(name, cmd.get_short_help_str(limit)) for name, cmd in commands]
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
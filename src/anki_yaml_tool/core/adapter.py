@@ -11,11 +11,16 @@ alternative backends in the future.
 
 from __future__ import annotations
 
-from pathlib import Path
-from typing import Any, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    # Only used in annotations, which are strings at runtime
+    from pathlib import Path
+    from typing import Any
+
+    from anki_yaml_tool.core.connector import JSONValue
 
 
-@runtime_checkable
 class AnkiAdapter(Protocol):
     """Structural interface for Anki communication backends.
 
@@ -23,6 +28,22 @@ class AnkiAdapter(Protocol):
     ``AnkiAdapter``, regardless of inheritance.
     """
 
+    def invoke_multi(
+        self, actions: list[dict[str, Any]]
+    ) -> list[tuple[JSONValue, str | None]]:
+        """Invoke several AnkiConnect actions in a single request.
+
+        Args:
+            actions: Action objects with ``action`` and optional ``params`` keys.
+
+        Returns:
+            A ``(result, error)`` pair for each action, in request order.
+
+        Raises:
+            AnkiConnectError: If the request itself fails.
+        """
+        ...
+
     def import_package(self, apkg_path: Path) -> bool | None:
         """Import an .apkg file into Anki.
 
@@ -56,8 +77,12 @@ class AnkiAdapter(Protocol):
         """
         ...
 
-    def get_deck_names(self) -> list[str]:
-        """Return a sorted list of deck names available in Anki."""
+    def get_deck_names(self, refresh: bool = False) -> list[str]:
+        """Return a sorted list of deck names available in Anki.
+
+        Args:
+            refresh: Bypass any cached list and ask Anki again.
+        """
         ...
 
     def get_model_names(self) -> list[str]:
@@ -97,6 +122,14 @@ class AnkiAdapter(Protocol):
         """
         ...
 
+    def get_media_file_names(self, pattern: str = "*") -> list[str]:
+        """Return the names of media files in Anki's collection.
+
+        Args:
+            pattern: Glob-style pattern the filenames must match.
+        """
+        ...
+
     def update_note_fields(self, note_id: int, fields: dict[str, str]) -> None:
         """Update the fields of an existing note.
 
@@ -126,6 +159,31 @@ class AnkiAdapter(Protocol):
         """
         ...
 
+    def update_notes_fields(
+        self, updates: list[tuple[int, dict[str, str]]]
+    ) -> list[str | None]:
+        """Update the fields of several notes in one round-trip.
+
+        Args:
+            updates: ``(note_id, fields)`` pairs.
+
+        Returns:
+            The error message for each update, or None where it succeeded.
+        """
+        ...
+
+    def add_notes(self, specs: list[dict[str, Any]]) -> list[int | None]:
+        """Add several notes in one round-trip.
+
+        Args:
+            specs: AnkiConnect note objects (``deckName``, ``modelName``,
+                ``fields`` and optional ``tags``).
+
+        Returns:
+            The new note id for each spec, or None where adding it failed.
+        """
+        ...
+
     def delete_notes(self, note_ids: list[int]) -> None:
         """Delete notes from Anki by their IDs.
 
@@ -4,14 +4,67 @@ This module provides utilities for processing multiple deck files
 using glob patterns and directory scanning.
 """
 
+import fnmatch
 import glob
+import os
+import re
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from anki_yaml_tool.core.config import LoadedDeck, load_deck_file
+from anki_yaml_tool.core.deck_cache import load_deck_file_cached
+from anki_yaml_tool.core.exceptions import ConfigValidationError, DataValidationError
 from anki_yaml_tool.core.logging_config import get_logger
 
 log = get_logger("batch")
 
+# Characters that make a pattern a glob rather than a literal path
+_GLOB_MAGIC = re.compile(r"[*?[]")
+
+
+def _glob_files(pattern: str, listings: dict[str, list[str]]) -> list[str]:
+    """Return the files matching a glob *pattern*, sorted.
+
+    Args:
+        pattern: Glob pattern; ``**`` matches directories recursively
+        listings: File names of the directories listed so far, shared
+            between the patterns of one expansion
+
+    Returns:
+        Matching file paths, spelled as ``glob.glob`` would
+    """
+    dirname, basename = os.path.split(pattern)
+    if _GLOB_MAGIC.search(dirname) or "**" in basename:
+        # glob anchors the search at the pattern's literal leading
+        # directories, so only the wildcard part of the tree is walked
+        return sorted(
+            match
+            for match in glob.glob(pattern, recursive=True)
+            if os.path.isfile(match)
+        )
+
+    # Only the file name has wildcards (e.g. "decks/*.yaml"): list the one
+    # directory and use the file type scandir already knows instead of a
+    # stat per match. Each directory is listed once however many patterns
+    # point into it (e.g. "*.yaml" and "*.yml"), and fnmatch caches the
+    # compiled patterns. Like glob, wildcards skip hidden files unless the
+    # pattern itself starts with a dot.
+    key = os.path.normpath(dirname or os.curdir)
+    names = listings.get(key)
+    if names is None:
+        try:
+            with os.scandir(key) as entries:
+                names = [entry.name for entry in entries if entry.is_file()]
+        except OSError:
+            names = []
+        listings[key] = names
+    if not basename.startswith("."):
+        names = [name for name in names if not name.startswith(".")]
+    return sorted(
+        os.path.join(dirname, name) for name in fnmatch.filter(names, basename)
+    )
+
 
 def expand_file_patterns(patterns: tuple[str, ...]) -> list[Path]:
     """Expand glob patterns to a list of file paths.
@@ -20,37 +73,75 @@ def expand_file_patterns(patterns: tuple[str, ...]) -> list[Path]:
         patterns: Tuple of file paths or glob patterns
 
     Returns:
-        List of resolved file paths (duplicates removed, sorted)
+        List of resolved file paths, in pattern order with each glob's
+        matches sorted and duplicates removed
 
     Raises:
         FileNotFoundError: If no files match the patterns
     """
-    files: set[Path] = set()
-
-    for pattern in patterns:
-        pattern_path = Path(pattern)
-
-        # If it's a direct file path that exists, add it
-        if pattern_path.exists() and pattern_path.is_file():
-            files.add(pattern_path.resolve())
-            log.debug("Found file: %s", pattern_path)
+    # A dict keeps the first occurrence of each file in pattern order; keys
+    # are resolved path strings, which hash far faster than Path objects
+    files: dict[str, None] = {}
+    listings: dict[str, list[str]] = {}
+
+    # Repeated patterns are expanded once
+    for pattern in dict.fromkeys(patterns):
+        # An existing file wins over a glob reading of its name, so
+        # "deck[1].yaml" names that file even when "deck1.yaml" exists
+        if os.path.isfile(pattern):
+            files.setdefault(os.path.realpath(pattern))
+            log.debug("Found file: %s", pattern)
+            continue
+        matches = _glob_files(pattern, listings) if _GLOB_MAGIC.search(pattern) else []
+        if matches:
+            for match in matches:
+                files.setdefault(os.path.realpath(match))
+                log.debug("Glob matched: %s", match)
         else:
-            # Try glob expansion
-            matches = glob.glob(pattern, recursive=True)
-            if matches:
-                for match in matches:
-                    match_path = Path(match)
-                    if match_path.is_file():
-                        files.add(match_path.resolve())
-                        log.debug("Glob matched: %s", match_path)
-            else:
-                log.warning("No files matched pattern: %s", pattern)
-
-    result = sorted(files)
+            log.warning("No files matched pattern: %s", pattern)
+
+    result = [Path(f) for f in files]
     log.info("Expanded %d patterns to %d files", len(patterns), len(result))
     return result
 
 
+def load_many(
+    paths: list[Path],
+    cache_dir: Path | None = None,
+    max_workers: int | None = None,
+) -> list[LoadedDeck | ConfigValidationError | DataValidationError]:
+    """Load several deck files concurrently.
+
+    Loading is mostly file I/O and libyaml parsing, so a thread pool
+    overlaps the reads of different files.
+
+    Args:
+        paths: Deck files to load
+        cache_dir: Directory of the parsed-deck cache, if one is used
+        max_workers: Maximum number of loader threads (default: four per CPU,
+            at most 32)
+
+    Returns:
+        For each path, in order, the loaded deck or the validation error
+        raised while loading it
+    """
+
+    def load(path: Path) -> LoadedDeck | ConfigValidationError | DataValidationError:
+        try:
+            if cache_dir is None:
+                return load_deck_file(path)
+            return load_deck_file_cached(path, cache_dir)
+        except (ConfigValidationError, DataValidationError) as e:
+            return e
+
+    if len(paths) <= 1:
+        return [load(path) for path in paths]
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 4) * 4)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        return list(executor.map(load, paths))
+
+
 def scan_directory_for_decks(
     directory: Path,
     pattern: str = "deck.yaml",
@@ -72,10 +163,52 @@ def scan_directory_for_decks(
     glob_pattern = f"**/{pattern}" if recursive else pattern
     log.info("Scanning %s for %s", directory, glob_pattern)
 
-    for deck_file in directory.glob(glob_pattern):
-        if deck_file.is_file():
-            log.debug("Found deck file: %s", deck_file)
-            yield deck_file
+    if "/" in pattern or os.sep in pattern:
+        # Patterns spanning directories are left to pathlib
+        for deck_file in directory.glob(glob_pattern):
+            if deck_file.is_file():
+                log.debug("Found deck file: %s", deck_file)
+                yield deck_file
+        return
+
+    for deck_file in _scan_tree(directory, pattern, recursive):
+        log.debug("Found deck file: %s", deck_file)
+        yield deck_file
+
+
+def _scan_tree(directory: Path, pattern: str, recursive: bool) -> Iterator[Path]:
+    """Yield files under *directory* whose name matches *pattern*.
+
+    Walks the tree with :func:`os.scandir` so file and directory checks use
+    the cached directory entry instead of a ``stat`` per path. Like
+    :meth:`Path.glob`, symlinked directories are not descended into.
+    """
+    pattern = os.path.normcase(pattern)
+    if _GLOB_MAGIC.search(pattern):
+        name_re = re.compile(fnmatch.translate(pattern))
+
+        def name_matches(name: str) -> bool:
+            return name_re.match(os.path.normcase(name)) is not None
+
+    else:
+        # A literal name such as the default "deck.yaml" is a string compare
+        def name_matches(name: str) -> bool:
+            return os.path.normcase(name) == pattern
+
+    # Paths stay strings while walking; only matches become Path objects
+    pending = [os.fspath(directory)]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            pending.append(entry.path)
+                    elif name_matches(entry.name) and entry.is_file():
+                        yield Path(entry.path)
+        except PermissionError:
+            log.debug("Skipping unreadable directory: %s", current)
 
 
 def get_deck_name_from_path(file_path: Path, base_dir: Path | None = None) -> str:
@@ -92,13 +225,16 @@ def get_deck_name_from_path(file_path: Path, base_dir: Path | None = None) -> st
         Generated deck name
     """
     if base_dir is not None:
+        # Plain string arithmetic; this runs once per deck in batch builds
         try:
-            relative = file_path.parent.relative_to(base_dir)
-            if relative != Path("."):
-                parts = relative.parts
-                return "::".join(parts)
+            relative = os.path.relpath(
+                os.path.dirname(file_path) or os.curdir, base_dir
+            )
         except ValueError:
-            pass
+            # Different drives on Windows
+            relative = os.pardir
+        if relative != os.curdir and relative.split(os.sep, 1)[0] != os.pardir:
+            return relative.replace(os.sep, "::")
 
     # Fall back to parent directory name or file stem
     return file_path.parent.name or file_path.stem or "Deck"
@@ -4,8 +4,14 @@ This module provides the AnkiBuilder class for constructing Anki decks
 from configuration and data.
 """
 
+import bisect
+import functools
 import hashlib
+import io
+import json
+import os
 import re
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import TypeAlias
 
@@ -27,6 +33,160 @@ ModelConfigComplete = ModelConfigDictComplete
 ModelMap: TypeAlias = dict[ModelName, genanki.Model]
 """Type alias for a dictionary mapping model names to genanki.Model instances."""
 
+_RE_URL = re.compile(r"https?://[^\s]*")
+_RE_QUERY_INDICATOR = re.compile(r"[?&]")
+_RE_MEDIA = re.compile(r"\[(sound|img):(.+?)\]")
+
+# Longer field values are rarely repeated verbatim; they are neither shared
+# nor memoized
+_SHARED_FIELD_MAX_LEN = 4096
+
+
+def _url_context(text: str) -> Callable[[int], bool] | None:
+    """Return a check for whether a position is likely within a URL.
+
+    The text is searched once; each check is then a bisect. Only the first
+    URL counts: a position is in context if it is inside that URL, or
+    within 100 characters after a later ``?`` or ``&`` (query parameters).
+
+    Returns:
+        The check, or None if the text contains no URL.
+    """
+    match = _RE_URL.search(text)
+    if match is None:
+        return None
+    # Positions before the end of the scheme cannot see the URL yet
+    scheme_end = match.start() + (8 if match.group().startswith("https") else 7)
+    url_end = match.end()
+    indicators = [m.start() for m in _RE_QUERY_INDICATOR.finditer(text, url_end)]
+
+    def in_url(pos: int) -> bool:
+        if pos < scheme_end:
+            return False
+        if pos <= url_end:
+            return True
+        idx = bisect.bisect_left(indicators, pos) - 1
+        return idx >= 0 and pos - indicators[idx] - 1 < 100
+
+    return in_url
+
+
+# Filtered template models are re-derived for every note that uses them,
+# so the same names are hashed over and over
+@functools.lru_cache(maxsize=1024)
+def _stable_id(name: str) -> int:
+    """Return the stable numeric ID for *name*; see AnkiBuilder.stable_id."""
+    # The first four digest bytes, read big-endian, equal int(hexdigest[:8], 16)
+    digest = hashlib.md5(name.encode("utf-8"), usedforsecurity=False).digest()
+    return int.from_bytes(digest[:4], "big")
+
+
+# Batch builds and watch mode construct a builder per deck from the same
+# model configs; identical definitions share one genanki.Model
+@functools.lru_cache(maxsize=128)
+def _build_model(
+    model_id: int,
+    name: str,
+    fields: tuple[str, ...],
+    templates_key: str,
+    css: str,
+) -> genanki.Model:
+    """Return the genanki Model for a definition; see AnkiBuilder._build_models.
+
+    Args:
+        model_id: The model's stable ID.
+        name: The model name.
+        fields: The field names, in order.
+        templates_key: The templates serialized with ``json.dumps``.
+        css: The model stylesheet.
+    """
+    return genanki.Model(
+        model_id,
+        name,
+        fields=[{"name": f} for f in fields],
+        templates=json.loads(templates_key),
+        css=css,
+    )
+
+
+def _convert_math_scan(text: str) -> str:
+    r"""Convert ``$$...$$`` and ``$...$`` to Anki's delimiters in one scan.
+
+    Only the positions of the ``$`` signs are examined; the text between
+    them is copied through untouched. A ``$`` right after a backslash is
+    escaped and never delimits math.
+    """
+    dollars: list[int] = []
+    pos = text.find("$")
+    while pos != -1:
+        if pos == 0 or text[pos - 1] != "\\":
+            dollars.append(pos)
+        pos = text.find("$", pos + 1)
+    if not dollars:
+        return text
+
+    # (start, end, replacement) for each delimiter to rewrite
+    spans: list[tuple[int, int, str]] = []
+
+    # Display math: "$$", non-empty content, then "$$" at the next dollar
+    inline: list[int] = []
+    i, n = 0, len(dollars)
+    while i < n:
+        start = dollars[i]
+        if (
+            i + 3 < n
+            and dollars[i + 1] == start + 1
+            and dollars[i + 2] > start + 2
+            and dollars[i + 3] == dollars[i + 2] + 1
+        ):
+            spans.append((start, start + 2, "\\["))
+            spans.append((dollars[i + 2], dollars[i + 2] + 2, "\\]"))
+            i += 4
+        else:
+            inline.append(start)
+            i += 1
+
+    # Inline math pairs each remaining dollar with the next one on the same
+    # line. A pair inside a URL is left as is but still consumed.
+    in_url = _url_context(text) if len(inline) > 1 else None
+    i, n = 0, len(inline)
+    while i + 1 < n:
+        start, end = inline[i], inline[i + 1]
+        if end > start + 1 and text.find("\n", start + 1, end) == -1:
+            if in_url is None or not in_url(start):
+                spans.append((start, start + 1, "\\("))
+                spans.append((end, end + 1, "\\)"))
+            i += 2
+        else:
+            i += 1
+
+    if not spans:
+        return text
+    spans.sort()
+    parts: list[str] = []
+    last = 0
+    for start, end, replacement in spans:
+        parts.append(text[last:start])
+        parts.append(replacement)
+        last = end
+    parts.append(text[last:])
+    return "".join(parts)
+
+
+# Decks often repeat field values (shared answers, templated prompts), and
+# the conversion is pure, so results for short values are memoized
+_convert_math_cached = functools.lru_cache(maxsize=65536)(_convert_math_scan)
+
+
+def _convert_math(text: str) -> str:
+    """Convert math delimiters, memoizing values short enough to repeat.
+
+    Longer values are scanned directly so the cache size stays bounded.
+    """
+    if len(text) > _SHARED_FIELD_MAX_LEN:
+        return _convert_math_scan(text)
+    return _convert_math_cached(text)
+
 
 class AnkiBuilder:
     """Builder for creating Anki deck packages (.apkg files).
@@ -54,10 +214,20 @@ class AnkiBuilder:
             raise DeckBuildError("At least one model configuration is required")
         self.model_configs: list[ModelConfigComplete] = model_configs
         self.models: ModelMap = self._build_models()
+        # Notes without a model name use the first configured model
+        self._default_model_name: ModelName = next(iter(self.models))
         self.deck: genanki.Deck = genanki.Deck(self.stable_id(deck_name), deck_name)
         self.media_files: MediaFileList = []
         self.media_folder: Path | None = media_folder
+        # Joined with each referenced name instead of resolving every path
+        self._media_folder_abs: str | None = (
+            str(media_folder.absolute()) if media_folder is not None else None
+        )
         self.media_files_set: set[str] = set()
+        # Media references already resolved against media_folder
+        self._scanned_media: set[str] = set()
+        # One copy of each repeated field value, shared by all notes using it
+        self._shared_fields: dict[str, str] = {}
 
     @staticmethod
     def stable_id(name: str) -> int:
@@ -71,8 +241,7 @@ class AnkiBuilder:
         Returns:
             An integer ID derived from the name's hash.
         """
-        digest = hashlib.md5(name.encode("utf-8")).hexdigest()
-        return int(digest[:8], 16)
+        return _stable_id(name)
 
     @staticmethod
     def convert_math_delimiters(text: str) -> str:
@@ -91,112 +260,10 @@ class AnkiBuilder:
         Returns:
             Text with math delimiters converted to Anki LaTeX format.
         """
-        # Use unique placeholders to protect already converted Anki-style delimiters
-        # We use different markers for opening and closing to avoid confusion
-        placeholder_inline_open = "__ANKILATEX_INLINE_OPEN__"
-        placeholder_inline_close = "__ANKILATEX_INLINE_CLOSE__"
-        placeholder_block_open = "__ANKILATEX_BLOCK_OPEN__"
-        placeholder_block_close = "__ANKILATEX_BLOCK_CLOSE__"
-
-        # Protect escaped characters first: \$ and \#
-        # These should not be converted
-        placeholder_escaped_dollar = "__ANKILATEX_ESCAPED_DOLLAR__"
-        placeholder_escaped_hash = "__ANKILATEX_ESCAPED_HASH__"
-
-        # Protect escaped \$ (single backslash before dollar sign)
-        text = re.sub(r"\\\$", placeholder_escaped_dollar, text)
-        # Protect escaped \#
-        text = re.sub(r"\\#", placeholder_escaped_hash, text)
-
-        # Protect already converted Anki-style delimiters \(...\) and \[...\]
-        text = re.sub(
-            r"\\\((.*?)\\\)",
-            lambda m: placeholder_inline_open + m.group(1) + placeholder_inline_close,
-            text,
-            flags=re.DOTALL,
-        )
-        text = re.sub(
-            r"\\\[(.*?)\\\]",
-            lambda m: placeholder_block_open + m.group(1) + placeholder_block_close,
-            text,
-            flags=re.DOTALL,
-        )
-
-        # Helper function to check if we're in a URL context
-        def is_in_url_context(pos: int, txt: str) -> bool:
-            """Check if position is likely within a URL or query string."""
-            if pos == 0:
-                return False
-
-            prefix = txt[:pos]
-
-            # Check for URL scheme
-            url_scheme_match = re.search(r"https?://[^\s]*", prefix)
-            if url_scheme_match:
-                scheme_end = url_scheme_match.end()
-                # Check if current position is within the URL
-                if pos <= scheme_end:
-                    return True
-                # Check for query parameters or path after scheme
-                remaining = prefix[scheme_end:]
-                if "?" in remaining or "&" in remaining:
-                    # Find the last query indicator
-                    last_indicator = max(remaining.rfind("?"), remaining.rfind("&"))
-                    if last_indicator != -1:
-                        # Check if we're within a reasonable distance
-                        if pos - scheme_end - last_indicator - 1 < 100:
-                            return True
-
-            # Check for file paths that might look like URLs
-            # but be more conservative - only if clearly a path
-            if re.search(r"^[a-zA-Z]:[/\\]", prefix) or prefix.startswith("/"):
-                # This is likely a file path, not a URL with query params
-                return False
-
-            return False
-
-        # Replace block math $ ... $ with \[...\]
-        def replace_block_math(match):
-            content = match.group(1)
-            start_pos = match.start()
-            # Check if preceded by backslash (escaped)
-            if start_pos > 0 and text[start_pos - 1] == "\\":
-                return match.group(0)  # Don't convert, it's escaped
-            return "\\[" + content + "\\]"
-
-        text = re.sub(r"\$\$([^$]+?)\$\$", replace_block_math, text, flags=re.DOTALL)
-
-        # Replace inline math $ ... $ with \(...\)
-        def replace_inline_math(match):
-            content = match.group(1)
-            start_pos = match.start()
-
-            # Check if preceded by backslash (escaped like \$)
-            # The placeholder was already applied, so check if the char before is the placeholder
-            if start_pos > 0 and text[start_pos - 1] == "\\":
-                return match.group(0)  # Don't convert, it's escaped
-
-            # Check if in URL context
-            if is_in_url_context(start_pos, text):
-                return match.group(0)  # Don't convert, likely in URL
-
-            return "\\(" + content + "\\)"
-
-        # Replace $...$ but not escaped \$, not in URLs
-        # Use a more precise pattern that excludes \$ by checking it's not preceded by \
-        text = re.sub(r"(?<!\\)\$([^$\n]+?)\$", replace_inline_math, text)
-
-        # Restore protected Anki-style delimiters
-        text = text.replace(placeholder_inline_open, "\\(")
-        text = text.replace(placeholder_inline_close, "\\)")
-        text = text.replace(placeholder_block_open, "\\[")
-        text = text.replace(placeholder_block_close, "\\]")
-
-        # Restore escaped characters
-        text = text.replace(placeholder_escaped_dollar, "\\$")
-        text = text.replace(placeholder_escaped_hash, "\\#")
-
-        return text
+        # Plain fields are the common case; skip hashing them into the cache
+        if "$" not in text:
+            return text
+        return _convert_math(text)
 
     def _build_models(self) -> ModelMap:
         """Build genanki Models from configurations.
@@ -211,14 +278,14 @@ class AnkiBuilder:
         for config in self.model_configs:
             try:
                 model_name: ModelName = config["name"]
-                models[model_name] = genanki.Model(
+                models[model_name] = _build_model(
                     self.stable_id(model_name),
                     model_name,
-                    fields=[{"name": f} for f in config["fields"]],
-                    templates=config["templates"],
-                    css=config.get("css", ""),
+                    tuple(config["fields"]),
+                    json.dumps(config["templates"], sort_keys=True),
+                    config.get("css", ""),
                 )
-            except (KeyError, TypeError) as e:
+            except (KeyError, TypeError, ValueError) as e:
                 raise DeckBuildError(f"Invalid model configuration: {e}") from e
         return models
 
@@ -244,8 +311,8 @@ class AnkiBuilder:
         """
         if model_name is None:
             # Default to the first model
-            model: genanki.Model = list(self.models.values())[0]
-            original_model_name = list(self.models.keys())[0]
+            original_model_name = self._default_model_name
+            model: genanki.Model = self.models[original_model_name]
         elif model_name in self.models:
             model = self.models[model_name]
             original_model_name = model_name
@@ -282,37 +349,139 @@ class AnkiBuilder:
                     )
 
         # Convert math delimiters and scan for media in all field values
-        converted_values: FieldValues = []
-        for value in field_values:
-            converted = self.convert_math_delimiters(value)
-            converted_values.append(converted)
-
-            # Scan for media if media_folder is set
-            if self.media_folder:
-                # Matches [sound:file.mp3] or [img:image.png]
-                # format: [type:filename]
-                media_matches = re.findall(r"\[(sound|img):(.+?)\]", converted)
-                for _, filename in media_matches:
-                    media_path = self.media_folder / filename
-                    if media_path.exists():
-                        self.add_media(media_path)
+        # Checked inline so "$"-free fields skip the call; see
+        # convert_math_delimiters
+        convert = _convert_math
+        converted_values: FieldValues = self._share_fields(
+            [convert(value) if "$" in value else value for value in field_values]
+        )
+        if self.media_folder:
+            for converted in converted_values:
+                self._scan_media(converted)
 
+        # genanki copies the tags into its own list and maps None to empty
         note: genanki.Note = genanki.Note(
-            model=model, fields=converted_values, tags=tags or []
+            model=model, fields=converted_values, tags=tags
         )
         self.deck.add_note(note)
 
+    def add_notes(
+        self,
+        rows: Iterable[tuple[FieldValues, TagList | None, ModelName | None]],
+    ) -> int:
+        """Add many notes to the deck.
+
+        Equivalent to calling :meth:`add_note` for each row, with the
+        per-call lookups done once for the whole batch.
+
+        Args:
+            rows: ``(field_values, tags, model_name)`` tuples; a model name of
+                None uses the first model.
+
+        Returns:
+            The number of notes added.
+
+        Raises:
+            DeckBuildError: If a row names a model not in the builder.
+        """
+        models = self.models
+        default_model = models[self._default_model_name]
+        convert = _convert_math
+        scan_media = self._scan_media if self.media_folder else None
+        share = self._share_fields
+        add = self.deck.add_note
+        count = 0
+        for field_values, tags, model_name in rows:
+            if model_name is None:
+                model = default_model
+            elif model_name in models:
+                model = models[model_name]
+            else:
+                raise DeckBuildError(f"Model '{model_name}' not found in builder")
+
+            converted_values = share(
+                [convert(value) if "$" in value else value for value in field_values]
+            )
+            if scan_media is not None:
+                for converted in converted_values:
+                    scan_media(converted)
+            add(genanki.Note(model=model, fields=converted_values, tags=tags))
+            count += 1
+        return count
+
+    def _share_fields(self, values: FieldValues) -> FieldValues:
+        """Replace field values with the builder's copy of equal strings.
+
+        Parsed files hold a separate string for every occurrence of a
+        repeated value (shared prompts, style fragments); notes keep a
+        reference to one copy instead.
+
+        Args:
+            values: Converted field values; the list is updated in place.
+
+        Returns:
+            The same list.
+        """
+        shared = self._shared_fields.setdefault
+        for i, value in enumerate(values):
+            if len(value) <= _SHARED_FIELD_MAX_LEN:
+                values[i] = shared(value, value)
+        return values
+
+    def _scan_media(self, text: str) -> None:
+        """Add the media files referenced by a field value.
+
+        Matches ``[sound:file.mp3]`` or ``[img:image.png]`` references and
+        adds those found in ``media_folder``.
+
+        Args:
+            text: A converted field value.
+        """
+        folder = self._media_folder_abs
+        assert folder is not None
+        # Most fields reference no media; skip the regex for them
+        if "[" not in text:
+            return
+        scanned = self._scanned_media
+        join = os.path.join
+        normpath = os.path.normpath
+        isfile = os.path.isfile
+        for _, filename in _RE_MEDIA.findall(text):
+            # Shared audio/images recur across notes; each name is looked up
+            # on disk once
+            if filename in scanned:
+                continue
+            scanned.add(filename)
+            # Normalized so "x.png" and "./x.png" are one file, matching
+            # the paths add_media stores
+            media_path = normpath(join(folder, filename))
+            if isfile(media_path):
+                self._add_media_unchecked(media_path)
+
     def add_media(self, file_path: Path) -> None:
         """Add a media file to the deck package.
 
         Args:
             file_path: Path to the media file to include.
         """
-        if file_path.exists():
-            abs_path = str(file_path.absolute())
-            if abs_path not in self.media_files_set:
-                self.media_files.append(abs_path)
-                self.media_files_set.add(abs_path)
+        # Path.absolute() joins relative paths with the cwd in Python code;
+        # os.path.abspath does it faster, and absolute paths are used as is
+        abs_path = (
+            str(file_path) if file_path.is_absolute() else os.path.abspath(file_path)
+        )
+        # Check the already-added set before paying for a stat
+        if abs_path not in self.media_files_set and os.path.isfile(abs_path):
+            self._add_media_unchecked(abs_path)
+
+    def _add_media_unchecked(self, abs_path: str) -> None:
+        """Add a media file the caller has already checked exists.
+
+        Args:
+            abs_path: Absolute path of the media file.
+        """
+        if abs_path not in self.media_files_set:
+            self.media_files.append(abs_path)
+            self.media_files_set.add(abs_path)
 
     def write_to_file(self, output_path: Path) -> None:
         """Write the deck package to an .apkg file.
@@ -329,3 +498,21 @@ class AnkiBuilder:
             package.write_to_file(str(output_path))
         except Exception as e:
             raise DeckBuildError(f"Failed to write package: {e}") from e
+
+    def write_to_buffer(self) -> bytes:
+        """Write the deck package to memory and return the .apkg bytes.
+
+        Returns:
+            The contents of the .apkg file.
+
+        Raises:
+            DeckBuildError: If writing the package fails.
+        """
+        buffer = io.BytesIO()
+        try:
+            package = genanki.Package(self.deck)
+            package.media_files = self.media_files
+            package.write_to_file(buffer)
+        except Exception as e:
+            raise DeckBuildError(f"Failed to write package: {e}") from e
+        return buffer.getvalue()
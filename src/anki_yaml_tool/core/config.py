@@ -9,6 +9,7 @@ Supports advanced YAML features:
 - Conditional Content: Conditional inclusion based on tags or flags
 """
 
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any, cast
 
@@ -16,10 +17,19 @@ import yaml
 from pydantic import ValidationError
 
 from anki_yaml_tool.core import yaml_advanced
-from anki_yaml_tool.core.builder import ModelConfigComplete
 from anki_yaml_tool.core.exceptions import ConfigValidationError, DataValidationError
+from anki_yaml_tool.core.models import ModelConfigDictComplete as ModelConfigComplete
 from anki_yaml_tool.core.validators import DeckFileSchema, ModelConfigSchema
 
+# Result of load_deck_file: (model config, notes, deck name, media folder)
+LoadedDeck = tuple[
+    ModelConfigComplete, list[dict[str, str | list[str]]], str | None, Path | None
+]
+
+_STR_TAG = "tag:yaml.org,2002:str"
+_NULL_TAG = "tag:yaml.org,2002:null"
+_resolver = yaml.resolver.Resolver()
+
 
 def load_model_config(
     config_path: Path | str,
@@ -48,36 +58,36 @@ def load_model_config(
     """
     path = Path(config_path)
 
-    if not path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
-
-    if use_advanced:
-        raw_config = yaml_advanced.load_yaml_advanced(
-            path,
-            env_vars=env_vars,
-            jinja_templates=jinja_templates,
-            jinja_context=jinja_context,
-            conditional=False,  # Don't filter config
-        )
-    else:
-        with open(path, encoding="utf-8") as f:
-            raw_config = yaml.safe_load(f)
+    # A missing file surfaces from the load itself; no separate exists()
+    try:
+        if use_advanced:
+            raw_config = yaml_advanced.load_yaml_advanced(
+                path,
+                env_vars=env_vars,
+                jinja_templates=jinja_templates,
+                jinja_context=jinja_context,
+                conditional=False,  # Don't filter config
+            )
+        else:
+            with open(path, "rb") as f:
+                raw_config = yaml_advanced.load_yaml_stream(f)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from e
 
     if not raw_config:
         raise ConfigValidationError("Config file is empty", str(config_path))
 
     # Use Pydantic for validation
     try:
-        validated_config = ModelConfigSchema(**raw_config)
+        validated_config = ModelConfigSchema.model_validate(raw_config)
         # Convert Pydantic model back to dict for compatibility
         return cast(ModelConfigComplete, validated_config.model_dump())
     except ValidationError as e:
         # Convert Pydantic validation errors to ConfigValidationError
-        error_messages = []
-        for error in e.errors():
-            field = " -> ".join(str(loc) for loc in error["loc"])
-            msg = error["msg"]
-            error_messages.append(f"{field}: {msg}")
+        error_messages = [
+            f"{' -> '.join(map(str, error['loc']))}: {error['msg']}"
+            for error in e.errors()
+        ]
 
         raise ConfigValidationError(
             "Invalid configuration:\n  " + "\n  ".join(error_messages),
@@ -114,21 +124,22 @@ def load_deck_data(
     """
     path = Path(data_path)
 
-    if not path.exists():
-        raise FileNotFoundError(f"Data file not found: {data_path}")
-
-    if use_advanced:
-        items = yaml_advanced.load_yaml_advanced(
-            path,
-            env_vars=env_vars,
-            jinja_templates=jinja_templates,
-            jinja_context=jinja_context,
-            conditional=True,
-            include_tags=include_tags,
-        )
-    else:
-        with open(path, encoding="utf-8") as f:
-            items = yaml.safe_load(f)
+    # A missing file surfaces from the load itself; no separate exists()
+    try:
+        if use_advanced:
+            items = yaml_advanced.load_yaml_advanced(
+                path,
+                env_vars=env_vars,
+                jinja_templates=jinja_templates,
+                jinja_context=jinja_context,
+                conditional=True,
+                include_tags=include_tags,
+            )
+        else:
+            with open(path, "rb") as f:
+                items = yaml_advanced.load_yaml_stream(f)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Data file not found: {data_path}") from e
 
     if not items:
         raise DataValidationError("Data file is empty", str(data_path))
@@ -151,9 +162,7 @@ def load_deck_file(
     jinja_templates: bool = True,
     jinja_context: dict[str, Any] | None = None,
     include_tags: list[str] | None = None,
-) -> tuple[
-    ModelConfigComplete, list[dict[str, str | list[str]]], str | None, Path | None
-]:
+) -> LoadedDeck:
     """Load a single deck file containing both configuration and data.
 
     Args:
@@ -178,21 +187,24 @@ def load_deck_file(
     """
     path = Path(deck_path)
 
-    if not path.exists():
-        raise FileNotFoundError(f"Deck file not found: {deck_path}")
-
-    if use_advanced:
-        raw_deck = yaml_advanced.load_yaml_advanced(
-            path,
-            env_vars=env_vars,
-            jinja_templates=jinja_templates,
-            jinja_context=jinja_context,
-            conditional=True,
-            include_tags=include_tags,
-        )
-    else:
-        with open(path, encoding="utf-8") as f:
-            raw_deck = yaml.safe_load(f)
+    # Missing files surface from the load itself rather than an exists()
+    # check, saving a stat per deck
+    try:
+        if use_advanced:
+            raw_deck = yaml_advanced.load_yaml_advanced(
+                path,
+                env_vars=env_vars,
+                jinja_templates=jinja_templates,
+                jinja_context=jinja_context,
+                conditional=True,
+                include_tags=include_tags,
+            )
+        else:
+            with open(path, "rb") as f:
+                # libyaml's loader when available, as for advanced loads
+                raw_deck = yaml_advanced.load_yaml_stream(f)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Deck file not found: {deck_path}") from e
 
     if not raw_deck:
         raise ConfigValidationError("Deck file is empty", str(deck_path))
@@ -228,20 +240,22 @@ def load_deck_file(
             media_folder = str(media_folder)
         # Resolve relative to deck file location
         resolved_path = (path.parent / media_folder).resolve()
+        # The result depends on whether the folder exists
+        yaml_advanced.record_file_dependency(resolved_path)
         # Only return the path if it actually exists
         if resolved_path.exists():
             media_folder_path = resolved_path
 
     # Validate the entire deck file using DeckFileSchema
     try:
-        validated = DeckFileSchema(**raw_deck)
+        validated = DeckFileSchema.model_validate(raw_deck)
         model_config = cast(ModelConfigComplete, validated.config.model_dump())
     except ValidationError as e:
-        error_messages = []
-        for error in e.errors():
-            field = " -> ".join(str(loc) for loc in error["loc"])
-            msg = error["msg"]
-            error_messages.append(f"{field}: {msg}")
+        # errors() builds a new list on every call
+        errors = e.errors()
+        error_messages = [
+            f"{' -> '.join(map(str, error['loc']))}: {error['msg']}" for error in errors
+        ]
 
         # Route to the appropriate exception type based on error location
         config_fields = {
@@ -252,7 +266,7 @@ def load_deck_file(
             "media_folder",
         }
         has_config_error = any(
-            str(err["loc"][0]) in config_fields for err in e.errors() if err["loc"]
+            str(err["loc"][0]) in config_fields for err in errors if err["loc"]
         )
         if has_config_error:
             raise ConfigValidationError(
@@ -279,3 +293,123 @@ def load_deck_file(
         raise DataValidationError("'data' section is empty", str(deck_path))
 
     return model_config, data_section, deck_name, media_folder_path
+
+
+def _peek_scalar(event: yaml.Event) -> tuple[bool, str | None]:
+    """Interpret the event holding a ``deck-name`` value for :func:`peek_deck_name`."""
+    if not isinstance(event, yaml.ScalarEvent) or event.tag not in (None, "!"):
+        return False, None
+    tag = _resolver.resolve(yaml.ScalarNode, event.value, event.implicit)
+    if tag == _NULL_TAG:
+        return True, None
+    if tag != _STR_TAG:
+        return False, None  # e.g. a number, which a full load turns into str
+    if "$" in event.value or "{{" in event.value or "{%" in event.value:
+        return False, None  # Environment variables or templates
+    return True, event.value
+
+
+def _skip_node(events: Iterator[yaml.Event], first: yaml.Event) -> None:
+    """Consume the events of the node starting with *first*."""
+    depth = 0
+    event = first
+    while True:
+        if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+            depth += 1
+        elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+            depth -= 1
+        if depth == 0:
+            return
+        event = next(events)
+
+
+def peek_deck_name(deck_path: Path | str) -> tuple[bool, str | None]:
+    """Read the deck name of a deck file without loading its notes.
+
+    Walks the YAML event stream instead of building the document, and
+    stops as soon as a top-level ``deck-name`` is found. Nothing is
+    validated.
+
+    Args:
+        deck_path: Path to the deck YAML file.
+
+    Returns:
+        A tuple ``(known, deck_name)``. ``known`` is False when the name
+        can only be resolved by :func:`load_deck_file` (includes, aliases,
+        merge keys, environment variables, templates, non-string values or
+        malformed YAML); ``deck_name`` is then None.
+    """
+    unknown: tuple[bool, str | None] = (False, None)
+    config_name: str | None = None
+
+    with open(deck_path, "rb") as f:
+        events = iter(yaml.parse(f, Loader=yaml_advanced.SafeLoader))
+        try:
+            next(events)  # StreamStartEvent
+            document = next(events)
+            top = next(events)
+            if not isinstance(document, yaml.DocumentStartEvent) or not (
+                isinstance(top, yaml.MappingStartEvent) and top.tag is None
+            ):
+                return unknown
+
+            while not isinstance(key := next(events), yaml.MappingEndEvent):
+                value = next(events)
+                if not isinstance(key, yaml.ScalarEvent) or key.value == "<<":
+                    return unknown
+                if key.value == "deck-name":
+                    known, name = _peek_scalar(value)
+                    if not known:
+                        return unknown
+                    if name:
+                        # The top-level name wins over the config one
+                        return True, name
+                elif key.value == "config":
+                    if not (
+                        isinstance(value, yaml.MappingStartEvent) and value.tag is None
+                    ):
+                        return unknown
+                    while not isinstance(
+                        config_key := next(events), yaml.MappingEndEvent
+                    ):
+                        config_value = next(events)
+                        if (
+                            not isinstance(config_key, yaml.ScalarEvent)
+                            or config_key.value == "<<"
+                        ):
+                            return unknown
+                        if config_key.value == "deck-name":
+                            known, config_name = _peek_scalar(config_value)
+                            if not known:
+                                return unknown
+                        else:
+                            _skip_node(events, config_value)
+                else:
+                    _skip_node(events, value)
+        except (yaml.YAMLError, StopIteration):
+            return unknown
+
+    return True, config_name or None
+
+
+def read_deck_name(deck_path: Path | str) -> str | None:
+    """Return the deck name of a deck file, loading it only when needed.
+
+    Uses :func:`peek_deck_name` and falls back to :func:`load_deck_file`
+    when the name cannot be read from the event stream.
+
+    Args:
+        deck_path: Path to the deck YAML file.
+
+    Returns:
+        The deck name, or None if the file does not set one.
+
+    Raises:
+        ConfigValidationError: If the fallback load finds invalid configuration.
+        DataValidationError: If the fallback load finds invalid data.
+        FileNotFoundError: If the deck file doesn't exist.
+    """
+    known, deck_name = peek_deck_name(deck_path)
+    if not known:
+        _, _, deck_name, _ = load_deck_file(deck_path)
+    return deck_name
@@ -8,14 +8,26 @@ protocol via structural subtyping – no explicit inheritance is required.
 """
 
 import base64
+import bisect
+import json
 import logging
+import threading
 from pathlib import Path
 from typing import Any, cast
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from anki_yaml_tool.core.exceptions import AnkiConnectError
 
+# Try to import orjson, make it optional (much faster for large media payloads)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE: bool = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Logger for this module
 logger = logging.getLogger("anki_yaml_tool.core.connector")
 
@@ -23,6 +35,16 @@ logger = logging.getLogger("anki_yaml_tool.core.connector")
 JSONValue = dict[str, "JSONValue"] | list["JSONValue"] | str | int | float | bool | None
 
 
+def _dump_json(payload: Any) -> bytes:
+    """Serialize an AnkiConnect request payload to UTF-8 JSON bytes.
+
+    Uses orjson when it is installed and falls back to the standard library.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
 class AnkiConnector:
     """Client for interacting with AnkiConnect API.
 
@@ -51,7 +73,21 @@ class AnkiConnector:
         self.url = url
         self.timeout_short = timeout_short
         self.timeout_long = timeout_long
+        # One keep-alive session for every call. The pool is sized for the
+        # concurrent pushes of batch-build, which share a connector.
         self._session = requests.Session()
+        self._session.headers["Content-Type"] = "application/json"
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        # Deck names as last listed, kept up to date by create_deck
+        self._deck_names: list[str] | None = None
+        # Set of _deck_names for membership tests, updated alongside it
+        self._deck_name_set: set[str] | None = None
+        # Read-only snapshot of _deck_name_set handed out to callers
+        self._deck_name_frozen: frozenset[str] | None = None
+        # Guards the three caches above across the threads of batch-build
+        self._deck_lock = threading.RLock()
 
     def invoke(self, action: str, **params: JSONValue | int) -> JSONValue:
         """Invoke an AnkiConnect API action.
@@ -77,7 +113,11 @@ class AnkiConnector:
             "params": params,
         }
         try:
-            response = self._session.post(self.url, json=payload, timeout=timeout)
+            response = self._session.post(
+                self.url,
+                data=_dump_json(payload),
+                timeout=timeout,
+            )
             response.raise_for_status()
         except requests.exceptions.ConnectionError as e:
             raise AnkiConnectError(
@@ -91,6 +131,40 @@ class AnkiConnector:
             raise AnkiConnectError(f"AnkiConnect Error: {data['error']}", action=action)
         return cast(JSONValue, data.get("result"))
 
+    def invoke_multi(
+        self, actions: list[dict[str, Any]]
+    ) -> list[tuple[JSONValue, str | None]]:
+        """Invoke several AnkiConnect actions in a single request.
+
+        Uses AnkiConnect's `multi` action. Each sub-action reports its own
+        result or error, so one failing action does not hide the others.
+
+        Args:
+            actions: Action objects with ``action`` and optional ``params`` keys.
+
+        Returns:
+            A ``(result, error)`` pair for each action, in request order.
+
+        Raises:
+            AnkiConnectError: If the request itself fails.
+        """
+        if not actions:
+            return []
+        # Versioned sub-actions always answer with a {"result", "error"} object
+        versioned = [{**a, "version": 6} for a in actions]
+        results = self.invoke("multi", actions=cast(JSONValue, versioned))
+        if not isinstance(results, list) or len(results) != len(actions):
+            raise AnkiConnectError("Unexpected response from multi", action="multi")
+
+        pairs: list[tuple[JSONValue, str | None]] = []
+        for r in results:
+            if isinstance(r, dict):
+                error = r.get("error")
+                pairs.append((r.get("result"), str(error) if error else None))
+            else:
+                pairs.append((r, None))
+        return pairs
+
     def import_package(self, apkg_path: Path) -> bool | None:
         """Import an .apkg file into Anki.
 
@@ -124,6 +198,8 @@ class AnkiConnector:
                 )
 
         self.invoke("importPackage", path=path_str, _timeout=self.timeout_long)
+        # The package may have added decks
+        self.invalidate_cache()
         self.invoke("reloadCollection")
         return True
 
@@ -150,8 +226,9 @@ class AnkiConnector:
         if not filename:
             filename = file_path.name
 
-        content = file_path.read_bytes()
-        encoded = base64.b64encode(content).decode("utf-8")
+        # Encode straight from the read so the raw bytes are not kept alive
+        # alongside the (4/3 larger) base64 text during the request.
+        encoded = base64.b64encode(file_path.read_bytes()).decode("ascii")
         self.invoke(
             "storeMediaFile",
             filename=filename,
@@ -174,14 +251,85 @@ class AnkiConnector:
         """Context manager exit."""
         self.close()
 
-    def get_deck_names(self) -> list[str]:
-        """Return a sorted list of deck names available in Anki."""
-        result = self.invoke("deckNames")
-        if not isinstance(result, list):
-            raise AnkiConnectError(
-                "Unexpected response for deckNames", action="deckNames"
-            )
-        return sorted([str(x) for x in result])
+    def get_version(self) -> int:
+        """Return the AnkiConnect API version.
+
+        This is the cheapest action AnkiConnect offers, so it doubles as a
+        check that Anki is reachable.
+
+        Raises:
+            AnkiConnectError: If Anki cannot be reached.
+        """
+        result = self.invoke("version")
+        if not isinstance(result, int):
+            raise AnkiConnectError("Unexpected response for version", action="version")
+        return result
+
+    def get_deck_names(self, refresh: bool = False) -> list[str]:
+        """Return a sorted list of deck names available in Anki.
+
+        The list is fetched once and reused by later calls on this
+        connector; decks added through :meth:`create_deck` are included.
+
+        Args:
+            refresh: Fetch the list from Anki even if it is cached.
+        """
+        with self._deck_lock:
+            if self._deck_names is None or refresh:
+                result = self.invoke("deckNames")
+                if not isinstance(result, list):
+                    raise AnkiConnectError(
+                        "Unexpected response for deckNames", action="deckNames"
+                    )
+                self._deck_names = sorted([str(x) for x in result])
+                self._deck_name_set = set(self._deck_names)
+                self._deck_name_frozen = None
+            return list(self._deck_names)
+
+    def get_deck_name_set(self) -> frozenset[str]:
+        """Return the deck names available in Anki as a set.
+
+        Shares the cache of :meth:`get_deck_names`; use this for existence
+        checks, which are constant time on a set.
+        """
+        with self._deck_lock:
+            if self._deck_name_frozen is None:
+                if self._deck_name_set is None:
+                    self.get_deck_names()
+                assert self._deck_name_set is not None
+                self._deck_name_frozen = frozenset(self._deck_name_set)
+            return self._deck_name_frozen
+
+    def create_deck(self, deck_name: str) -> None:
+        """Create a deck in Anki unless it is already known to exist.
+
+        Args:
+            deck_name: Name of the deck to create.
+
+        Raises:
+            AnkiConnectError: If creating the deck fails.
+        """
+        with self._deck_lock:
+            known = self._deck_name_set
+            if known is not None and deck_name in known:
+                return
+        self.invoke("createDeck", deck=deck_name)
+        with self._deck_lock:
+            known = self._deck_name_set
+            if self._deck_names is not None and known is not None:
+                if deck_name in known:
+                    return  # Added by another thread meanwhile
+                # Updated in place; batch pushes create decks one after another
+                bisect.insort(self._deck_names, deck_name)
+                known.add(deck_name)
+                self._deck_name_frozen = None
+
+    def invalidate_cache(self) -> None:
+        """Forget cached deck names so the next lookup asks Anki again."""
+        with self._deck_lock:
+            self._deck_names = None
+            self._deck_name_set = None
+            self._deck_name_frozen = None
 
     def get_model_names(self) -> list[str]:
         """Return a sorted list of model names available in Anki."""
@@ -262,6 +410,22 @@ class AnkiConnector:
                 f"Failed to decode media file {filename}: {e}"
             ) from e
 
+    def get_media_file_names(self, pattern: str = "*") -> list[str]:
+        """Return the names of media files in Anki's collection.
+
+        Uses AnkiConnect's `getMediaFilesNames` action.
+
+        Args:
+            pattern: Glob-style pattern the filenames must match.
+        """
+        result = self.invoke("getMediaFilesNames", pattern=pattern)
+        if not isinstance(result, list):
+            raise AnkiConnectError(
+                "Unexpected response from getMediaFilesNames",
+                action="getMediaFilesNames",
+            )
+        return [str(x) for x in result]
+
     def update_note_fields(self, note_id: int, fields: dict[str, str]) -> None:
         """Update the fields of an existing note.
 
@@ -293,6 +457,58 @@ class AnkiConnector:
             raise AnkiConnectError("Unexpected response from addNote", action="addNote")
         return result
 
+    def update_notes_fields(
+        self, updates: list[tuple[int, dict[str, str]]]
+    ) -> list[str | None]:
+        """Update the fields of several notes in one request.
+
+        Sends one `updateNoteFields` action per note through
+        :meth:`invoke_multi`.
+
+        Args:
+            updates: ``(note_id, fields)`` pairs.
+
+        Returns:
+            The error message for each update, or None where it succeeded.
+
+        Raises:
+            AnkiConnectError: If the request itself fails.
+        """
+        actions: list[dict[str, Any]] = [
+            {"action": "updateNoteFields", "params": {"note": {"id": nid, "fields": f}}}
+            for nid, f in updates
+        ]
+        return [error for _, error in self.invoke_multi(actions)]
+
+    def add_notes(self, specs: list[dict[str, Any]]) -> list[int | None]:
+        """Add several notes in one request.
+
+        Each spec is an AnkiConnect note object (``deckName``, ``modelName``,
+        ``fields`` and optional ``tags``). The notes are sent as `addNote`
+        actions through :meth:`invoke_multi`, so a rejected note (e.g. a
+        duplicate) does not stop the rest from being added.
+
+        Args:
+            specs: Note objects to add.
+
+        Returns:
+            The new note id for each spec, or None where adding it failed.
+
+        Raises:
+            AnkiConnectError: If the request itself fails.
+        """
+        actions: list[dict[str, Any]] = [
+            {"action": "addNote", "params": {"note": spec}} for spec in specs
+        ]
+        note_ids: list[int | None] = []
+        for result, error in self.invoke_multi(actions):
+            if error is None and isinstance(result, int):
+                note_ids.append(result)
+            else:
+                logger.debug(f"addNote failed: {error}")
+                note_ids.append(None)
+        return note_ids
+
     def create_model(
         self,
         model_name: str,
@@ -0,0 +1,187 @@
+"""On-disk cache of parsed deck files.
+
+Parsing deck YAML dominates large batch builds, yet deck files rarely
+change between runs. This module stores the result of
+:func:`~anki_yaml_tool.core.config.load_deck_file` as JSON in a cache
+directory and reuses it while the deck, every file it ``!include``s and
+every environment variable it substitutes are unchanged.
+
+The cache needs the optional ``orjson`` package (``pip install
+anki-yaml-tool[speedups]``); without it decks are always parsed.
+
+Usage:
+    from anki_yaml_tool.core.deck_cache import load_deck_file_cached
+
+    model_config, items, deck_name, media = load_deck_file_cached(
+        "deck.yaml", Path(".anki-yaml-cache")
+    )
+"""
+
+import hashlib
+import math
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from anki_yaml_tool.core import yaml_advanced
+from anki_yaml_tool.core.config import LoadedDeck, load_deck_file
+from anki_yaml_tool.core.logging_config import get_logger
+
+# Try to import orjson, make it optional
+try:
+    import orjson
+
+    ORJSON_AVAILABLE: bool = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+log = get_logger("deck_cache")
+
+# Bump when the layout of cache entries changes
+DECK_CACHE_VERSION = 1
+
+
+def _cache_entry_path(deck_path: Path, cache_dir: Path) -> Path:
+    """Return the cache file used for *deck_path*."""
+    digest = hashlib.sha1(str(deck_path).encode("utf-8")).hexdigest()
+    return cache_dir / f"{digest}.json"
+
+
+def _file_signature(path: Path) -> list[int] | None:
+    """Return ``[mtime_ns, size]`` for *path*, or None if it cannot be read."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _read_entry(entry_path: Path, deck_path: Path) -> LoadedDeck | None:
+    """Return the cached deck from *entry_path* if it is still valid."""
+    try:
+        entry: dict[str, Any] = orjson.loads(entry_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+    if entry.get("version") != DECK_CACHE_VERSION or entry.get("deck") != str(
+        deck_path
+    ):
+        return None
+
+    for source, signature in entry["files"].items():
+        if _file_signature(Path(source)) != signature:
+            return None
+    for name, value in entry["env_vars"].items():
+        if os.environ.get(name) != value:
+            return None
+
+    model_config, items, deck_name, media_folder = entry["result"]
+    return (
+        model_config,
+        items,
+        deck_name,
+        Path(media_folder) if media_folder is not None else None,
+    )
+
+
+def _has_non_finite_float(value: Any) -> bool:
+    """Return whether *value* holds a NaN or infinite float at any depth.
+
+    orjson writes these as ``null``, so a cached result would differ from
+    a fresh parse.
+    """
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return False
+
+
+def _write_entry(
+    entry_path: Path,
+    deck_path: Path,
+    loaded: LoadedDeck,
+    deps: yaml_advanced.LoadDependencies,
+) -> None:
+    """Store *loaded* in *entry_path*, skipping decks JSON cannot represent."""
+    model_config, items, deck_name, media_folder = loaded
+    files: dict[str, list[int]] = {}
+    for source in deps.files:
+        signature = _file_signature(source)
+        if signature is None:
+            # e.g. a media folder that does not exist yet; there is nothing
+            # to compare against later, so the result is not cached
+            return
+        files[str(source)] = signature
+
+    entry = {
+        "version": DECK_CACHE_VERSION,
+        "deck": str(deck_path),
+        "files": files,
+        "env_vars": deps.env_vars,
+        "result": [
+            model_config,
+            items,
+            deck_name,
+            str(media_folder) if media_folder is not None else None,
+        ],
+    }
+    if _has_non_finite_float(entry["result"]):
+        log.debug("Not caching %s: contains NaN or infinite values", deck_path)
+        return
+    try:
+        # Dates are passed through to the (absent) default so they raise
+        # instead of silently coming back as strings
+        data = orjson.dumps(entry, option=orjson.OPT_PASSTHROUGH_DATETIME)
+    except TypeError as e:
+        log.debug("Not caching %s: %s", deck_path, e)
+        return
+
+    # Write to a temporary file first so readers never see a partial entry
+    tmp_path = entry_path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+    try:
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, entry_path)
+    except OSError as e:
+        log.debug("Could not write deck cache for %s: %s", deck_path, e)
+        tmp_path.unlink(missing_ok=True)
+
+
+def load_deck_file_cached(deck_path: Path | str, cache_dir: Path) -> LoadedDeck:
+    """Load a deck file, reusing a cached parse when its inputs are unchanged.
+
+    Args:
+        deck_path: Path to the deck YAML file.
+        cache_dir: Directory holding cache entries (created when needed).
+
+    Returns:
+        The same tuple as :func:`~anki_yaml_tool.core.config.load_deck_file`.
+
+    Raises:
+        ConfigValidationError: If the deck file has invalid configuration.
+        DataValidationError: If the deck file has invalid data.
+        FileNotFoundError: If the deck file doesn't exist.
+    """
+    if not ORJSON_AVAILABLE:
+        return load_deck_file(deck_path)
+
+    path = Path(deck_path).resolve()
+    entry_path = _cache_entry_path(path, cache_dir)
+
+    cached = _read_entry(entry_path, path)
+    if cached is not None:
+        log.debug("Deck cache hit: %s", path)
+        return cached
+
+    with yaml_advanced.track_dependencies() as deps:
+        loaded = load_deck_file(deck_path)
+    _write_entry(entry_path, path, loaded, deps)
+    return loaded
@@ -8,18 +8,21 @@ the same logic can be reused by the future GUI or any other frontend.
 from __future__ import annotations
 
 import base64
+import io
 import json
 import logging
 import re
 import zipfile
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import cast
+from typing import Any, cast
 
 from anki_yaml_tool.core.adapter import AnkiAdapter
 from anki_yaml_tool.core.builder import AnkiBuilder, ModelConfigComplete
-from anki_yaml_tool.core.config import load_deck_file
-from anki_yaml_tool.core.exceptions import MediaMissingError
+from anki_yaml_tool.core.config import LoadedDeck, load_deck_file
+from anki_yaml_tool.core.exceptions import DeckBuildError, MediaMissingError
 from anki_yaml_tool.core.media import (
     discover_media_files,
     get_media_references,
@@ -33,6 +36,13 @@ from anki_yaml_tool.core.validators import (
 
 logger = logging.getLogger("anki_yaml_tool.core.deck_service")
 
+# Number of concurrent media upload requests per pushed package
+MEDIA_UPLOAD_WORKERS = 4
+# Maximum number of media files sent per AnkiConnect ``multi`` request
+MEDIA_UPLOAD_BATCH_SIZE = 10
+# Maximum uncompressed bytes per ``multi`` request; a larger file goes alone
+MEDIA_UPLOAD_BATCH_BYTES = 8 * 1024 * 1024
+
 
 # ---------------------------------------------------------------------------
 # Data classes for service results
@@ -85,6 +95,8 @@ class BuildResult:
         notes_processed: Number of notes written.
         media_files: Number of media files added.
         missing_media_refs: Filenames of referenced but missing media.
+        package_data: The ``.apkg`` bytes, when requested via
+            ``keep_package_data``.
     """
 
     output_path: Path
@@ -92,6 +104,7 @@ class BuildResult:
     notes_processed: int = 0
     media_files: int = 0
     missing_media_refs: list[str] = field(default_factory=list)
+    package_data: bytes | None = field(default=None, repr=False)
 
 
 # ---------------------------------------------------------------------------
@@ -200,6 +213,43 @@ def _get_empty_fields_for_templates(
     return empty_by_template
 
 
+def get_field_values(
+    item: dict,
+    fields: Sequence[str],
+    fields_lower: Sequence[str] | None = None,
+) -> list[str]:
+    """Return the values of *fields* from a note item, matched case-insensitively.
+
+    Keys spelled exactly like the model field (or already lowercased) are
+    looked up directly; the lowercased copy of the item is only built when
+    a field is not found that way.
+
+    Args:
+        item: Note data dictionary.
+        fields: Model field names, in order.
+        fields_lower: Optional precomputed lowercase versions of *fields*.
+
+    Returns:
+        The field values as strings, ``""`` for missing fields.
+    """
+    if fields_lower is None:
+        fields_lower = [f.lower() for f in fields]
+
+    values: list[str] = []
+    item_lower: dict | None = None
+    for f, f_lower in zip(fields, fields_lower, strict=True):
+        if f in item:
+            value = item[f]
+        elif f_lower in item:
+            value = item[f_lower]
+        else:
+            if item_lower is None:
+                item_lower = {k.lower(): v for k, v in item.items()}
+            value = item_lower.get(f_lower, "")
+        values.append(str(value))
+    return values
+
+
 def _process_notes(
     items: list[dict],
     model_configs: list[ModelConfigComplete],
@@ -226,6 +276,9 @@ def _process_notes(
     model_fields_map: dict[str, list[str]] = {
         cfg["name"]: cfg["fields"] for cfg in model_configs
     }
+    model_fields_lower_map: dict[str, list[str]] = {
+        name: [f.lower() for f in fields] for name, fields in model_fields_map.items()
+    }
     # Map model names to their configs for template analysis
     model_config_map: dict[str, ModelConfigComplete] = {
         cfg["name"]: cfg for cfg in model_configs
@@ -253,8 +306,9 @@ def _process_notes(
         model_config = model_config_map[target_model_name]
 
         # Case-insensitive field lookup
-        item_lower = {k.lower(): v for k, v in item.items()}
-        field_values = [str(item_lower.get(f.lower(), "")) for f in fields]
+        field_values = get_field_values(
+            item, fields, model_fields_lower_map[target_model_name]
+        )
 
         # Check for empty required fields in templates
         empty_by_template = _get_empty_fields_for_templates(item, model_config, fields)
@@ -385,6 +439,8 @@ def build_deck(
     deck_name_override: str | None = None,
     media_dir_override: str | Path | None = None,
     skip_individual_empty_cards: bool = False,
+    keep_package_data: bool = False,
+    preloaded: LoadedDeck | None = None,
 ) -> BuildResult:
     """Build an ``.apkg`` file from a YAML deck file.
 
@@ -401,6 +457,11 @@ def build_deck(
             the same note. For example, if "Lectura alternativa" is empty, the
             card "Numeral arábigo -> Lectura alternativa" will be skipped but
             other cards from the same note will still be created.
+        keep_package_data: If True, also return the written ``.apkg`` bytes
+            in :attr:`BuildResult.package_data` so a following
+            :func:`push_apkg` does not have to read the file back.
+        preloaded: Result of an earlier :func:`load_deck_file` call for
+            ``deck_path``; when given, the YAML is not parsed again.
 
     Returns:
         A :class:`BuildResult` with details of the build.
@@ -413,8 +474,10 @@ def build_deck(
     deck_path = Path(deck_path)
     output_path = Path(output_path)
 
-    logger.info("Loading deck file: %s", deck_path)
-    model_config, items, file_deck_name, file_media_dir = load_deck_file(deck_path)
+    if preloaded is None:
+        logger.info("Loading deck file: %s", deck_path)
+        preloaded = load_deck_file(deck_path)
+    model_config, items, file_deck_name, file_media_dir = preloaded
     model_configs = cast(list[ModelConfigComplete], [model_config])
 
     final_deck_name = _resolve_deck_name(deck_name_override, file_deck_name, deck_path)
@@ -435,7 +498,15 @@ def build_deck(
     )
     media_count, missing_refs = _add_media(builder, media_folder, all_media_refs)
 
-    builder.write_to_file(output_path)
+    package_data: bytes | None = None
+    if keep_package_data:
+        package_data = builder.write_to_buffer()
+        try:
+            output_path.write_bytes(package_data)
+        except OSError as e:
+            raise DeckBuildError(f"Failed to write package: {e}") from e
+    else:
+        builder.write_to_file(output_path)
     logger.info(
         "Built successfully: %d notes (%d skipped), %d media files",
         notes_processed,
@@ -449,6 +520,7 @@ def build_deck(
         notes_processed=notes_processed,
         media_files=media_count,
         missing_media_refs=missing_refs,
+        package_data=package_data,
     )
 
 
@@ -544,11 +616,106 @@ def validate_deck(
     return result
 
 
+def _store_media_batch(
+    zf: zipfile.ZipFile,
+    connector: AnkiAdapter,
+    batch: list[tuple[str, str]],
+) -> None:
+    """Upload a batch of media members of an ``.apkg`` archive to Anki.
+
+    All files of the batch are sent in one AnkiConnect ``multi`` request.
+    Failures are logged and swallowed so one bad file does not abort the
+    whole push.
+
+    Args:
+        zf: The open ``.apkg`` archive.
+        connector: An :class:`AnkiAdapter` implementation.
+        batch: ``(archive member name, target filename)`` pairs.
+    """
+    actions: list[dict[str, Any]] = []
+    filenames: list[str] = []
+    for idx, filename in batch:
+        try:
+            with zf.open(idx) as member:
+                encoded = base64.b64encode(member.read()).decode("ascii")
+        except KeyError:
+            logger.warning("Media file %s not found in apkg", idx)
+            continue
+        except Exception as e:
+            # Corrupt members (bad CRC, broken deflate stream) only lose
+            # that one file
+            logger.warning("Failed to read media file %s from apkg: %s", idx, e)
+            continue
+        actions.append(
+            {
+                "action": "storeMediaFile",
+                "params": {"filename": filename, "data": encoded},
+            }
+        )
+        filenames.append(filename)
+
+    if not actions:
+        return
+
+    try:
+        results = connector.invoke_multi(actions)
+    except Exception as e:
+        logger.warning("Failed to store %s: %s", ", ".join(filenames), e)
+        return
+
+    for filename, (_, error) in zip(filenames, results, strict=True):
+        if error is not None:
+            logger.warning("Failed to store %s: %s", filename, error)
+        else:
+            logger.debug("Stored media: %s", filename)
+
+
+def _batch_media(
+    zf: zipfile.ZipFile, entries: list[tuple[str, str]]
+) -> list[list[tuple[str, str]]]:
+    """Group media entries into upload batches.
+
+    A batch holds at most ``MEDIA_UPLOAD_BATCH_SIZE`` files and, unless it
+    is a single oversized file, at most ``MEDIA_UPLOAD_BATCH_BYTES`` of
+    uncompressed data.
+
+    Args:
+        zf: The open ``.apkg`` archive.
+        entries: ``(archive member name, target filename)`` pairs.
+
+    Returns:
+        The batches, in the order of *entries*.
+    """
+    batches: list[list[tuple[str, str]]] = []
+    batch: list[tuple[str, str]] = []
+    batch_bytes = 0
+    for idx, filename in entries:
+        try:
+            size = zf.getinfo(idx).file_size
+        except KeyError:
+            # Reported as missing when the batch is uploaded
+            size = 0
+        if batch and (
+            len(batch) >= MEDIA_UPLOAD_BATCH_SIZE
+            or batch_bytes + size > MEDIA_UPLOAD_BATCH_BYTES
+        ):
+            batches.append(batch)
+            batch = []
+            batch_bytes = 0
+        batch.append((idx, filename))
+        batch_bytes += size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
 def push_apkg(
     apkg_path: str | Path,
     connector: AnkiAdapter,
     *,
     sync: bool = False,
+    package_data: bytes | None = None,
+    existing_media: set[str] | None = None,
 ) -> None:
     """Import an ``.apkg`` file into Anki.
 
@@ -559,6 +726,12 @@ def push_apkg(
         apkg_path: Path to the ``.apkg`` file.
         connector: An :class:`AnkiAdapter` implementation.
         sync: Whether to trigger an AnkiWeb sync after import.
+        package_data: Optional in-memory contents of *apkg_path*. When
+            given, media is extracted from it instead of re-reading the
+            file; Anki still imports from *apkg_path*.
+        existing_media: Optional names of media files already present in
+            Anki (see ``get_media_file_names``). These are not uploaded
+            again, so changed files with an unchanged name are kept as-is.
 
     Raises:
         FileNotFoundError: If the ``.apkg`` file doesn't exist.
@@ -568,23 +741,37 @@ def push_apkg(
     logger.info("Pushing %s to Anki...", apkg_path)
 
     # Extract and store media from apkg
-    with zipfile.ZipFile(apkg_path, "r") as zf:
-        if "media" in zf.namelist():
-            media_map: dict[str, str] = json.loads(zf.read("media").decode("utf-8"))
+    source = io.BytesIO(package_data) if package_data is not None else apkg_path
+    with zipfile.ZipFile(source, "r") as zf:
+        # Look the index up by name (a dict hit) rather than scanning namelist()
+        try:
+            media_index = zf.read("media")
+        except KeyError:
+            media_index = b""
+        if media_index:
+            media_map: dict[str, str] = json.loads(media_index)
+            if existing_media:
+                media_map = {
+                    idx: filename
+                    for idx, filename in media_map.items()
+                    if filename not in existing_media
+                }
             if media_map:
                 logger.info("Storing %d media files", len(media_map))
-                for idx, filename in media_map.items():
-                    try:
-                        content = zf.read(idx)
-                        encoded = base64.b64encode(content).decode("utf-8")
-                        connector.invoke(
-                            "storeMediaFile", filename=filename, data=encoded
-                        )  # type: ignore[attr-defined]
-                        logger.debug("Stored media: %s", filename)
-                    except KeyError:
-                        logger.warning("Media file %s not found in apkg", idx)
-                    except Exception as e:
-                        logger.warning("Failed to store %s: %s", filename, e)
+                # Uploads are network-bound: group them into ``multi``
+                # requests to cut round-trips and overlap the requests.
+                # Batches are capped by size, so the encoded data held in
+                # memory is bounded by the number of workers.
+                batches = _batch_media(zf, list(media_map.items()))
+                workers = min(MEDIA_UPLOAD_WORKERS, len(batches))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(_store_media_batch, zf, connector, batch)
+                        for batch in batches
+                    ]
+                    # Re-raise anything a worker did not handle itself
+                    for future in futures:
+                        future.result()
 
     # Import
     connector.import_package(apkg_path)
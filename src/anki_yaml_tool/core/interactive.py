@@ -63,7 +63,8 @@ def run_interactive(input_func: Callable[[], str] | None = None) -> None:
 
             if choice == "1":
                 try:
-                    decks = connector.get_deck_names()
+                    # Decks may have changed in Anki since the last listing
+                    decks = connector.get_deck_names(refresh=True)
                     click.echo("Available decks:")
                     for d in decks:
                         click.echo(f"  - {d}")
@@ -33,13 +33,22 @@ class ClickHandler(logging.Handler):
         logging.CRITICAL: "bright_red",
     }
 
+    # ANSI start sequence per colored level, built once rather than by a
+    # click.style call per record
+    STYLE_STARTS = {
+        level: click.style("", fg=color, reset=False)
+        for level, color in COLORS.items()
+        if color
+    }
+    STYLE_RESET = click.style("", reset=True)
+
     def emit(self, record: logging.LogRecord) -> None:
         """Emit a log record using click.echo."""
         try:
             msg = self.format(record)
-            color = self.COLORS.get(record.levelno)
-            if color:
-                msg = click.style(msg, fg=color)
+            start = self.STYLE_STARTS.get(record.levelno)
+            if start:
+                msg = f"{start}{msg}{self.STYLE_RESET}"
             click.echo(msg, err=record.levelno >= logging.WARNING)
         except (OSError, ValueError):
             self.handleError(record)
@@ -21,6 +21,9 @@ from anki_yaml_tool.core.media import get_media_references
 # Logger for this module
 logger = logging.getLogger("anki_yaml_tool.core.pusher")
 
+# Maximum number of notes sent to AnkiConnect in one request
+PUSH_BATCH_SIZE = 100
+
 
 def _compute_note_hash(
     note_id: int | None, fields: dict[str, str], tags: list[str]
@@ -41,6 +44,16 @@ def _normalize_fields(fields: dict[str, Any]) -> dict[str, str]:
     return result
 
 
+def _is_note_not_found(error_msg: str) -> bool:
+    """Return True if an AnkiConnect error means the note does not exist."""
+    error_msg = error_msg.lower()
+    return (
+        "not found" in error_msg
+        or "invalid id" in error_msg
+        or ("note" in error_msg and "does not exist" in error_msg)
+    )
+
+
 def _map_fields_for_model(model_fields: list[str], data_item: dict) -> dict[str, str]:
     """Return a mapping of model field names to values based on the data item.
 
@@ -77,7 +90,7 @@ def _push_deck_data(
 
     # Ensure deck exists
     try:
-        connector.invoke("createDeck", deck=target_deck)
+        connector.create_deck(target_deck)
     except AnkiConnectError as e:
         logger.warning(f"Failed to ensure deck exists: {e}")
 
@@ -321,6 +334,97 @@ def _push_deck_data(
             except (ValueError, TypeError):
                 pass
 
+    # Notes are sent to Anki in batches, one request per batch. Entries are
+    # (index in items, note id, fields, tags); for adds the id is the missing
+    # note being replaced, if any.
+    model_name_str = str(model_config.get("name", ""))
+    pending_updates: list[tuple[int, int, dict[str, str], list[str]]] = []
+    pending_adds: list[tuple[int, int | None, dict[str, str], list[str]]] = []
+
+    def flush_updates() -> None:
+        batch = pending_updates[:]
+        pending_updates.clear()
+        if not batch:
+            return
+        try:
+            errors = connector.update_notes_fields(
+                [(nid_int, fields) for _, nid_int, fields, _ in batch]
+            )
+        except AnkiConnectError as e:
+            logger.error(f"Failed to update {len(batch)} notes: {e}")
+            stats["failed"] += len(batch)
+            return
+
+        # addTags applies one tag string to many notes, so group by tags
+        tag_groups: dict[str, list[int]] = {}
+        for (idx, nid_int, fields, tags), error in zip(batch, errors, strict=True):
+            if error is None:
+                stats["updated"] += 1
+                logger.debug(f"Updated note ID {nid_int}")
+                if tags:
+                    tag_groups.setdefault(" ".join(tags), []).append(nid_int)
+            elif _is_note_not_found(error):
+                # Fallback: create a new note since the original note doesn't exist
+                logger.warning(
+                    f"Note with ID {nid_int} not found, creating as new note (index {idx + 1}/{len(items)})"
+                )
+                pending_adds.append((idx, nid_int, fields, tags))
+            else:
+                logger.error(
+                    f"Failed to process note (index {idx + 1}/{len(items)}): {error}"
+                )
+                stats["failed"] += 1
+
+        # Add tags (won't remove existing tags)
+        tag_actions: list[dict[str, Any]] = [
+            {"action": "addTags", "params": {"notes": note_ids, "tags": tag_str}}
+            for tag_str, note_ids in tag_groups.items()
+        ]
+        try:
+            tag_results = connector.invoke_multi(tag_actions)
+        except AnkiConnectError as e:
+            logger.error(f"Failed to add tags: {e}")
+            return
+        for (_, error), action in zip(tag_results, tag_actions, strict=True):
+            if error is not None:
+                logger.error(
+                    f"Failed to add tags to {action['params']['notes']}: {error}"
+                )
+
+    def flush_adds() -> None:
+        batch = pending_adds[:]
+        pending_adds.clear()
+        if not batch:
+            return
+        specs: list[dict[str, Any]] = [
+            {
+                "deckName": str(target_deck),
+                "modelName": model_name_str,
+                "fields": fields,
+                "tags": tags,
+            }
+            for _, _, fields, tags in batch
+        ]
+        try:
+            new_nids = connector.add_notes(specs)
+        except AnkiConnectError as e:
+            logger.error(f"Failed to create {len(batch)} notes: {e}")
+            stats["failed"] += len(batch)
+            return
+
+        for (idx, missing_nid, _, _), new_nid in zip(batch, new_nids, strict=True):
+            if new_nid is None:
+                logger.error(f"Failed to create note (index {idx + 1}/{len(items)})")
+                stats["failed"] += 1
+            elif missing_nid is not None:
+                stats["added"] += 1
+                logger.debug(
+                    f"Created new note with ID {new_nid} as fallback for missing note {missing_nid}"
+                )
+            else:
+                stats["added"] += 1
+                logger.debug(f"Created new note with ID {new_nid}")
+
     # Process each note from YAML
     for idx, item in enumerate(items):
         item_dict = cast(dict[str, Any], item)
@@ -370,73 +474,26 @@ def _push_deck_data(
             except (ValueError, TypeError):
                 pass
 
-        try:
-            if nid is not None:
-                # Coerce nid to int safely
-                nid_int = int(str(nid))
-                # Check if note exists in Anki (for replace mode)
-                if replace and nid_int not in existing_notes:
-                    # Note was deleted in YAML, skip (don't create)
-                    logger.debug(
-                        f"Note {nid_int} not in existing notes, skipping update"
-                    )
-                    stats["unchanged"] += 1
-                    continue
-
-                # Update existing note
-                connector.update_note_fields(nid_int, mapped_fields)
-                # Add tags (won't remove existing tags)
-                if tags:
-                    connector.invoke("addTags", notes=[nid_int], tags=" ".join(tags))
-                stats["updated"] += 1
-                logger.debug(f"Updated note ID {nid_int}")
-            else:
-                # Create a new note
-                new_nid = connector.add_note(
-                    str(target_deck),
-                    str(model_config.get("name", "")),
-                    mapped_fields,
-                    tags,
-                )
-                stats["added"] += 1
-                logger.debug(f"Created new note with ID {new_nid}")
-        except AnkiConnectError as e:
-            # Check if the error is because the note doesn't exist
-            error_msg = str(e).lower()
-            note_not_found = (
-                "not found" in error_msg
-                or "invalid id" in error_msg
-                or ("note" in error_msg and "does not exist" in error_msg)
-            )
+        if nid is not None:
+            # Coerce nid to int safely
+            nid_int = int(str(nid))
+            # Check if note exists in Anki (for replace mode)
+            if replace and nid_int not in existing_notes:
+                # Note was deleted in YAML, skip (don't create)
+                logger.debug(f"Note {nid_int} not in existing notes, skipping update")
+                stats["unchanged"] += 1
+                continue
+            pending_updates.append((idx, nid_int, mapped_fields, tags))
+            if len(pending_updates) >= PUSH_BATCH_SIZE:
+                flush_updates()
+        else:
+            pending_adds.append((idx, None, mapped_fields, tags))
+        if len(pending_adds) >= PUSH_BATCH_SIZE:
+            flush_adds()
 
-            if nid is not None and note_not_found:
-                # Fallback: create a new note since the original note doesn't exist
-                logger.warning(
-                    f"Note with ID {nid} not found, creating as new note (index {idx + 1}/{len(items)})"
-                )
-                try:
-                    new_nid = connector.add_note(
-                        str(target_deck),
-                        str(model_config.get("name", "")),
-                        mapped_fields,
-                        tags,
-                    )
-                    stats["added"] += 1
-                    logger.debug(
-                        f"Created new note with ID {new_nid} as fallback for missing note {nid}"
-                    )
-                except AnkiConnectError:
-                    # If creation also fails, log error and continue
-                    logger.error(
-                        f"Failed to create note (index {idx + 1}/{len(items)}): {e}"
-                    )
-                    stats["failed"] += 1
-            else:
-                # For other errors, log and continue
-                logger.error(
-                    f"Failed to process note (index {idx + 1}/{len(items)}): {e}"
-                )
-                stats["failed"] += 1
+    # Updates go first: notes they cannot find are queued as adds
+    flush_updates()
+    flush_adds()
 
     # Handle replace mode: delete notes in Anki that are not in YAML
     if replace and yaml_note_ids:
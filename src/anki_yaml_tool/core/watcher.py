@@ -7,7 +7,6 @@ rebuild and optionally push Anki decks when source files change.
 import signal
 import sys
 import threading
-import time
 from collections.abc import Callable
 from pathlib import Path
 
@@ -227,6 +226,7 @@ class FileWatcher:
         observer.start()
         self._observer = observer
         self._running = True
+        self._stop_event.clear()
 
         log.info("Watching %s for changes...", self.watch_path)
 
@@ -241,20 +241,29 @@ class FileWatcher:
             self._debounced_callback.cancel()
 
         self._running = False
+        self._stop_event.set()
         log.info("Stopped watching for changes")
 
     def is_running(self) -> bool:
         """Check if the watcher is currently running."""
         return self._running
 
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the watcher is stopped.
 
-def wait_for_keyboard_interrupt() -> None:
-    """Wait for keyboard interrupt (Ctrl+C) in a cross-platform way."""
-    try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        pass
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait
+                indefinitely
+
+        Returns:
+            True if the watcher stopped, False if the timeout expired
+
+        Note:
+            On Windows an untimed wait is not interrupted by Ctrl+C, so
+            callers that need to handle it should wait in a loop with a
+            timeout.
+        """
+        return self._stop_event.wait(timeout)
 
 
 def run_watcher(
@@ -291,6 +300,8 @@ def run_watcher(
 
     try:
         watcher.start(on_change)
-        wait_for_keyboard_interrupt()
+        # Bounded waits: an untimed wait is not woken by Ctrl+C on Windows
+        while not watcher.wait(1.0):
+            pass
     finally:
         watcher.stop()
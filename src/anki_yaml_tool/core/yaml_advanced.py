@@ -12,22 +12,38 @@ Usage:
     data = load_yaml_advanced("deck.yaml")
 """
 
+import functools
+import importlib.util
 import os
 import re
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 import yaml
 from yaml import nodes
 
-# Try to import Jinja2, make it optional
+# Prefer the libyaml-backed (C) loader; fall back to the pure Python one
+# when PyYAML was built without libyaml.
 try:
-    from jinja2 import Template as JinjaTemplate
-
-    JINJA2_AVAILABLE: bool = True
+    from yaml import CSafeLoader as SafeLoader
 except ImportError:
-    JINJA2_AVAILABLE = False
-    JinjaTemplate = None  # type: ignore[misc,assignment]
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+# Jinja2 is optional and slow to import, so it is only located here and
+# imported the first time a template is rendered
+JINJA2_AVAILABLE: bool = importlib.util.find_spec("jinja2") is not None
+
+
+@functools.cache
+def _jinja_template_class() -> Any:
+    """Import and return ``jinja2.Template``."""
+    from jinja2 import Template
+
+    return Template
 
 
 class YAMLIncludeError(Exception):
@@ -48,20 +64,63 @@ class YAMLConditionalError(Exception):
     pass
 
 
-# Global base directory for includes (set during loading)
-_base_dir_global: Path | None = None
+# Base directory for includes (set during loading). Kept per thread so
+# decks can be loaded concurrently without resolving each other's includes.
+_include_state = threading.local()
 
 
 def _get_base_dir() -> Path:
     """Get the base directory for includes."""
-    global _base_dir_global
-    return _base_dir_global or Path.cwd()
+    base_dir: Path | None = getattr(_include_state, "base_dir", None)
+    return base_dir or Path.cwd()
 
 
-def _set_base_dir(base_dir: Path) -> None:
+def _set_base_dir(base_dir: Path | None) -> None:
     """Set the base directory for includes."""
-    global _base_dir_global
-    _base_dir_global = base_dir
+    _include_state.base_dir = base_dir
+
+
+@dataclass
+class LoadDependencies:
+    """Inputs read while loading YAML, as recorded by :func:`track_dependencies`.
+
+    Attributes:
+        files: Every YAML file read, including ``!include`` targets, plus
+            any other path passed to :func:`record_file_dependency`.
+        env_vars: Environment variables looked up, mapped to their value
+            (``None`` when unset).
+    """
+
+    files: set[Path] = field(default_factory=set)
+    env_vars: dict[str, str | None] = field(default_factory=dict)
+
+
+@contextmanager
+def track_dependencies() -> Iterator[LoadDependencies]:
+    """Record the files and environment variables read by loads in this thread.
+
+    Usage:
+        with track_dependencies() as deps:
+            data = load_yaml_advanced("deck.yaml")
+        # deps.files and deps.env_vars now describe what data depends on
+    """
+    previous = getattr(_include_state, "dependencies", None)
+    deps = LoadDependencies()
+    _include_state.dependencies = deps
+    try:
+        yield deps
+    finally:
+        _include_state.dependencies = previous
+
+
+def record_file_dependency(path: Path) -> None:
+    """Note that the data being loaded depends on *path* (files or folders).
+
+    Does nothing unless called inside :func:`track_dependencies`.
+    """
+    deps: LoadDependencies | None = getattr(_include_state, "dependencies", None)
+    if deps is not None:
+        deps.files.add(path.resolve())
 
 
 def _resolve_include_path(path: str | list) -> tuple[Path, str | None]:
@@ -96,11 +155,11 @@ def _load_include_file(path: str | list) -> Any:
     """
     resolved_path, key = _resolve_include_path(path)
 
-    if not resolved_path.exists():
-        raise YAMLIncludeError(f"Include file not found: {resolved_path}")
-
     # Recursively use advanced loading for included files
-    included_data = load_yaml_advanced(resolved_path)
+    try:
+        included_data = load_yaml_advanced(resolved_path)
+    except FileNotFoundError as e:
+        raise YAMLIncludeError(f"Include file not found: {resolved_path}") from e
 
     if key is not None:
         if isinstance(included_data, dict) and key in included_data:
@@ -112,7 +171,7 @@ def _load_include_file(path: str | list) -> Any:
     return included_data
 
 
-def _include_constructor(loader: yaml.SafeLoader, node: nodes.Node) -> Any:
+def _include_constructor(loader: SafeLoader, node: nodes.Node) -> Any:
     """Constructor for !include directive."""
     if isinstance(node, nodes.ScalarNode):
         return _load_include_file(loader.construct_scalar(node))
@@ -122,7 +181,7 @@ def _include_constructor(loader: yaml.SafeLoader, node: nodes.Node) -> Any:
 
 
 # Create custom loader class with !include support
-class IncludeLoader(yaml.SafeLoader):
+class IncludeLoader(SafeLoader):
     """Custom YAML loader that supports !include directive.
 
     Usage in YAML:
@@ -141,6 +200,28 @@ class IncludeLoader(yaml.SafeLoader):
 
 IncludeLoader.add_constructor("!include", _include_constructor)
 
+# Files up to this size are read whole and parsed from bytes; larger ones
+# are streamed so the raw bytes and the parsed tree are not both held
+_WHOLE_READ_MAX = 16 * 1024 * 1024
+
+
+def load_yaml_stream(f: BinaryIO, loader: type[SafeLoader] = SafeLoader) -> Any:
+    """Parse YAML from a file opened in binary mode.
+
+    libyaml decodes the bytes itself, so reading the file in one call
+    leaves only the parse on the Python side.
+
+    Args:
+        f: The open file
+        loader: Loader class to parse with
+
+    Returns:
+        The parsed YAML data
+    """
+    if os.fstat(f.fileno()).st_size > _WHOLE_READ_MAX:
+        return yaml.load(f, Loader=loader)
+    return yaml.load(f.read(), Loader=loader)
+
 
 def substitute_env_vars(data: Any, pattern: str = r"\$\{(\w+)\}|\$(\w+)") -> Any:
     """Substitute environment variables in strings.
@@ -155,10 +236,15 @@ def substitute_env_vars(data: Any, pattern: str = r"\$\{(\w+)\}|\$(\w+)") -> Any
         Data with environment variables substituted
     """
     if isinstance(data, str):
+        deps: LoadDependencies | None = getattr(_include_state, "dependencies", None)
+
         # Substitute environment variables
         def replace_env_var(match: re.Match) -> str:
             var_name = match.group(1) or match.group(2)
-            return os.environ.get(var_name, match.group(0))
+            value = os.environ.get(var_name)
+            if deps is not None:
+                deps.env_vars[var_name] = value
+            return match.group(0) if value is None else value
 
         return re.sub(pattern, replace_env_var, data)
 
@@ -185,7 +271,7 @@ def process_jinja_templates(data: Any, context: dict[str, Any] | None = None) ->
     Returns:
         Data with templates rendered
     """
-    if not JINJA2_AVAILABLE or JinjaTemplate is None:
+    if not JINJA2_AVAILABLE:
         return data
 
     context = context or {}
@@ -200,7 +286,7 @@ def process_jinja_templates(data: Any, context: dict[str, Any] | None = None) ->
             # Otherwise, check if it looks like a valid template
             if has_context or _looks_like_jinja_template(data):
                 try:
-                    template = JinjaTemplate(data, autoescape=False)
+                    template = _jinja_template_class()(data, autoescape=False)
                     return template.render(**context)
                 except Exception as e:
                     raise YAMLTemplateError(f"Template rendering error: {e}") from e
@@ -213,7 +299,8 @@ def process_jinja_templates(data: Any, context: dict[str, Any] | None = None) ->
             if isinstance(key, str) and ("{{" in key or "{%" in key):
                 if has_context or _looks_like_jinja_template(key):
                     try:
-                        key = JinjaTemplate(key, autoescape=False).render(**context)
+                        template = _jinja_template_class()(key, autoescape=False)
+                        key = template.render(**context)
                     except Exception as e:
                         raise YAMLTemplateError(
                             f"Template rendering error in key: {e}"
@@ -377,9 +464,7 @@ def load_yaml_advanced(
         FileNotFoundError: If file doesn't exist
     """
     path = Path(file_path)
-
-    if not path.exists():
-        raise FileNotFoundError(f"YAML file not found: {file_path}")
+    record_file_dependency(path)
 
     # Determine base directory for includes
     resolved_base_dir: Path
@@ -388,15 +473,21 @@ def load_yaml_advanced(
     else:
         resolved_base_dir = base_dir.resolve()
 
-    # Set global base dir for include resolution
-    global _base_dir_global
-    old_base_dir = _base_dir_global
+    # Set base dir for include resolution
+    old_base_dir = getattr(_include_state, "base_dir", None)
     try:
-        _base_dir_global = resolved_base_dir
+        _set_base_dir(resolved_base_dir)
+
+        # A missing file fails on open, so no separate exists() check (and
+        # its extra stat) is needed
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"YAML file not found: {file_path}") from e
 
         # Load YAML with !include support
-        with open(path, encoding="utf-8") as f:
-            data = yaml.load(f, Loader=IncludeLoader)
+        with f:
+            data = load_yaml_stream(f, IncludeLoader)
 
         # Process environment variables
         if env_vars:
@@ -416,7 +507,7 @@ def load_yaml_advanced(
         return data
     finally:
         # Restore previous base dir
-        _base_dir_global = old_base_dir
+        _set_base_dir(old_base_dir)
 
 
 # Convenience function for loading deck files with advanced features
@@ -1,5 +1,8 @@
 """Tests for the AnkiBuilder class."""
 
+import os
+from pathlib import Path
+
 import pytest
 
 from anki_yaml_tool.core.builder import AnkiBuilder
@@ -14,6 +17,12 @@ def test_stable_id_consistency():
     assert id1 == id2, "stable_id should return the same ID for the same name"
 
 
+def test_stable_id_value_is_unchanged():
+    """Test that IDs match earlier releases, so re-imports update decks in place."""
+    # First 8 hex digits of md5("Test Deck")
+    assert AnkiBuilder.stable_id("Test Deck") == 0x68DA2F9F
+
+
 def test_stable_id_uniqueness():
     """Test that stable_id generates different IDs for different inputs."""
     id1 = AnkiBuilder.stable_id("Deck A")
@@ -113,6 +122,34 @@ def test_write_to_file(tmp_path):
     assert output_path.stat().st_size > 0
 
 
+def test_write_to_buffer():
+    """Test writing the deck to an in-memory .apkg archive."""
+    import io
+    import zipfile
+
+    config = {
+        "name": "Test Model",
+        "fields": ["Front", "Back"],
+        "templates": [
+            {
+                "name": "Card 1",
+                "qfmt": "{{Front}}",
+                "afmt": "{{FrontSide}}<hr id=answer>{{Back}}",
+            }
+        ],
+    }
+    builder = AnkiBuilder("Test Deck", [config])
+    builder.add_note(["Question", "Answer"])
+
+    data = builder.write_to_buffer()
+
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        assert "collection.anki2" in zf.namelist()
+        assert "media" in zf.namelist()
+        # Members are stored, so already-compressed media is not deflated again
+        assert all(info.compress_type == zipfile.ZIP_STORED for info in zf.infolist())
+
+
 def test_add_media(tmp_path):
     """Test adding media files to the deck."""
     config = {
@@ -137,6 +174,23 @@ def test_add_media(tmp_path):
     assert str(media_file.absolute()) in builder.media_files
 
 
+def test_add_media_relative_path(tmp_path, monkeypatch):
+    """Test that relative media paths are stored as absolute paths."""
+    config = {
+        "name": "Test Model",
+        "fields": ["Front", "Back"],
+        "templates": [{"name": "Card 1", "qfmt": "{{Front}}", "afmt": "{{Back}}"}],
+    }
+    builder = AnkiBuilder("Test Deck", [config])
+    (tmp_path / "test_image.jpg").write_text("fake image content")
+    monkeypatch.chdir(tmp_path)
+
+    builder.add_media(Path("test_image.jpg"))
+    builder.add_media(tmp_path / "test_image.jpg")
+
+    assert builder.media_files == [str(tmp_path / "test_image.jpg")]
+
+
 def test_add_media_nonexistent_file(tmp_path):
     """Test that add_media ignores nonexistent files."""
     config = {
@@ -158,6 +212,112 @@ def test_add_media_nonexistent_file(tmp_path):
     assert len(builder.media_files) == 0
 
 
+def test_add_media_ignores_directories(tmp_path):
+    """Test that add_media only packages regular files."""
+    config = {
+        "name": "Test Model",
+        "fields": ["Front", "Back"],
+        "templates": [{"name": "Card 1", "qfmt": "{{Front}}", "afmt": "{{Back}}"}],
+    }
+    builder = AnkiBuilder("Test Deck", [config], media_folder=tmp_path)
+    (tmp_path / "images").mkdir()
+
+    builder.add_media(tmp_path / "images")
+    builder.add_note(["Q", "[img:images]"])
+
+    assert builder.media_files == []
+
+
+def test_add_notes_matches_add_note():
+    """Test that add_notes builds the same notes as repeated add_note calls."""
+    configs = [
+        {
+            "name": name,
+            "fields": ["Front", "Back"],
+            "templates": [{"name": "Card 1", "qfmt": "{{Front}}", "afmt": "{{Back}}"}],
+        }
+        for name in ("Model A", "Model B")
+    ]
+    rows = [
+        (["$x$", "A1"], ["t1"], None),
+        (["Q2", "A2"], None, "Model B"),
+    ]
+    one_by_one = AnkiBuilder("Deck", configs)
+    for fields, tags, model_name in rows:
+        one_by_one.add_note(fields, tags=tags, model_name=model_name)
+    batched = AnkiBuilder("Deck", configs)
+
+    assert batched.add_notes(rows) == 2
+    for got, want in zip(batched.deck.notes, one_by_one.deck.notes, strict=True):
+        assert (got.model.name, got.fields, got.tags) == (
+            want.model.name,
+            want.fields,
+            want.tags,
+        )
+    with pytest.raises(DeckBuildError):
+        batched.add_notes([(["Q", "A"], None, "Unknown")])
+
+
+def test_add_note_normalizes_media_paths(tmp_path):
+    """Test that spellings of one media path are packaged once."""
+    config = {
+        "name": "Test Model",
+        "fields": ["Front", "Back"],
+        "templates": [{"name": "Card 1", "qfmt": "{{Front}}", "afmt": "{{Back}}"}],
+    }
+    (tmp_path / "img").mkdir()
+    (tmp_path / "img" / "x.png").write_bytes(b"fake image")
+    builder = AnkiBuilder("Test Deck", [config], media_folder=tmp_path)
+
+    builder.add_media(tmp_path / "img" / "x.png")
+    builder.add_note(["[img:img/x.png]", "[img:./img/x.png] [img:img//x.png]"])
+
+    assert builder.media_files == [str(tmp_path / "img" / "x.png")]
+
+
+def test_add_note_shares_repeated_field_values():
+    """Test that equal field values in different notes are one object."""
+    config = {
+        "name": "Test Model",
+        "fields": ["Front", "Back"],
+        "templates": [{"name": "Card 1", "qfmt": "{{Front}}", "afmt": "{{Back}}"}],
+    }
+    builder = AnkiBuilder("Test Deck", [config])
+    answer = "".join(["shared ", "answer"])
+
+    builder.add_note(["Q1", answer])
+    builder.add_notes([(["Q2", "".join(["shared ", "answer"])], None, None)])
+
+    first, second = builder.deck.notes
+    assert second.fields[1] == answer
+    assert second.fields[1] is first.fields[1]
+
+
+def test_add_note_resolves_shared_media_once(tmp_path, monkeypatch):
+    """Test that media referenced by many notes is looked up on disk once."""
+    config = {
+        "name": "Test Model",
+        "fields": ["Front", "Back"],
+        "templates": [{"name": "Card 1", "qfmt": "{{Front}}", "afmt": "{{Back}}"}],
+    }
+    (tmp_path / "hello.mp3").write_bytes(b"fake audio")
+    builder = AnkiBuilder("Test Deck", [config], media_folder=tmp_path)
+
+    checked = []
+    real_isfile = os.path.isfile
+    monkeypatch.setattr(
+        os.path,
+        "isfile",
+        lambda path: checked.append(os.path.basename(path)) or real_isfile(path),
+    )
+    for i in range(3):
+        builder.add_note([f"Q{i}", "[sound:hello.mp3] [sound:missing.mp3]"])
+
+    assert len(builder.media_files) == 1
+    assert checked.count("hello.mp3") == 1
+    assert checked.count("missing.mp3") == 1
+
+
 def test_convert_math_delimiters_inline():
     """Test converting inline math delimiters $...$ to \\(...\\)."""
     text = "The equation is $x^2 + y^2 = r^2$ and that's math."
@@ -212,6 +372,15 @@ def test_convert_math_delimiters_url_not_converted():
     assert result == "Check https://example.com?price=$100 for info."
 
 
+def test_convert_math_delimiters_after_url():
+    """Test that math well after a URL's query parameters is converted again."""
+    prefix = "See https://example.com/search and &page=2"
+    near = f"{prefix} $x$"
+    far = f"{prefix} {'word ' * 25}$x$"
+    assert AnkiBuilder.convert_math_delimiters(near) == near
+    assert AnkiBuilder.convert_math_delimiters(far).endswith(r"\(x\)")
+
+
 def test_convert_math_delimiters_mixed():
     """Test mixed inline and block math in the same text."""
     text = "Inline $x+y$ and block $a^2+b^2=c^2$ formula."
@@ -222,6 +391,40 @@ def test_convert_math_delimiters_mixed():
     assert "a^2+b^2=c^2" in result
 
 
+def test_convert_math_delimiters_pairing():
+    """Test how dollars pair up around escapes, newlines and display math."""
+    convert = AnkiBuilder.convert_math_delimiters
+    assert convert("$$a$$ and $b$") == r"\[a\] and \(b\)"
+    assert convert(r"$a \$ b$") == r"\(a \$ b\)"
+    # Inline math does not span lines; the second dollar starts a new pair
+    assert convert("$a\nb$ c$") == "$a\nb\\( c\\)"
+    # A "$$" without a closing "$$" is read as two single dollars
+    assert convert("$$x$ y") == r"$\(x\) y"
+
+
+def test_convert_math_delimiters_reuses_results():
+    """Test that repeated field values are converted once."""
+    from anki_yaml_tool.core.builder import _convert_math_cached
+
+    text = "Repeated $e^{i\\pi}$ field"
+    first = AnkiBuilder.convert_math_delimiters(text)
+    hits = _convert_math_cached.cache_info().hits
+    assert AnkiBuilder.convert_math_delimiters(text) == first
+    assert _convert_math_cached.cache_info().hits == hits + 1
+
+
+def test_convert_math_delimiters_does_not_cache_long_values():
+    """Test that values too long to be repeated bypass the cache."""
+    from anki_yaml_tool.core.builder import _convert_math_cached
+
+    text = "$x$ " + "a" * 5000
+    size = _convert_math_cached.cache_info().currsize
+    misses = _convert_math_cached.cache_info().misses
+    assert AnkiBuilder.convert_math_delimiters(text) == "\\(x\\) " + "a" * 5000
+    assert _convert_math_cached.cache_info().currsize == size
+    assert _convert_math_cached.cache_info().misses == misses
+
+
 def test_convert_math_delimiters_empty():
     """Test with empty string."""
     result = AnkiBuilder.convert_math_delimiters("")
@@ -235,6 +438,12 @@ def test_convert_math_delimiters_no_math():
     assert result == "This is plain text without math."
 
 
+def test_convert_math_delimiters_no_dollar_returns_input():
+    """Test that fields without a dollar sign are returned untouched."""
+    for text in ("<b>plain</b> text", r"Already \(x\) and \[y\], \# escaped"):
+        assert AnkiBuilder.convert_math_delimiters(text) is text
+
+
 def test_builder_multiple_models():
     """Test AnkiBuilder with multiple model configurations."""
     config1 = {
@@ -265,3 +474,21 @@ def test_builder_multiple_models():
     # Add note with non-existent model
     with pytest.raises(DeckBuildError, match="Model 'Unknown' not found"):
         builder.add_note(["X"], model_name="Unknown")
+
+
+def test_builders_share_identical_models():
+    """Builders with the same model config reuse one genanki Model."""
+    config = {
+        "name": "Shared Model",
+        "fields": ["Front", "Back"],
+        "templates": [{"name": "Card 1", "qfmt": "{{Front}}", "afmt": "{{Back}}"}],
+    }
+    changed = {**config, "css": ".card { color: red; }"}
+
+    first = AnkiBuilder("Deck A", [config])
+    second = AnkiBuilder("Deck B", [dict(config)])
+    third = AnkiBuilder("Deck C", [changed])
+
+    assert first.models["Shared Model"] is second.models["Shared Model"]
+    assert first.models["Shared Model"] is not third.models["Shared Model"]
+    assert third.models["Shared Model"].css == ".card { color: red; }"
@@ -4,6 +4,8 @@ This module contains tests for the `batch-build` command and
 the batch processing utilities.
 """
 
+from unittest.mock import patch
+
 import pytest
 import yaml
 from click.testing import CliRunner
@@ -17,6 +19,15 @@ def runner():
     return CliRunner()
 
 
+@pytest.fixture
+def anki_reachable(monkeypatch):
+    """Make the pre-push AnkiConnect check succeed without a running Anki."""
+    monkeypatch.setattr(
+        "anki_yaml_tool.core.connector.AnkiConnector.get_version",
+        lambda self: 6,
+    )
+
+
 @pytest.fixture
 def sample_deck_content():
     """Return sample deck YAML content."""
@@ -72,6 +83,33 @@ class TestBatchBuildCommand:
             assert "Found 1 deck files" in result.output
             assert "Successfully built" in result.output
 
+    def test_batch_build_cache_dir_without_orjson_warns(
+        self, runner, tmp_path, monkeypatch, sample_deck_content
+    ):
+        """Test that --cache-dir reports it is inactive when orjson is missing."""
+        monkeypatch.setattr("anki_yaml_tool.core.deck_cache.ORJSON_AVAILABLE", False)
+        deck_file = tmp_path / "deck.yaml"
+        deck_file.write_text(yaml.dump(sample_deck_content), encoding="utf-8")
+        cache_dir = tmp_path / "cache"
+
+        result = runner.invoke(
+            cli,
+            [
+                "batch-build",
+                "-f",
+                str(deck_file),
+                "-o",
+                str(tmp_path),
+                "--cache-dir",
+                str(cache_dir),
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "--cache-dir needs the 'orjson' package" in result.stderr
+        assert "Successfully built" in result.output
+        assert not cache_dir.exists()
+
     def test_batch_build_multiple_files(self, runner, tmp_path, sample_deck_content):
         """Test batch-build with multiple files."""
         deck1 = tmp_path / "deck1.yaml"
@@ -97,6 +135,98 @@ class TestBatchBuildCommand:
             assert "Found 2 deck files" in result.output
             assert "Successfully built 2/2" in result.output
 
+    @pytest.mark.parametrize("build_executor", ["thread", "process"])
+    def test_batch_build_executor(
+        self, runner, tmp_path, sample_deck_content, build_executor
+    ):
+        """Test that both build executors build every deck."""
+        for name in ("deck1", "deck2"):
+            (tmp_path / f"{name}.yaml").write_text(
+                yaml.dump(sample_deck_content), encoding="utf-8"
+            )
+
+        result = runner.invoke(
+            cli,
+            [
+                "batch-build",
+                "-f",
+                str(tmp_path / "*.yaml"),
+                "-o",
+                str(tmp_path / "out"),
+                "-w",
+                "2",
+                "--build-executor",
+                build_executor,
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Successfully built 2/2 decks" in result.output
+        assert (tmp_path / "out" / "deck1.apkg").exists()
+        assert (tmp_path / "out" / "deck2.apkg").exists()
+
+    def test_batch_build_defaults_to_threads(
+        self, runner, tmp_path, sample_deck_content
+    ):
+        """Test that worker processes are only used when asked for."""
+        for name in ("deck1", "deck2"):
+            (tmp_path / f"{name}.yaml").write_text(
+                yaml.dump(sample_deck_content), encoding="utf-8"
+            )
+
+        with patch(
+            "anki_yaml_tool.cli._batch_build.ProcessPoolExecutor"
+        ) as process_pool:
+            result = runner.invoke(
+                cli,
+                [
+                    "batch-build",
+                    "-f",
+                    str(tmp_path / "*.yaml"),
+                    "-o",
+                    str(tmp_path / "out"),
+                    "-w",
+                    "2",
+                ],
+            )
+
+        assert result.exit_code == 0, result.output
+        process_pool.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("sort_flag", "first"), [("--sort", "a"), ("--no-sort", "b")]
+    )
+    def test_batch_build_sort(
+        self, runner, tmp_path, sample_deck_content, sort_flag, first
+    ):
+        """Test that --no-sort keeps files in the order they were given."""
+        for name in ("a", "b"):
+            (tmp_path / f"{name}.yaml").write_text(
+                yaml.dump(sample_deck_content), encoding="utf-8"
+            )
+
+        result = runner.invoke(
+            cli,
+            [
+                "batch-build",
+                "-f",
+                str(tmp_path / "b.yaml"),
+                "-f",
+                str(tmp_path / "a.yaml"),
+                "-f",
+                str(tmp_path / "b.yaml"),
+                "-o",
+                str(tmp_path / "out"),
+                "-w",
+                "1",
+                sort_flag,
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Found 2 deck files" in result.output
+        assert f"Building deck 1 of 2: {first}..." in result.output
+
     def test_batch_build_merge(self, runner, tmp_path, sample_deck_content):
         """Test batch-build with --merge flag."""
         deck1 = tmp_path / "vocab1.yaml"
@@ -126,6 +256,97 @@ class TestBatchBuildCommand:
             assert "4 notes" in result.output  # 2 notes per file
             assert (tmp_path / "All_Vocab.apkg").exists()
 
+    def test_batch_build_deck_filter(self, runner, tmp_path, sample_deck_content):
+        """Test that --deck-filter keeps only decks whose name matches."""
+        (tmp_path / "spanish.yaml").write_text(
+            yaml.dump(sample_deck_content), encoding="utf-8"
+        )
+        (tmp_path / "french.yaml").write_text(
+            yaml.dump(sample_deck_content), encoding="utf-8"
+        )
+
+        result = runner.invoke(
+            cli,
+            [
+                "batch-build",
+                "-f",
+                str(tmp_path / "*.yaml"),
+                "--deck-filter",
+                "SPAN*",
+                "-o",
+                str(tmp_path / "out"),
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "Filtered to 1 decks" in result.output
+        assert (tmp_path / "out" / "spanish.apkg").exists()
+        assert not (tmp_path / "out" / "french.apkg").exists()
+
+    def test_batch_build_deck_filter_reports_invalid_match(
+        self, runner, tmp_path, sample_deck_content
+    ):
+        """Test that a matched deck whose name was peeked is still validated."""
+        (tmp_path / "good.yaml").write_text(
+            yaml.dump({**sample_deck_content, "deck-name": "Spanish Good"}),
+            encoding="utf-8",
+        )
+        invalid = {**sample_deck_content, "deck-name": "Spanish Bad"}
+        invalid["config"] = {
+            k: v for k, v in sample_deck_content["config"].items() if k != "fields"
+        }
+        (tmp_path / "bad.yaml").write_text(yaml.dump(invalid), encoding="utf-8")
+
+        result = runner.invoke(
+            cli,
+            [
+                "batch-build",
+                "-f",
+                str(tmp_path / "*.yaml"),
+                "--deck-filter",
+                "Spanish*",
+                "-o",
+                str(tmp_path / "out"),
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "Filtered to 2 decks" in result.output
+        assert "Built 1/2 decks, 1 failed" in result.output
+        assert "bad.yaml: Invalid configuration" in result.output
+        assert (tmp_path / "out" / "good.apkg").exists()
+
+    def test_batch_build_deck_filter_path_source(
+        self, runner, tmp_path, sample_deck_content
+    ):
+        """Test that --filter-source path matches file names without parsing."""
+        deck_content = {**sample_deck_content, "deck-name": "French"}
+        (tmp_path / "spanish.yaml").write_text(
+            yaml.dump(deck_content), encoding="utf-8"
+        )
+        # Not valid YAML, so the run fails if the filter tries to parse it
+        (tmp_path / "french.yaml").write_text("[not a deck", encoding="utf-8")
+
+        result = runner.invoke(
+            cli,
+            [
+                "batch-build",
+                "-f",
+                str(tmp_path / "*.yaml"),
+                "--deck-filter",
+                "spanish",
+                "--filter-source",
+                "path",
+                "-o",
+                str(tmp_path / "out"),
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "Filtered to 1 decks" in result.output
+        # The YAML deck-name "French" is ignored in favour of the file name
+        assert (tmp_path / "out" / "spanish.apkg").exists()
+
     def test_batch_build_no_matching_files(self, runner, tmp_path):
         """Test batch-build with no matching files."""
         with runner.isolated_filesystem(temp_dir=tmp_path):
@@ -138,7 +359,7 @@ class TestBatchBuildCommand:
             assert "No files matched" in result.output
 
     def test_batch_build_push_and_delete(
-        self, runner, tmp_path, sample_deck_content, monkeypatch
+        self, runner, tmp_path, sample_deck_content, monkeypatch, anki_reachable
     ):
         """Test batch-build with --push and --delete-after (mock AnkiConnector)."""
         deck_file = tmp_path / "vocab.yaml"
@@ -181,7 +402,9 @@ class TestBatchBuildCommand:
             apkg = tmp_path / f"{deck_file.stem}.apkg"
             assert not apkg.exists()
 
-    def test_batch_build_push_with_media(self, runner, tmp_path, monkeypatch):
+    def test_batch_build_push_with_media(
+        self, runner, tmp_path, monkeypatch, anki_reachable
+    ):
         """Test that media files are uploaded during batch push (storeMediaFile invoked)."""
         # Create deck content with media reference and media folder
         deck_content = {
@@ -206,9 +429,12 @@ class TestBatchBuildCommand:
         calls: dict[str, int] = {"store": 0, "imported": 0}
 
         def fake_invoke(self, action, **params):
-            if action == "storeMediaFile":
-                calls["store"] += 1
-                return None
+            if action == "multi":
+                stores = [
+                    a for a in params["actions"] if a["action"] == "storeMediaFile"
+                ]
+                calls["store"] += len(stores)
+                return [{"result": None, "error": None} for _ in params["actions"]]
             return None
 
         def fake_import_package(self, apkg_path):
@@ -248,7 +474,9 @@ class TestBatchBuildCommand:
             apkg = tmp_path / expected_name
             assert not apkg.exists()
 
-    def test_batch_build_push_failure(self, runner, tmp_path, monkeypatch):
+    def test_batch_build_push_failure(
+        self, runner, tmp_path, monkeypatch, anki_reachable
+    ):
         """Test behavior when Anki import fails during push (apkg should remain)."""
         deck_file = tmp_path / "deck.yaml"
         deck_file.write_text(
@@ -296,7 +524,9 @@ class TestBatchBuildCommand:
             # Ensure apkg remains because push failed
             assert apkg.exists()
 
-    def test_batch_build_push_and_sync(self, runner, tmp_path, monkeypatch):
+    def test_batch_build_push_and_sync(
+        self, runner, tmp_path, monkeypatch, anki_reachable
+    ):
         """Test batch build with push and sync options."""
         deck_content = {
             "config": {
@@ -347,7 +577,9 @@ class TestBatchBuildCommand:
         assert "Syncing with AnkiWeb" in result.output
         assert "Sync complete" in result.output
 
-    def test_batch_build_merge_and_sync(self, runner, tmp_path, monkeypatch):
+    def test_batch_build_merge_and_sync(
+        self, runner, tmp_path, monkeypatch, anki_reachable
+    ):
         """Test batch build merge with push and sync options."""
         deck_content = {
             "config": {
@@ -399,6 +631,32 @@ class TestBatchBuildCommand:
         assert "Syncing with AnkiWeb" in result.output
         assert "Sync complete" in result.output
 
+    def test_batch_build_push_anki_unreachable(
+        self, runner, tmp_path, sample_deck_content, monkeypatch
+    ):
+        """Test that --push aborts before building when Anki is unreachable."""
+        from anki_yaml_tool.core.exceptions import AnkiConnectError
+
+        deck_file = tmp_path / "vocab.yaml"
+        deck_file.write_text(yaml.dump(sample_deck_content), encoding="utf-8")
+
+        def fake_get_version(self):
+            raise AnkiConnectError("Could not connect to Anki", action="version")
+
+        monkeypatch.setattr(
+            "anki_yaml_tool.core.connector.AnkiConnector.get_version",
+            fake_get_version,
+        )
+
+        result = runner.invoke(
+            cli,
+            ["batch-build", "-f", str(deck_file), "-o", str(tmp_path), "--push"],
+        )
+
+        assert result.exit_code != 0
+        assert "Could not connect to Anki" in result.output
+        assert not (tmp_path / "vocab.apkg").exists()
+
 
 class TestBatchUtilities:
     """Tests for batch processing utilities."""
@@ -426,6 +684,60 @@ class TestBatchUtilities:
         assert len(result) == 2
         assert all(p.suffix == ".yaml" for p in result)
 
+    def test_expand_glob_skips_hidden_files_and_directories(self, tmp_path):
+        """Test that a file-name wildcard matches like glob does."""
+        from anki_yaml_tool.core.batch import expand_file_patterns
+
+        (tmp_path / "deck.yaml").write_text("content")
+        (tmp_path / ".hidden.yaml").write_text("content")
+        (tmp_path / "dir.yaml").mkdir()
+
+        result = expand_file_patterns((str(tmp_path / "*.yaml"),))
+        assert [p.name for p in result] == ["deck.yaml"]
+
+        result = expand_file_patterns((str(tmp_path / ".*.yaml"),))
+        assert [p.name for p in result] == [".hidden.yaml"]
+
+    def test_expand_literal_file_with_glob_characters(self, tmp_path):
+        """Test that an existing file whose name looks like a glob is kept."""
+        from anki_yaml_tool.core.batch import expand_file_patterns
+
+        test_file = tmp_path / "deck[1].yaml"
+        test_file.write_text("content")
+
+        result = expand_file_patterns((str(test_file), str(test_file)))
+        assert result == [test_file.resolve()]
+
+    def test_expand_literal_file_preferred_over_glob_match(self, tmp_path):
+        """Test that a literal file is returned even if its name also globs."""
+        from anki_yaml_tool.core.batch import expand_file_patterns
+
+        literal = tmp_path / "deck[1].yaml"
+        literal.write_text("content")
+        (tmp_path / "deck1.yaml").write_text("content")
+
+        result = expand_file_patterns((str(literal),))
+        assert result == [literal.resolve()]
+
+    def test_load_many_keeps_order_and_errors(self, tmp_path, sample_deck_content):
+        """Test that load_many returns decks in order and errors per file."""
+        from anki_yaml_tool.core.batch import load_many
+        from anki_yaml_tool.core.exceptions import ConfigValidationError
+
+        paths = []
+        for name in ("a", "b"):
+            content = dict(sample_deck_content, **{"deck-name": name})
+            paths.append(tmp_path / f"{name}.yaml")
+            paths[-1].write_text(yaml.dump(content), encoding="utf-8")
+        broken = tmp_path / "broken.yaml"
+        broken.write_text("config: {}\n", encoding="utf-8")
+
+        results = load_many([paths[0], broken, paths[1]])
+
+        assert results[0][2] == "a"
+        assert isinstance(results[1], ConfigValidationError)
+        assert results[2][2] == "b"
+
     def test_scan_directory_for_decks(self, tmp_path):
         """Test scanning directory for deck files."""
         from anki_yaml_tool.core.batch import scan_directory_for_decks
@@ -439,6 +751,18 @@ class TestBatchUtilities:
         decks = list(scan_directory_for_decks(tmp_path))
         assert len(decks) == 2
 
+    def test_scan_directory_wildcard_non_recursive(self, tmp_path):
+        """Test scanning only the top level with a wildcard pattern."""
+        from anki_yaml_tool.core.batch import scan_directory_for_decks
+
+        (tmp_path / "a.yaml").write_text("content")
+        (tmp_path / "notes.txt").write_text("content")
+        (tmp_path / "nested").mkdir()
+        (tmp_path / "nested" / "b.yaml").write_text("content")
+
+        decks = list(scan_directory_for_decks(tmp_path, "*.yaml", recursive=False))
+        assert decks == [tmp_path / "a.yaml"]
+
     def test_get_deck_name_from_path(self, tmp_path):
         """Test generating deck name from path."""
         from anki_yaml_tool.core.batch import get_deck_name_from_path
@@ -460,3 +784,13 @@ class TestBatchUtilities:
 
         name = get_deck_name_from_path(file_path, base_dir=tmp_path)
         assert name == "languages::spanish"
+
+    def test_get_deck_name_outside_base_dir(self, tmp_path):
+        """Files outside base_dir fall back to the parent directory name."""
+        from anki_yaml_tool.core.batch import get_deck_name_from_path
+
+        file_path = tmp_path / "other" / "deck.yaml"
+        base_dir = tmp_path / "decks"
+
+        assert get_deck_name_from_path(file_path, base_dir=base_dir) == "other"
+        assert get_deck_name_from_path(base_dir / "deck.yaml", base_dir) == "decks"
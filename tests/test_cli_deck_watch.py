@@ -0,0 +1,64 @@
+"""Tests for the ``deck watch`` command."""
+
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from anki_yaml_tool.cli import cli
+
+
+def test_watch_malformed_file_reports_error(tmp_path):
+    """Test that a malformed deck file aborts before Anki is contacted."""
+    deck_file = tmp_path / "deck.yaml"
+    deck_file.write_text("config: [unclosed\n", encoding="utf-8")
+
+    with patch("anki_yaml_tool.cli._deck_watch.AnkiConnector") as connector:
+        result = CliRunner().invoke(cli, ["deck", "watch", "--file", str(deck_file)])
+
+    assert result.exit_code != 0
+    assert "Error:" in result.output
+    connector.assert_not_called()
+
+
+def test_watch_waits_with_timeout(tmp_path):
+    """Test that the watch loop waits in bounded steps until stopped."""
+    deck_file = tmp_path / "deck.yaml"
+    deck_file.write_text("deck-name: Existing\n", encoding="utf-8")
+
+    with (
+        patch("anki_yaml_tool.cli._deck_watch.AnkiConnector") as connector,
+        patch("anki_yaml_tool.cli._deck_watch.FileWatcher") as watcher_cls,
+    ):
+        connector.return_value.get_deck_name_set.return_value = frozenset({"Existing"})
+        watcher = watcher_cls.return_value
+        watcher.wait.side_effect = [False, False, True]
+        result = CliRunner().invoke(cli, ["deck", "watch", "--file", str(deck_file)])
+
+    assert result.exit_code == 0
+    assert [c.args for c in watcher.wait.call_args_list] == [(1.0,)] * 3
+
+
+def test_watch_refreshes_deck_names_on_change(tmp_path):
+    """Test that each change drops the cached deck names before pushing."""
+    deck_file = tmp_path / "deck.yaml"
+    deck_file.write_text("deck-name: Existing\n", encoding="utf-8")
+
+    with (
+        patch("anki_yaml_tool.cli._deck_watch.AnkiConnector") as connector_cls,
+        patch("anki_yaml_tool.cli._deck_watch.FileWatcher") as watcher_cls,
+        patch("anki_yaml_tool.cli._deck_watch.push_deck_from_file") as push,
+    ):
+        connector = connector_cls.return_value
+        connector.get_deck_name_set.return_value = frozenset({"Existing"})
+        watcher = watcher_cls.return_value
+        watcher.wait.return_value = True
+
+        def start(on_change):
+            on_change()
+
+        watcher.start.side_effect = start
+        result = CliRunner().invoke(cli, ["deck", "watch", "--file", str(deck_file)])
+
+    assert result.exit_code == 0
+    connector.invalidate_cache.assert_called_once()
+    push.assert_called_once()
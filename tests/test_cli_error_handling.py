@@ -0,0 +1,40 @@
+"""Tests for the shared CLI error handler."""
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from anki_yaml_tool.cli.error_handling import cli_error_handler
+from anki_yaml_tool.core.exceptions import AnkiToolError
+
+
+def _command(exc: BaseException) -> click.Command:
+    @click.command()
+    @cli_error_handler
+    def failing() -> None:
+        raise exc
+
+    return failing
+
+
+@pytest.mark.parametrize(
+    ("exc", "message"),
+    [
+        (AnkiToolError("bad deck"), "Error: bad deck"),
+        (ValueError("boom"), "Unexpected error: boom"),
+    ],
+)
+def test_errors_are_reported_and_abort(exc, message):
+    """Test that errors are printed and the command aborts."""
+    result = CliRunner().invoke(_command(exc))
+
+    assert result.exit_code == 1
+    assert message in result.output
+
+
+def test_click_abort_passes_through():
+    """Test that an Abort raised by the command is not reported again."""
+    result = CliRunner().invoke(_command(click.Abort()))
+
+    assert result.exit_code == 1
+    assert "error" not in result.output.lower()
@@ -0,0 +1,54 @@
+"""Tests for the lazily loaded CLI command groups."""
+
+import subprocess
+import sys
+
+from click.testing import CliRunner
+
+from anki_yaml_tool.cli import cli
+
+
+def test_deck_help_lists_lazy_commands():
+    """Test that --help lists commands that have not been imported yet."""
+    result = CliRunner().invoke(cli, ["deck", "--help"])
+
+    assert result.exit_code == 0
+    for name in ("create", "update", "export", "watch"):
+        assert name in result.output
+
+
+def test_importing_cli_skips_command_modules():
+    """Test that importing the CLI does not import commands or heavy deps."""
+    code = (
+        "import sys, anki_yaml_tool.cli; "
+        "print(sorted(m for m in sys.modules "
+        "if m.startswith(('anki_yaml_tool.cli._', 'genanki', 'requests'))))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_help_skips_command_modules():
+    """Test that group --help pages list commands without importing them."""
+    code = (
+        "import sys\n"
+        "from anki_yaml_tool.cli import cli\n"
+        "for args in ([], ['deck'], ['package']):\n"
+        "    try:\n"
+        "        cli([*args, '--help'])\n"
+        "    except SystemExit:\n"
+        "        pass\n"
+        "print(sorted(m for m in sys.modules "
+        "if m.startswith(('anki_yaml_tool.cli._', 'genanki', 'requests'))), "
+        "file=sys.stderr)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert "batch-build  Build multiple decks from YAML files." in result.stdout
+    assert "watch   Monitors a YAML file for changes" in result.stdout
+    assert result.stderr.strip() == "[]"
@@ -100,6 +100,29 @@ class TestLoggingConfiguration:
         logger = get_logger()
         assert logger.level == logging.ERROR
 
+    @pytest.mark.parametrize(
+        ("level", "color"),
+        [("WARNING", "yellow"), ("ERROR", "red"), ("CRITICAL", "bright_red")],
+    )
+    def test_click_handler_colors_match_click_style(self, level, color):
+        """Test that prebuilt level colors match click.style output."""
+        import logging
+
+        import click
+
+        from anki_yaml_tool.core.logging_config import ClickHandler
+
+        handler = ClickHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        record = logging.LogRecord(
+            "test", getattr(logging, level), __file__, 1, "msg", None, None
+        )
+
+        with patch("anki_yaml_tool.core.logging_config.click.echo") as echo:
+            handler.emit(record)
+
+        assert echo.call_args.args[0] == click.style("msg", fg=color)
+
 
 class TestVerboseBuildCommand:
     """Tests for verbose output in build command."""
@@ -5,7 +5,13 @@ from pathlib import Path
 import pytest
 import yaml
 
-from anki_yaml_tool.core.config import load_deck_data, load_deck_file, load_model_config
+from anki_yaml_tool.core.config import (
+    load_deck_data,
+    load_deck_file,
+    load_model_config,
+    peek_deck_name,
+    read_deck_name,
+)
 from anki_yaml_tool.core.exceptions import ConfigValidationError, DataValidationError
 
 
@@ -37,8 +43,10 @@ css: ".card { font-size: 20px; }"
 
 def test_load_model_config_nonexistent_file():
     """Test loading a configuration file that doesn't exist."""
-    with pytest.raises(FileNotFoundError):
+    with pytest.raises(FileNotFoundError, match="Configuration file not found"):
         load_model_config(Path("/nonexistent/config.yaml"))
+    with pytest.raises(FileNotFoundError, match="Configuration file not found"):
+        load_model_config(Path("/nonexistent/config.yaml"), use_advanced=False)
 
 
 def test_load_model_config_empty_file(tmp_path):
@@ -74,6 +82,17 @@ templates:
     assert "required" in error_msg or "missing" in error_msg
 
 
+def test_load_model_config_not_a_mapping(tmp_path):
+    """Test that a config file holding a list is a validation error."""
+    config_file = tmp_path / "list_config.yaml"
+    config_file.write_text("- name: Test Model\n")
+
+    with pytest.raises(ConfigValidationError) as exc_info:
+        load_model_config(config_file)
+
+    assert "dictionary" in str(exc_info.value)
+
+
 def test_load_model_config_without_css(tmp_path):
     """Test loading a configuration file without optional CSS field."""
     config_file = tmp_path / "config.yaml"
@@ -123,8 +142,10 @@ def test_load_deck_data_success(tmp_path):
 
 def test_load_deck_data_nonexistent_file():
     """Test loading a data file that doesn't exist."""
-    with pytest.raises(FileNotFoundError):
+    with pytest.raises(FileNotFoundError, match="Data file not found"):
         load_deck_data(Path("/nonexistent/data.yaml"))
+    with pytest.raises(FileNotFoundError, match="Data file not found"):
+        load_deck_data(Path("/nonexistent/data.yaml"), use_advanced=False)
 
 
 def test_load_deck_data_empty_file(tmp_path):
@@ -478,6 +499,30 @@ data:
     assert items[0]["front"] == "Question 1"
 
 
+def test_load_config_and_data_plain_yaml_mode(tmp_path):
+    """Test the split config/data loaders with use_advanced=False."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        """
+name: "Test Model"
+fields: ["Front"]
+templates:
+  - name: "Card 1"
+    qfmt: "{{Front}}"
+    afmt: "{{Front}}"
+"""
+    )
+    data_file = tmp_path / "data.yaml"
+    data_file.write_text('- front: "Café ${HOME}"\n')
+
+    config = load_model_config(config_file, use_advanced=False)
+    items = load_deck_data(data_file, use_advanced=False)
+
+    assert config["fields"] == ["Front"]
+    # Plain mode does no substitution
+    assert items == [{"front": "Café ${HOME}"}]
+
+
 def test_load_deck_file_top_level_deck_name(tmp_path):
     """Test that top-level deck-name is used when present."""
     deck_file = tmp_path / "deck.yaml"
@@ -529,3 +574,47 @@ data:
     _, _, _, media_folder = load_deck_file(deck_file)
     assert media_folder is not None
     assert media_folder == media_dir.resolve()
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        ("config:\n  deck-name: In Config\ndata: [{a: 1}]\n", (True, "In Config")),
+        (
+            "config:\n  deck-name: In Config\ndata: [{a: 1}]\ndeck-name: Top\n",
+            (True, "Top"),
+        ),
+        ("deck-name: ''\nconfig: {deck-name: Fallback}\n", (True, "Fallback")),
+        ("config: {name: Model}\ndata: []\n", (True, None)),
+        ("config: {deck-name: 2024}\n", (False, None)),
+        ("config: {deck-name: '${DECK}'}\n", (False, None)),
+        ("config: !include config.yaml\n", (False, None)),
+        ("config: {deck-name: [unclosed\n", (False, None)),
+    ],
+)
+def test_peek_deck_name(tmp_path, content, expected):
+    """Test reading the deck name without loading the deck."""
+    deck_file = tmp_path / "deck.yaml"
+    deck_file.write_text(content, encoding="utf-8")
+
+    assert peek_deck_name(deck_file) == expected
+
+
+def test_read_deck_name_falls_back_to_full_load(tmp_path, monkeypatch):
+    """Test that a name the event stream cannot resolve is loaded."""
+    monkeypatch.setenv("READ_DECK_NAME_TEST", "From Env")
+    deck_file = tmp_path / "deck.yaml"
+    deck_file.write_text(
+        "config:\n"
+        "  name: Test Model\n"
+        "  fields: [Front, Back]\n"
+        "  templates:\n"
+        "    - {name: Card 1, qfmt: '{{Front}}', afmt: '{{Back}}'}\n"
+        "deck-name: ${READ_DECK_NAME_TEST}\n"
+        "data:\n"
+        "  - {front: Q, back: A}\n",
+        encoding="utf-8",
+    )
+
+    assert peek_deck_name(deck_file) == (False, None)
+    assert read_deck_name(deck_file) == "From Env"
@@ -1,5 +1,6 @@
 """Tests for the AnkiConnector class."""
 
+import json
 from pathlib import Path
 from unittest.mock import Mock
 
@@ -34,6 +35,16 @@ def test_invoke_success(connector: AnkiConnector) -> None:
     connector._session.post.assert_called_once()
 
 
+def test_session_is_shared_and_pooled() -> None:
+    """Test that the keep-alive session carries the JSON header and pool size."""
+    conn = AnkiConnector()
+
+    assert conn._session.headers["Content-Type"] == "application/json"
+    adapter = conn._session.get_adapter(conn.url)
+    assert adapter._pool_maxsize == 16  # type: ignore[attr-defined]
+    conn.close()
+
+
 def test_invoke_connection_error(connector: AnkiConnector) -> None:
     """Test handling of connection errors.
 
@@ -101,7 +112,7 @@ def test_store_media_file(connector: AnkiConnector, tmp_path: Path) -> None:
 
     connector._session.post.assert_called_once()
     call_args = connector._session.post.call_args
-    assert call_args[1]["json"]["action"] == "storeMediaFile"
+    assert json.loads(call_args[1]["data"])["action"] == "storeMediaFile"
 
 
 def test_store_media_file_custom_filename(
@@ -117,4 +128,4 @@ def test_store_media_file_custom_filename(
 
     connector._session.post.assert_called_once()
     call_args = connector._session.post.call_args
-    assert call_args[1]["json"]["params"]["filename"] == "custom_name.jpg"
+    assert json.loads(call_args[1]["data"])["params"]["filename"] == "custom_name.jpg"
@@ -22,6 +22,12 @@ def _mock_response(result=None, error=None) -> Mock:
     return resp
 
 
+def test_get_version(connector: AnkiConnector) -> None:
+    connector._session.post.return_value = _mock_response(result=6)
+
+    assert connector.get_version() == 6
+
+
 def test_get_deck_names(connector: AnkiConnector) -> None:
     connector._session.post.return_value = _mock_response(result=["B", "A"])
 
@@ -29,6 +35,76 @@ def test_get_deck_names(connector: AnkiConnector) -> None:
     assert names == ["A", "B"]
 
 
+def test_get_deck_names_cached(connector: AnkiConnector) -> None:
+    connector._session.post.return_value = _mock_response(result=["A"])
+
+    connector.get_deck_names()
+    connector.get_deck_names()
+    assert connector._session.post.call_count == 1
+
+    connector.get_deck_names(refresh=True)
+    assert connector._session.post.call_count == 2
+
+
+def test_create_deck_skips_known_deck(connector: AnkiConnector) -> None:
+    connector._session.post.return_value = _mock_response(result=["A"])
+    connector.get_deck_names()
+
+    connector.create_deck("A")
+    assert connector._session.post.call_count == 1
+
+    connector._session.post.return_value = _mock_response(result=123)
+    connector.create_deck("B")
+    assert connector._session.post.call_count == 2
+    assert connector.get_deck_names() == ["A", "B"]
+
+
+def test_get_deck_name_set_follows_cache(connector: AnkiConnector) -> None:
+    connector._session.post.return_value = _mock_response(result=["A"])
+
+    assert connector.get_deck_name_set() == {"A"}
+    assert connector.get_deck_name_set() is connector.get_deck_name_set()
+
+    connector._session.post.return_value = _mock_response(result=123)
+    connector.create_deck("B")
+    assert connector.get_deck_name_set() == {"A", "B"}
+    assert connector._session.post.call_count == 2
+
+
+def test_create_deck_updates_name_set_in_place(connector: AnkiConnector) -> None:
+    connector._session.post.return_value = _mock_response(result=["A"])
+    connector.get_deck_names()
+    known = connector._deck_name_set
+
+    connector._session.post.return_value = _mock_response(result=123)
+    for name in ("B", "C", "B"):
+        connector.create_deck(name)
+
+    assert connector._deck_name_set is known
+    assert known == {"A", "B", "C"}
+    assert connector.get_deck_names() == ["A", "B", "C"]
+    # One deckNames call and one createDeck per new deck
+    assert connector._session.post.call_count == 3
+
+
+def test_create_deck_from_threads_keeps_cache_consistent(
+    connector: AnkiConnector,
+) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    connector._session.post.return_value = _mock_response(result=["A"])
+    connector.get_deck_names()
+
+    connector._session.post.return_value = _mock_response(result=123)
+    names = [f"D{i % 20:02d}" for i in range(200)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(connector.create_deck, names))
+
+    expected = ["A", *sorted(set(names))]
+    assert connector.get_deck_names() == expected
+    assert connector.get_deck_name_set() == frozenset(expected)
+
+
 def test_get_model_names(connector: AnkiConnector) -> None:
     connector._session.post.return_value = _mock_response(result=["Model1"])
 
@@ -72,3 +148,10 @@ def test_retrieve_media_file(connector: AnkiConnector) -> None:
 
     out = connector.retrieve_media_file("image.jpg")
     assert out == content
+
+
+def test_get_media_file_names(connector: AnkiConnector) -> None:
+    connector._session.post.return_value = _mock_response(result=["a.png", "b.mp3"])
+
+    names = connector.get_media_file_names()
+    assert names == ["a.png", "b.mp3"]
@@ -1,5 +1,6 @@
 """Tests for AnkiConnector update/add wrappers."""
 
+import json
 from unittest.mock import Mock
 
 import pytest
@@ -29,8 +30,9 @@ def test_update_note_fields_calls_invoker(connector: AnkiConnector) -> None:
 
     call_args = connector._session.post.call_args
     assert call_args is not None
-    assert call_args[1]["json"]["action"] == "updateNoteFields"
-    params = call_args[1]["json"]["params"]
+    payload = json.loads(call_args[1]["data"])
+    assert payload["action"] == "updateNoteFields"
+    params = payload["params"]
     assert params["note"]["id"] == 123
 
 
@@ -46,3 +48,43 @@ def test_add_note_raises_on_unexpected_response(connector: AnkiConnector) -> Non
 
     with pytest.raises(AnkiConnectError):
         connector.add_note("D", "M", {"Front": "Q"})
+
+
+def test_add_notes_uses_single_multi_request(connector: AnkiConnector) -> None:
+    connector._session.post.return_value = _mock_response(
+        result=[
+            {"result": 11, "error": None},
+            {"result": None, "error": "cannot create note because it is a duplicate"},
+        ]
+    )
+
+    specs = [
+        {"deckName": "D", "modelName": "M", "fields": {"Front": "Q1"}},
+        {"deckName": "D", "modelName": "M", "fields": {"Front": "Q2"}},
+    ]
+    assert connector.add_notes(specs) == [11, None]
+
+    connector._session.post.assert_called_once()
+    payload = json.loads(connector._session.post.call_args[1]["data"])
+    assert payload["action"] == "multi"
+    actions = payload["params"]["actions"]
+    assert [a["action"] for a in actions] == ["addNote", "addNote"]
+    assert all(a["version"] == 6 for a in actions)
+    assert actions[1]["params"]["note"]["fields"] == {"Front": "Q2"}
+
+
+def test_update_notes_fields_returns_errors(connector: AnkiConnector) -> None:
+    connector._session.post.return_value = _mock_response(
+        result=[{"result": None, "error": None}, {"result": None, "error": "not found"}]
+    )
+
+    errors = connector.update_notes_fields([(1, {"Front": "a"}), (2, {"Front": "b"})])
+
+    assert errors == [None, "not found"]
+    payload = json.loads(connector._session.post.call_args[1]["data"])
+    assert payload["params"]["actions"][0]["params"]["note"]["id"] == 1
+
+
+def test_invoke_multi_skips_empty_batch(connector: AnkiConnector) -> None:
+    assert connector.invoke_multi([]) == []
+    connector._session.post.assert_not_called()
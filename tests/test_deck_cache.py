@@ -0,0 +1,135 @@
+"""Tests for the on-disk deck cache."""
+
+import math
+import os
+from unittest.mock import Mock
+
+import pytest
+import yaml
+
+from anki_yaml_tool.core import deck_cache
+from anki_yaml_tool.core.config import load_deck_file
+from anki_yaml_tool.core.deck_cache import load_deck_file_cached
+
+pytestmark = pytest.mark.skipif(
+    not deck_cache.ORJSON_AVAILABLE, reason="orjson is not installed"
+)
+
+
+@pytest.fixture
+def deck_file(tmp_path):
+    """Create a deck file that includes its notes from another file."""
+    (tmp_path / "notes.yaml").write_text(
+        yaml.dump([{"front": "Q1", "back": "A1"}]), encoding="utf-8"
+    )
+    deck_path = tmp_path / "deck.yaml"
+    deck_path.write_text(
+        "config:\n"
+        "  name: Test Model\n"
+        "  fields: [Front, Back]\n"
+        "  templates:\n"
+        "    - {name: Card 1, qfmt: '{{Front}}', afmt: '{{Back}}'}\n"
+        "deck-name: ${DECK_CACHE_TEST_NAME}\n"
+        "data: !include notes.yaml\n",
+        encoding="utf-8",
+    )
+    return deck_path
+
+
+@pytest.fixture
+def parse_counter(monkeypatch):
+    """Count calls that reach the real YAML loader."""
+    counter = Mock(side_effect=load_deck_file)
+    monkeypatch.setattr(deck_cache, "load_deck_file", counter)
+    return counter
+
+
+def _bump(path):
+    """Rewrite *path* with new content and a later mtime."""
+    stat = path.stat()
+    path.write_text(path.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestLoadDeckFileCached:
+    """Tests for load_deck_file_cached."""
+
+    def test_second_load_uses_cache(self, deck_file, tmp_path, parse_counter):
+        """Test that an unchanged deck is only parsed once."""
+        cache_dir = tmp_path / "cache"
+
+        first = load_deck_file_cached(deck_file, cache_dir)
+        second = load_deck_file_cached(deck_file, cache_dir)
+
+        assert parse_counter.call_count == 1
+        assert second == first
+
+    def test_changed_include_invalidates(self, deck_file, tmp_path, parse_counter):
+        """Test that editing an included file forces a re-parse."""
+        cache_dir = tmp_path / "cache"
+        load_deck_file_cached(deck_file, cache_dir)
+
+        _bump(tmp_path / "notes.yaml")
+        load_deck_file_cached(deck_file, cache_dir)
+
+        assert parse_counter.call_count == 2
+
+    def test_changed_env_var_invalidates(
+        self, deck_file, tmp_path, parse_counter, monkeypatch
+    ):
+        """Test that a substituted environment variable is part of the key."""
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setenv("DECK_CACHE_TEST_NAME", "First")
+        assert load_deck_file_cached(deck_file, cache_dir)[2] == "First"
+
+        monkeypatch.setenv("DECK_CACHE_TEST_NAME", "Second")
+        assert load_deck_file_cached(deck_file, cache_dir)[2] == "Second"
+        assert parse_counter.call_count == 2
+
+    def test_missing_media_folder_not_cached(self, tmp_path, parse_counter):
+        """Test that a deck pointing at a missing media folder is re-parsed."""
+        deck_path = tmp_path / "deck.yaml"
+        deck_path.write_text(
+            yaml.dump(
+                {
+                    "config": {
+                        "name": "Test Model",
+                        "fields": ["Front", "Back"],
+                        "templates": [
+                            {"name": "Card 1", "qfmt": "{{Front}}", "afmt": "{{Back}}"}
+                        ],
+                        "media-folder": "./media/",
+                    },
+                    "data": [{"front": "Q", "back": "A"}],
+                }
+            ),
+            encoding="utf-8",
+        )
+        cache_dir = tmp_path / "cache"
+
+        assert load_deck_file_cached(deck_path, cache_dir)[3] is None
+        (tmp_path / "media").mkdir()
+        assert load_deck_file_cached(deck_path, cache_dir)[3] == tmp_path / "media"
+        assert parse_counter.call_count == 2
+
+    def test_non_finite_floats_round_trip(self, tmp_path, parse_counter):
+        """Test that NaN and infinity load the same with and without cache."""
+        deck_path = tmp_path / "deck.yaml"
+        deck_path.write_text(
+            "config:\n"
+            "  name: Test Model\n"
+            "  fields: [Front, Back]\n"
+            "  templates:\n"
+            "    - {name: Card 1, qfmt: '{{Front}}', afmt: '{{Back}}'}\n"
+            "data:\n"
+            "  - {front: .nan, back: .inf}\n",
+            encoding="utf-8",
+        )
+        cache_dir = tmp_path / "cache"
+
+        for _ in range(2):
+            note = load_deck_file_cached(deck_path, cache_dir)[1][0]
+            assert math.isnan(note["front"])
+            assert note["back"] == math.inf
+        # Not cached, so both loads parse the file
+        assert parse_counter.call_count == 2
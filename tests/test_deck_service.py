@@ -14,6 +14,7 @@ from anki_yaml_tool.core.deck_service import (
     ValidationIssue,
     ValidationResult,
     build_deck,
+    get_field_values,
     push_apkg,
     validate_deck,
 )
@@ -134,6 +135,27 @@ class TestBuildDeck:
         )
         assert result.media_files >= 1
 
+    def test_build_deck_keeps_package_data(self, deck_file, tmp_path):
+        """Test that the written .apkg bytes are returned when requested."""
+        output = tmp_path / "output.apkg"
+        result = build_deck(deck_file, output, keep_package_data=True)
+
+        assert result.package_data == output.read_bytes()
+
+    def test_build_deck_uses_preloaded_deck(self, deck_file, tmp_path, monkeypatch):
+        """Test that a preloaded deck is built without parsing the file again."""
+        from anki_yaml_tool.core import deck_service
+        from anki_yaml_tool.core.config import load_deck_file
+
+        preloaded = load_deck_file(deck_file)
+        monkeypatch.setattr(
+            deck_service, "load_deck_file", Mock(side_effect=AssertionError)
+        )
+
+        result = build_deck(deck_file, tmp_path / "out.apkg", preloaded=preloaded)
+
+        assert result.notes_processed == 2
+
     def test_build_deck_invalid_config(self, tmp_path):
         """Test that invalid config raises ConfigValidationError."""
         deck_data = {
@@ -281,6 +303,174 @@ class TestPushApkg:
         mock_connector.import_package.assert_called_once()
         mock_connector.sync.assert_called_once()
 
+    def test_push_apkg_stores_all_media(self, tmp_path):
+        """Test that every media entry is uploaded via batched multi calls."""
+        import json
+        import zipfile
+
+        apkg_file = tmp_path / "test.apkg"
+        media_map = {str(i): f"file{i}.png" for i in range(6)}
+        with zipfile.ZipFile(apkg_file, "w") as zf:
+            zf.writestr("media", json.dumps(media_map))
+            for idx in media_map:
+                zf.writestr(idx, f"data{idx}")
+
+        mock_connector = Mock()
+        mock_connector.invoke_multi.side_effect = lambda actions: [
+            (None, None) for _ in actions
+        ]
+
+        push_apkg(apkg_file, mock_connector)
+
+        stored = {
+            action["params"]["filename"]
+            for c in mock_connector.invoke_multi.call_args_list
+            for action in c.args[0]
+        }
+        assert stored == set(media_map.values())
+        mock_connector.import_package.assert_called_once()
+
+    def test_push_apkg_caps_media_batches_by_size(self, tmp_path, monkeypatch):
+        """Test that batches stay under the byte cap and big files go alone."""
+        import json
+        import zipfile
+
+        from anki_yaml_tool.core import deck_service
+
+        monkeypatch.setattr(deck_service, "MEDIA_UPLOAD_BATCH_BYTES", 10)
+        monkeypatch.setattr(deck_service, "MEDIA_UPLOAD_WORKERS", 1)
+
+        apkg_file = tmp_path / "test.apkg"
+        sizes = {"0": 4, "1": 4, "2": 4, "3": 50, "4": 1}
+        with zipfile.ZipFile(apkg_file, "w") as zf:
+            zf.writestr("media", json.dumps({i: f"f{i}" for i in sizes}))
+            for idx, size in sizes.items():
+                zf.writestr(idx, b"x" * size)
+
+        mock_connector = Mock()
+        mock_connector.invoke_multi.side_effect = lambda actions: [
+            (None, None) for _ in actions
+        ]
+
+        push_apkg(apkg_file, mock_connector)
+
+        batches = [
+            [action["params"]["filename"] for action in c.args[0]]
+            for c in mock_connector.invoke_multi.call_args_list
+        ]
+        assert batches == [["f0", "f1"], ["f2"], ["f3"], ["f4"]]
+
+    def test_push_apkg_skips_corrupt_media(self, tmp_path):
+        """Test that a member failing its CRC check does not stop the push."""
+        import json
+        import zipfile
+
+        apkg_file = tmp_path / "test.apkg"
+        with zipfile.ZipFile(apkg_file, "w", zipfile.ZIP_STORED) as zf:
+            zf.writestr("media", json.dumps({"0": "bad.png", "1": "good.png"}))
+            zf.writestr("0", b"corrupt-me")
+            zf.writestr("1", b"fine")
+        raw = apkg_file.read_bytes()
+        apkg_file.write_bytes(raw.replace(b"corrupt-me", b"CORRUPT-ME", 1))
+
+        mock_connector = Mock()
+        mock_connector.invoke_multi.side_effect = lambda actions: [
+            (None, None) for _ in actions
+        ]
+
+        push_apkg(apkg_file, mock_connector)
+
+        (actions,) = mock_connector.invoke_multi.call_args.args
+        assert [a["params"]["filename"] for a in actions] == ["good.png"]
+        mock_connector.import_package.assert_called_once()
+
+    def test_push_apkg_reraises_worker_errors(self, tmp_path):
+        """Test that an unexpected error in an upload worker is not lost."""
+        import json
+        import zipfile
+
+        apkg_file = tmp_path / "test.apkg"
+        with zipfile.ZipFile(apkg_file, "w") as zf:
+            zf.writestr("media", json.dumps({"0": "image.png"}))
+            zf.writestr("0", "image-data")
+
+        mock_connector = Mock()
+        # One action sent, no results back: the strict zip raises
+        mock_connector.invoke_multi.return_value = []
+
+        with pytest.raises(ValueError):
+            push_apkg(apkg_file, mock_connector)
+        mock_connector.import_package.assert_not_called()
+
+    def test_push_apkg_uses_package_data(self, tmp_path):
+        """Test that in-memory package data is used for media extraction."""
+        import io
+        import json
+        import zipfile
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zf:
+            zf.writestr("media", json.dumps({"0": "image.png"}))
+            zf.writestr("0", "image-data")
+
+        # The file on disk has no media; only the in-memory copy does
+        apkg_file = tmp_path / "test.apkg"
+        with zipfile.ZipFile(apkg_file, "w") as zf:
+            zf.writestr("dummy", "data")
+
+        mock_connector = Mock()
+        mock_connector.invoke_multi.side_effect = lambda actions: [
+            (None, None) for _ in actions
+        ]
+
+        push_apkg(apkg_file, mock_connector, package_data=buffer.getvalue())
+
+        mock_connector.invoke_multi.assert_called_once()
+        (actions,) = mock_connector.invoke_multi.call_args.args
+        assert [a["params"]["filename"] for a in actions] == ["image.png"]
+        mock_connector.import_package.assert_called_once()
+
+    def test_push_apkg_skips_existing_media(self, tmp_path):
+        """Test that media already present in Anki is not uploaded again."""
+        import json
+        import zipfile
+
+        apkg_file = tmp_path / "test.apkg"
+        with zipfile.ZipFile(apkg_file, "w") as zf:
+            zf.writestr("media", json.dumps({"0": "old.png", "1": "new.png"}))
+            zf.writestr("0", "old")
+            zf.writestr("1", "new")
+
+        mock_connector = Mock()
+        mock_connector.invoke_multi.side_effect = lambda actions: [
+            (None, None) for _ in actions
+        ]
+
+        push_apkg(apkg_file, mock_connector, existing_media={"old.png"})
+
+        mock_connector.invoke_multi.assert_called_once()
+        (actions,) = mock_connector.invoke_multi.call_args.args
+        assert [a["params"]["filename"] for a in actions] == ["new.png"]
+        mock_connector.import_package.assert_called_once()
+
+
+class TestGetFieldValues:
+    """Tests for the get_field_values helper."""
+
+    def test_exact_and_lowercase_keys(self):
+        """Test lookup by exact field name and by lowercased name."""
+        item = {"Front": "Q", "back": "A"}
+        assert get_field_values(item, ["Front", "Back"]) == ["Q", "A"]
+
+    def test_mixed_case_keys_and_missing(self):
+        """Test fallback to case-insensitive lookup and empty missing fields."""
+        item = {"FRONT": "Q", "extra": 1}
+        assert get_field_values(item, ["Front", "Back"]) == ["Q", ""]
+
+    def test_non_string_values(self):
+        """Test that values are converted to strings."""
+        assert get_field_values({"front": 42}, ["Front"], ["front"]) == ["42"]
+
 
 class TestValidationResult:
     """Tests for the ValidationResult dataclass."""
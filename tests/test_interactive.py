@@ -13,7 +13,7 @@ def test_run_interactive_list_decks(monkeypatch):
     input_iter = iter(inputs)
 
     class FakeConnector:
-        def get_deck_names(self):
+        def get_deck_names(self, refresh=False):
             return ["Deck A", "Deck B"]
 
     # Patch AnkiConnector used inside run_interactive
@@ -30,7 +30,7 @@ def test_cli_invoked_without_args_runs_interactive(monkeypatch):
     input_data = "1\nx\n"
 
     class FakeConnector:
-        def get_deck_names(self):
+        def get_deck_names(self, refresh=False):
             return ["Deck A", "Deck B"]
 
     with patch(
@@ -5,7 +5,6 @@ from unittest.mock import Mock
 
 import pytest
 
-from anki_yaml_tool.core.exceptions import AnkiConnectError
 from anki_yaml_tool.core.pusher import (
     _compute_note_hash,
     _map_fields_for_model,
@@ -85,8 +84,11 @@ def _make_deck_dir(tmp_path: Path) -> Path:
 def connector() -> Mock:
     """Create a mock AnkiConnector."""
     mock = Mock()
-    mock.add_note.return_value = 1001
+    mock.add_notes.side_effect = lambda specs: [1001 + i for i in range(len(specs))]
+    mock.update_notes_fields.side_effect = lambda updates: [None] * len(updates)
+    mock.invoke_multi.side_effect = lambda actions: [(None, None)] * len(actions)
     mock.get_notes.return_value = []
+    mock.get_model_names.return_value = ["Basic"]
     return mock
 
 
@@ -103,7 +105,7 @@ class TestPushDeckFromDir:
 
         assert stats["added"] == 1
         assert stats["updated"] == 0
-        connector.add_note.assert_called_once()
+        connector.add_notes.assert_called_once()
 
     def test_update_existing_note(self, tmp_path: Path, connector: Mock) -> None:
         deck_dir = tmp_path / "deck"
@@ -117,7 +119,9 @@ class TestPushDeckFromDir:
         stats = push_deck_from_dir(connector, deck_dir)
 
         assert stats["updated"] == 1
-        connector.update_note_fields.assert_called_once()
+        connector.update_notes_fields.assert_called_once_with(
+            [(999, {"Front": "Q1", "Back": "A1"})]
+        )
 
     def test_sync_triggers_connector_sync(
         self, tmp_path: Path, connector: Mock
@@ -131,8 +135,8 @@ class TestPushDeckFromDir:
         deck_dir = _make_deck_dir(tmp_path)
         push_deck_from_dir(connector, deck_dir, deck_name="Custom")
 
-        call_args = connector.add_note.call_args
-        assert call_args[0][0] == "Custom"
+        specs = connector.add_notes.call_args[0][0]
+        assert specs[0]["deckName"] == "Custom"
 
     def test_media_upload(self, tmp_path: Path, connector: Mock) -> None:
         deck_dir = tmp_path / "deck"
@@ -215,15 +219,35 @@ class TestPushDeckFromDir:
         (deck_dir / "data.yaml").write_text("- front: Q1\n  back: A1\n  note_id: 999\n")
 
         # Simulate "note not found" error on update
-        connector.update_note_fields.side_effect = AnkiConnectError(
-            "note not found", action="updateNoteFields"
-        )
-        connector.add_note.return_value = 1001
+        connector.update_notes_fields.side_effect = None
+        connector.update_notes_fields.return_value = ["note not found"]
 
         stats = push_deck_from_dir(connector, deck_dir)
         # Should fall back to adding
         assert stats["added"] == 1
-        connector.add_note.assert_called_once()
+        assert stats["updated"] == 0
+        connector.add_notes.assert_called_once()
+
+    def test_notes_sent_in_batches(self, tmp_path: Path, connector: Mock) -> None:
+        deck_dir = _make_deck_dir(tmp_path)
+        rows = "".join(f"- front: Q{i}\n  back: A{i}\n" for i in range(250))
+        (deck_dir / "data.yaml").write_text(rows)
+
+        stats = push_deck_from_dir(connector, deck_dir)
+
+        assert stats["added"] == 250
+        sizes = [len(c[0][0]) for c in connector.add_notes.call_args_list]
+        assert sizes == [100, 100, 50]
+
+    def test_failed_add_counted(self, tmp_path: Path, connector: Mock) -> None:
+        deck_dir = _make_deck_dir(tmp_path)
+        connector.add_notes.side_effect = None
+        connector.add_notes.return_value = [None]
+
+        stats = push_deck_from_dir(connector, deck_dir)
+
+        assert stats["added"] == 0
+        assert stats["failed"] == 1
 
     def test_deleted_yaml_items(self, tmp_path: Path, connector: Mock) -> None:
         """Notes with _deleted: true should trigger deletion."""
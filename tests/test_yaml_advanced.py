@@ -1,6 +1,8 @@
 """Tests for advanced YAML features."""
 
 import os
+import subprocess
+import sys
 
 import pytest
 
@@ -65,6 +67,40 @@ class TestYAMLInclude:
         result = yaml_advanced.load_yaml_advanced(main_file)
         assert result["result"]["nested"]["deep"]["value"] == "deepest"
 
+    def test_include_concurrent_loads(self, tmp_path):
+        """Test that concurrent loads resolve includes from their own file."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        main_files = []
+        for i in range(8):
+            deck_dir = tmp_path / f"deck{i}"
+            deck_dir.mkdir()
+            (deck_dir / "part.yaml").write_text(f"value: {i}")
+            main_file = deck_dir / "main.yaml"
+            main_file.write_text("part: !include part.yaml")
+            main_files.append(main_file)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(yaml_advanced.load_yaml_advanced, main_files))
+
+        assert [r["part"]["value"] for r in results] == list(range(8))
+
+
+class TestLoadYAMLStream:
+    """Tests for load_yaml_stream."""
+
+    @pytest.mark.parametrize("whole_read_max", [16 * 1024 * 1024, 0])
+    def test_read_whole_or_streamed(self, tmp_path, monkeypatch, whole_read_max):
+        """Test that small files and streamed large files parse the same."""
+        monkeypatch.setattr(yaml_advanced, "_WHOLE_READ_MAX", whole_read_max)
+        yaml_file = tmp_path / "data.yaml"
+        yaml_file.write_bytes("- front: Café\n  back: 2\n".encode())
+
+        with open(yaml_file, "rb") as f:
+            result = yaml_advanced.load_yaml_stream(f)
+
+        assert result == [{"front": "Café", "back": 2}]
+
 
 class TestEnvironmentVariables:
     """Tests for environment variable substitution."""
@@ -113,6 +149,17 @@ class TestEnvironmentVariables:
 class TestJinjaTemplates:
     """Tests for Jinja2 template processing."""
 
+    def test_jinja2_imported_on_first_render(self):
+        """Test that importing the module does not import Jinja2."""
+        code = (
+            "import sys\n"
+            "from anki_yaml_tool.core import yaml_advanced\n"
+            "assert 'jinja2' not in sys.modules\n"
+            "assert yaml_advanced.process_jinja_templates('{{ x }}', {'x': 1}) == '1'\n"
+            "assert 'jinja2' in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
     def test_simple_template(self, tmp_path):
         """Test simple template rendering."""
         main_file = tmp_path / "main.yaml"